@@ -19,9 +19,15 @@ class AppManager(QObject):
         super().__init__()
         self.settings_file = "data/app_settings.json"
         self.settings = self._load_settings()
+        # Typed copies of settings read on hot paths (kept in sync by set_setting)
+        self.auto_logout_enabled = bool(self.settings.get("auto_logout_enabled", True))
         self.current_user = None
         self.main_window = None
         self.backup_manager = None
+        # (query key, monotonic time, rows, orders_generation) warmed in the background for the orders window
+        self.prefetched_orders = None
+        # Bumped whenever orders are written, so prefetches started before the write are discarded
+        self.orders_generation = 0
         
     def _load_settings(self) -> Dict[str, Any]:
         """Load application settings"""
@@ -64,6 +70,8 @@ class AppManager(QObject):
         """Set setting value"""
         print(f"DEBUG: Setting {key} = {value}")
         self.settings[key] = value
+        if key == "auto_logout_enabled":
+            self.auto_logout_enabled = bool(value)
         print(f"DEBUG: Current settings after update: {self.settings}")
         self.save_settings()
         print(f"DEBUG: Settings saved to file")
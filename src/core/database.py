@@ -11,8 +11,43 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 import json
+import re
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 
+# Short-lived SELECT result cache; the TTL keeps other workstations' writes visible
+QUERY_CACHE_SIZE = 64
+QUERY_CACHE_TTL = 2.0
+
+# UPDATE/INSERT ... RETURNING needs SQLite 3.35+
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# PRAGMA user_version of the database file; 2 = pdf_encrypted columns may hold PDF_BLOB_PREFIX BLOBs
+DB_SCHEMA_VERSION = 2
+# Marks a pdf_encrypted value written by encrypt_pdf (prefix + raw Fernet token, stored as a BLOB).
+# Values without it are the older encrypt_data(base64) text format.
+PDF_BLOB_PREFIX = b"KBPDF2:"
+# Every raw Fernet token starts with these bytes (version 0x80, base64url)
+_FERNET_TOKEN_START = b"gAAAAA"
+
+# Table list after FROM/JOIN, including comma joins ("FROM a x, b y"); aliases are skipped when splitting
+_READ_TABLES_RE = re.compile(
+    r'\b(?:FROM|JOIN)\s+(\w+(?:\s+(?:AS\s+)?\w+)?(?:\s*,\s*\w+(?:\s+(?:AS\s+)?\w+)?)*)', re.IGNORECASE
+)
+_WRITE_TABLE_RE = re.compile(
+    r'^\s*(?:UPDATE|INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|DELETE\s+FROM)\s+(\w+)', re.IGNORECASE
+)
+
+def _tables_read(query: str) -> frozenset:
+    """Lowercase names of the tables a SELECT reads"""
+    return frozenset(
+        part.split()[0].lower()
+        for table_list in _READ_TABLES_RE.findall(query)
+        for part in table_list.split(',')
+    )
+
 class DatabaseManager:
     """Manages encrypted SQLite database operations"""
     
@@ -21,6 +56,14 @@ class DatabaseManager:
         self.db_path = db_path
         self.encryption_key = None
         self.connection = None
+        self._catalog_cache: Dict[Any, List[str]] = {}
+        # (query, params) -> (monotonic time, tables read, rows)
+        self._query_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # Bumped per table on writes (and _cache_epoch on full clears) so a fetch that
+        # raced a write is not stored
+        self._table_generations: Dict[str, int] = {}
+        self._cache_epoch = 0
+        self._query_cache_lock = threading.Lock()
         self._ensure_data_directory()
         self._create_database()
         self.migrate_database()
@@ -414,6 +457,29 @@ class DatabaseManager:
         decrypted_data = fernet.decrypt(decoded_data)
         return decrypted_data.decode()
     
+    def encrypt_pdf(self, pdf_bytes: bytes) -> bytes:
+        """Encrypt raw PDF bytes for storage as a BLOB (PDF_BLOB_PREFIX + Fernet token, no base64 layers)"""
+        if not self.encryption_key:
+            raise ValueError("Encryption key not initialized")
+        
+        # bytes bind as a BLOB in sqlite3
+        return PDF_BLOB_PREFIX + Fernet(self.encryption_key).encrypt(pdf_bytes)
+    
+    def decrypt_pdf(self, stored) -> bytes:
+        """Decrypt a stored PDF in either format; the format is read from the value, not its SQLite type"""
+        if not self.encryption_key:
+            raise ValueError("Encryption key not initialized")
+        
+        fernet = Fernet(self.encryption_key)
+        data = bytes(stored) if isinstance(stored, (bytes, bytearray, memoryview)) else stored.encode('ascii')
+        if data.startswith(PDF_BLOB_PREFIX):
+            return fernet.decrypt(data[len(PDF_BLOB_PREFIX):])
+        if data.startswith(_FERNET_TOKEN_START):
+            # Unprefixed token BLOB from builds before the prefix was added
+            return fernet.decrypt(data)
+        # Older rows: keep everything as bytes instead of decoding to str and encoding back
+        return base64.b64decode(fernet.decrypt(base64.urlsafe_b64decode(data)))
+    
     def get_connection(self) -> sqlite3.Connection:
         """Get database connection with improved multi-user support"""
         try:
@@ -440,14 +506,67 @@ class DatabaseManager:
             raise e
     
     def execute_query(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
-        """Execute SELECT query with proper connection handling"""
+        """Execute SELECT query with proper connection handling (results cached briefly)"""
+        key = None
+        if query.lstrip()[:6].upper() == 'SELECT':
+            try:
+                key = (query, tuple(params))
+                hash(key)
+            except TypeError:
+                key = None
+        if key is not None:
+            tables = _tables_read(query)
+            with self._query_cache_lock:
+                cached = self._query_cache.get(key)
+                if cached and time.monotonic() - cached[0] < QUERY_CACHE_TTL:
+                    self._query_cache.move_to_end(key)
+                    return list(cached[2])
+                generation = self._read_generation(tables)
+        
         conn = None
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
             cursor.execute(query, params)
             result = cursor.fetchall()
-            return result
+        finally:
+            if conn:
+                conn.close()
+        
+        if key is not None:
+            with self._query_cache_lock:
+                # A write committed while we were reading may not be in result; don't keep it
+                if self._read_generation(tables) == generation:
+                    self._query_cache[key] = (time.monotonic(), tables, result)
+                    self._query_cache.move_to_end(key)
+                    while len(self._query_cache) > QUERY_CACHE_SIZE:
+                        self._query_cache.popitem(last=False)
+        return list(result)
+    
+    def _read_generation(self, tables: frozenset) -> tuple:
+        """Write generation of the given tables (call with _query_cache_lock held)"""
+        return (self._cache_epoch, tuple(sorted((t, self._table_generations.get(t, 0)) for t in tables)))
+    
+    def _invalidate_query_cache(self, query: str):
+        """Drop cached SELECT results that read the table written by query"""
+        match = _WRITE_TABLE_RE.match(query)
+        with self._query_cache_lock:
+            if not match:
+                # Unknown target (DDL, PRAGMA, ...): forget everything
+                self._cache_epoch += 1
+                self._query_cache.clear()
+                return
+            table = match.group(1).lower()
+            self._table_generations[table] = self._table_generations.get(table, 0) + 1
+            for key in [k for k, entry in self._query_cache.items() if table in entry[1]]:
+                del self._query_cache[key]
+    
+    def fetch_one(self, query: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+        """Execute SELECT query and return only the first row (or None)"""
+        conn = None
+        try:
+            conn = self.get_connection()
+            return conn.execute(query, params).fetchone()
         finally:
             if conn:
                 conn.close()
@@ -463,6 +582,9 @@ class DatabaseManager:
                 cursor = conn.cursor()
                 cursor.execute(query, params)
                 conn.commit()
+                # Statements that changed nothing (rowcount 0) leave cached SELECTs valid
+                if cursor.rowcount != 0:
+                    self._invalidate_query_cache(query)
                 
                 # Return lastrowid for INSERT operations, rowcount for others
                 result = cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
@@ -474,7 +596,6 @@ class DatabaseManager:
                     conn = None
                     
                 if ("database is locked" in str(e) or "database is busy" in str(e)) and attempt < max_retries - 1:
-                    import time
                     # Exponential backoff with jitter for multi-user scenarios
                     wait_time = (0.1 * (2 ** attempt)) + (0.05 * attempt)
                     time.sleep(wait_time)
@@ -488,7 +609,110 @@ class DatabaseManager:
             finally:
                 if conn:
                     conn.close()
-    
+
+    def execute_updates(self, statements: List[tuple]) -> List[int]:
+        """Execute several (query, params) updates in one transaction with a single commit"""
+        max_retries = 5
+        conn = None
+
+        for attempt in range(max_retries):
+            try:
+                conn = self.get_connection()
+                cursor = conn.cursor()
+                results = []
+                changed = []
+                for query, params in statements:
+                    cursor.execute(query, params)
+                    results.append(cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount)
+                    if cursor.rowcount != 0:
+                        changed.append(query)
+                conn.commit()
+                for query in changed:
+                    self._invalidate_query_cache(query)
+                return results
+
+            except sqlite3.OperationalError as e:
+                if conn:
+                    conn.rollback()
+                    conn.close()
+                    conn = None
+
+                if ("database is locked" in str(e) or "database is busy" in str(e)) and attempt < max_retries - 1:
+                    wait_time = (0.1 * (2 ** attempt)) + (0.05 * attempt)
+                    time.sleep(wait_time)
+                    continue
+                else:
+                    raise e
+            except Exception as e:
+                if conn:
+                    conn.rollback()
+                    conn.close()
+                    conn = None
+                raise e
+            finally:
+                if conn:
+                    conn.close()
+
+    def execute_returning(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Execute an INSERT/UPDATE/DELETE ... RETURNING statement and return the returned rows"""
+        max_retries = 5
+        conn = None
+
+        for attempt in range(max_retries):
+            try:
+                conn = self.get_connection()
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                conn.commit()
+                if rows or cursor.rowcount != 0:
+                    self._invalidate_query_cache(query)
+                return rows
+
+            except sqlite3.OperationalError as e:
+                if conn:
+                    conn.rollback()
+                    conn.close()
+                    conn = None
+
+                if ("database is locked" in str(e) or "database is busy" in str(e)) and attempt < max_retries - 1:
+                    wait_time = (0.1 * (2 ** attempt)) + (0.05 * attempt)
+                    time.sleep(wait_time)
+                    continue
+                else:
+                    raise e
+            except Exception as e:
+                if conn:
+                    conn.rollback()
+                    conn.close()
+                    conn = None
+                raise e
+            finally:
+                if conn:
+                    conn.close()
+
+    def get_fabrikats(self) -> List[str]:
+        """Get distinct fabrikat names from key_catalog (cached)"""
+        key = ('fabrikat',)
+        if key not in self._catalog_cache:
+            rows = self.execute_query("SELECT DISTINCT fabrikat FROM key_catalog ORDER BY fabrikat")
+            self._catalog_cache[key] = [str(r[0]) for r in rows if r[0]]
+        return self._catalog_cache[key]
+
+    def get_koncepts_by_fabrikat(self, fabrikat: str) -> List[str]:
+        """Get koncept names for a fabrikat from key_catalog (cached)"""
+        key = ('koncept', fabrikat)
+        if key not in self._catalog_cache:
+            rows = self.execute_query(
+                "SELECT DISTINCT koncept FROM key_catalog WHERE fabrikat = ? ORDER BY koncept", (fabrikat,)
+            )
+            self._catalog_cache[key] = [str(r[0]) for r in rows if r[0]]
+        return self._catalog_cache[key]
+
+    def clear_catalog_cache(self):
+        """Drop cached key_catalog lookups after the catalog has changed"""
+        self._catalog_cache.clear()
+
     def migrate_database(self):
         """Apply database migrations for schema updates"""
         conn = None
@@ -617,6 +841,24 @@ class DatabaseManager:
             ''')
             conn.commit()
 
+            # Indexes for the systems list (ORDER BY ks.created_at, JOIN on customer_id)
+            # and the invoice history (WHERE system_id ORDER BY created_at),
+            # plus the orders list's date range (WHERE/ORDER BY order_date)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_ks_created_at ON key_systems(created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_ks_customer_id ON key_systems(customer_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_invoices_sys_created ON invoices(system_id, created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_order_date ON orders(order_date)")
+            conn.commit()
+
+            # Record that this database may contain BLOB PDFs (see PDF_BLOB_PREFIX)
+            user_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+            if user_version > DB_SCHEMA_VERSION:
+                print(f"Warning: database schema version {user_version} is newer than "
+                      f"this client's {DB_SCHEMA_VERSION}")
+            elif user_version < DB_SCHEMA_VERSION:
+                cursor.execute(f"PRAGMA user_version = {DB_SCHEMA_VERSION}")
+                conn.commit()
+
             # Ensure key_catalog reference table exists (fabrikat <-> koncept)
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS key_catalog (
@@ -648,6 +890,7 @@ class DatabaseManager:
                 ]
                 cursor.executemany("INSERT INTO key_catalog (fabrikat, koncept) VALUES (?, ?)", katalog)
                 conn.commit()
+                self.clear_catalog_cache()
             except Exception as _e:
                 # If the table is locked or any issue occurs, skip seeding silently
                 pass
@@ -31,9 +31,10 @@ class LogoManager:
         return os.path.join(project_root, "assets", "company_logo.png")
     
     @staticmethod
-    def create_logo_element():
-        """Create standardized logo element for ALL PDF exports"""
-        logo_path = LogoManager.get_logo_path()
+    def create_logo_element(logo_path=None):
+        """Create standardized logo element for ALL PDF exports (logo_path None = look it up)"""
+        if logo_path is None:
+            logo_path = LogoManager.get_logo_path()
         
         if not logo_path or not os.path.exists(logo_path):
             print(f"DEBUG: Logo path not found: {logo_path}")
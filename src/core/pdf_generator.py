@@ -160,8 +160,8 @@ class OrderPDFGenerator:
         company_para = Paragraph(f"<b>{user_company}</b>", self.styles['Normal'])
         company_para.fontSize = 16
         
-        # Add company logo using GLOBAL standard
-        logo_element = LogoManager.create_logo_element()
+        # Add company logo using GLOBAL standard (caller's path, looked up only if not given)
+        logo_element = LogoManager.create_logo_element(logo_path)
         
         # Create header with system user's company centered at top
         company_header = Table([[company_para]], colWidths=[180*mm])
@@ -398,7 +398,7 @@ class OrderPDFGenerator:
         header_data = []
         title_para = Paragraph("Tillverkningsordrar", self.styles['LeftTitle'])
         
-        logo = LogoManager.create_logo_element()
+        logo = LogoManager.create_logo_element(logo_path)
         if logo:
             header_data = [[title_para, logo]]
             header_table = Table(header_data, colWidths=[140*mm, LogoManager.LOGO_WIDTH])
@@ -538,7 +538,7 @@ class OrderPDFGenerator:
         user_company = (current_user or {}).get('company_name', 'KeyBuddy')
         
         # Create logo element using GLOBAL standard
-        logo_element = LogoManager.create_logo_element()
+        logo_element = LogoManager.create_logo_element(logo_path)
         
         # Create header with company name and logo (or fallback text)
         if logo_element:
@@ -627,7 +627,8 @@ class OrderPDFGenerator:
         c.drawString(left, top, user_company)
 
         # Header: logo using GLOBAL standard - top-right corner
-        logo_path = LogoManager.get_logo_path()
+        if logo_path is None:
+            logo_path = LogoManager.get_logo_path()
         if logo_path and os.path.exists(logo_path):
             try:
                 # Use GLOBAL standard size with natural proportions
@@ -5,12 +5,22 @@ Handles translations for Swedish, English, Norwegian, Danish, Finnish, Arabic, M
 
 from typing import Dict, Any
 
+
+class TextTable(dict):
+    """Resolved texts for one language; unknown keys resolve to the key itself"""
+    
+    def __missing__(self, key: str) -> str:
+        return key
+
+
 class TranslationManager:
     """Manages application translations"""
     
     def __init__(self):
         self.current_language = "sv"
         self.translations = self._load_translations()
+        # Texts for the current language, rebuilt on set_language: translation_manager.t["key"]
+        self.t = TextTable(self.translations[self.current_language])
     
     def _load_translations(self) -> Dict[str, Dict[str, str]]:
         """Load all translations"""
@@ -524,10 +534,11 @@ class TranslationManager:
         """Set current language"""
         if language_code in self.translations:
             self.current_language = language_code
+            self.t = TextTable(self.translations[language_code])
     
     def get_text(self, key: str) -> str:
         """Get translated text for current language"""
-        return self.translations.get(self.current_language, {}).get(key, key)
+        return self.t[key]
     
     def get_current_language(self) -> str:
         """Get current language code"""
@@ -14,6 +14,7 @@ class AddSystemWindow(QWidget):
     """Window for adding new customer systems"""
     
     navigate_home = Signal()
+    system_added = Signal()
     
     def __init__(self, app_manager, db_manager, translation_manager):
         super().__init__()
@@ -403,11 +404,7 @@ class AddSystemWindow(QWidget):
         try:
             self.fabrikat_combo.clear()
             self.fabrikat_combo.addItem("Välj fabrikat...")
-            rows = self.db_manager.execute_query("SELECT DISTINCT fabrikat FROM key_catalog ORDER BY fabrikat")
-            for r in rows:
-                val = r[0] if isinstance(r, (list, tuple)) else r['fabrikat']
-                if val:
-                    self.fabrikat_combo.addItem(str(val))
+            self.fabrikat_combo.addItems(self.db_manager.get_fabrikats())
         except Exception:
             # Fallback: keep only the placeholder
             pass
@@ -420,13 +417,7 @@ class AddSystemWindow(QWidget):
             self.koncept_combo.setEnabled(False)
             if not fabrikat or fabrikat == "Välj fabrikat...":
                 return
-            rows = self.db_manager.execute_query(
-                "SELECT koncept FROM key_catalog WHERE fabrikat = ? ORDER BY koncept", (fabrikat,)
-            )
-            for r in rows:
-                val = r[0] if isinstance(r, (list, tuple)) else r['koncept']
-                if val:
-                    self.koncept_combo.addItem(str(val))
+            self.koncept_combo.addItems(self.db_manager.get_koncepts_by_fabrikat(fabrikat))
             # Enable only if there are real items beyond placeholder
             self.koncept_combo.setEnabled(self.koncept_combo.count() > 1)
         except Exception:
@@ -662,6 +653,7 @@ class AddSystemWindow(QWidget):
                     self.flex3_edit.text().strip() if hasattr(self, 'flex3_edit') else "",
                 )
             )
+            self.system_added.emit()
             
             QMessageBox.information(
                 self,
@@ -196,8 +196,8 @@ class CopyableMessageBox(QDialog):
         return msg.exec()
     
     @staticmethod
-    def question(parent, title, text, buttons=None):
-        """Show question dialog"""
+    def _create_question(parent, title, text, buttons=None):
+        """Build a question dialog with Ja/Nej/Avbryt buttons"""
         msg = CopyableMessageBox(parent, title, text, "", CopyableMessageBox.Question)
         
         # Remove default OK button
@@ -213,4 +213,21 @@ class CopyableMessageBox(QDialog):
         if buttons & CopyableMessageBox.Cancel:
             msg.add_button("Avbryt", CopyableMessageBox.Cancel)
         
+        return msg
+    
+    @staticmethod
+    def question(parent, title, text, buttons=None):
+        """Show question dialog"""
+        msg = CopyableMessageBox._create_question(parent, title, text, buttons)
         return msg.exec()
+    
+    @staticmethod
+    def open_question(parent, title, text, callback, buttons=None):
+        """Show question dialog without a nested event loop.
+        callback receives the chosen button (Yes/No/Cancel), or 0 if the dialog was closed.
+        """
+        msg = CopyableMessageBox._create_question(parent, title, text, buttons)
+        msg.setAttribute(Qt.WA_DeleteOnClose, True)
+        msg.finished.connect(callback)
+        msg.open()
+        return msg
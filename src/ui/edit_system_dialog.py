@@ -451,28 +451,18 @@ class ModernEditSystemDialog(QDialog):
     def populate_fabrikat_combo(self):
         """Populate fabrikat combo with data from key_catalog"""
         try:
-            # Query database directly since get_fabrikats doesn't exist
-            rows = self.db_manager.execute_query("SELECT DISTINCT fabrikat FROM key_catalog ORDER BY fabrikat")
             self.fabrikat_combo.clear()
             self.fabrikat_combo.addItem("Välj fabrikat...")
-            for row in rows:
-                fabrikat = row[0] if isinstance(row, (list, tuple)) else row['fabrikat']
-                if fabrikat:
-                    self.fabrikat_combo.addItem(fabrikat)
+            self.fabrikat_combo.addItems(self.db_manager.get_fabrikats())
         except Exception as e:
             print(f"Error loading fabrikats: {e}")
     
     def populate_fabrikat2_combo(self):
         """Populate fabrikat2 combo with data from key_catalog"""
         try:
-            # Query database directly since get_fabrikats doesn't exist
-            rows = self.db_manager.execute_query("SELECT DISTINCT fabrikat FROM key_catalog ORDER BY fabrikat")
             self.fabrikat2_combo.clear()
             self.fabrikat2_combo.addItem("Välj fabrikat...")
-            for row in rows:
-                fabrikat = row[0] if isinstance(row, (list, tuple)) else row['fabrikat']
-                if fabrikat:
-                    self.fabrikat2_combo.addItem(fabrikat)
+            self.fabrikat2_combo.addItems(self.db_manager.get_fabrikats())
         except Exception as e:
             print(f"Error loading fabrikats: {e}")
     
@@ -480,17 +470,9 @@ class ModernEditSystemDialog(QDialog):
         """Handle fabrikat selection change"""
         if fabrikat and fabrikat != "Välj fabrikat...":
             try:
-                # Query database directly since get_koncepts_by_fabrikat doesn't exist
-                rows = self.db_manager.execute_query(
-                    "SELECT DISTINCT koncept FROM key_catalog WHERE fabrikat = ? ORDER BY koncept",
-                    (fabrikat,)
-                )
                 self.koncept_combo.clear()
                 self.koncept_combo.addItem("Välj koncept...")
-                for row in rows:
-                    koncept = row[0] if isinstance(row, (list, tuple)) else row['koncept']
-                    if koncept:
-                        self.koncept_combo.addItem(koncept)
+                self.koncept_combo.addItems(self.db_manager.get_koncepts_by_fabrikat(fabrikat))
                 self.koncept_combo.setEnabled(True)
             except Exception as e:
                 print(f"Error loading koncepts: {e}")
@@ -503,17 +485,9 @@ class ModernEditSystemDialog(QDialog):
         """Handle fabrikat2 selection change"""
         if fabrikat and fabrikat != "Välj fabrikat...":
             try:
-                # Query database directly since get_koncepts_by_fabrikat doesn't exist
-                rows = self.db_manager.execute_query(
-                    "SELECT DISTINCT koncept FROM key_catalog WHERE fabrikat = ? ORDER BY koncept",
-                    (fabrikat,)
-                )
                 self.koncept2_combo.clear()
                 self.koncept2_combo.addItem("Välj koncept...")
-                for row in rows:
-                    koncept = row[0] if isinstance(row, (list, tuple)) else row['koncept']
-                    if koncept:
-                        self.koncept2_combo.addItem(koncept)
+                self.koncept2_combo.addItems(self.db_manager.get_koncepts_by_fabrikat(fabrikat))
                 self.koncept2_combo.setEnabled(True)
             except Exception as e:
                 print(f"Error loading koncepts: {e}")
@@ -724,9 +698,11 @@ class ModernEditSystemDialog(QDialog):
                 system_id
             )
             
-            # Execute both updates
-            customer_rows = self.db_manager.execute_update(customer_update_query, customer_params)
-            system_rows = self.db_manager.execute_update(system_update_query, system_params)
+            # Execute both updates in one transaction
+            customer_rows, system_rows = self.db_manager.execute_updates([
+                (customer_update_query, customer_params),
+                (system_update_query, system_params),
+            ])
             
             rows_affected = customer_rows + system_rows
             
@@ -5,31 +5,67 @@ Main application window with modern UI and navigation
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                               QStackedWidget, QStatusBar, QLabel,
                               QApplication, QSystemTrayIcon, QMenu, QStyle, QPushButton)
-from PySide6.QtCore import Qt, QTimer, Signal, QEvent, QObject
-from PySide6.QtGui import QPixmap, QIcon, QAction, QPainter, QPainterPath, QColor, QRegion
+from PySide6.QtCore import Qt, QTimer, Signal, QEvent, QObject, QFileSystemWatcher
+from PySide6.QtGui import (QPixmap, QPixmapCache, QIcon, QAction, QPainter, QPainterPath, QColor,
+                           QRegion, QFont, QCursor)
+import functools
 import os
+import time
 from datetime import datetime
 
 from .styles import ThemeManager, AnimatedButton
 from .login_window import LoginWindow
 from .home_window import HomeWindow
 from .settings_window import SettingsWindow
-from .add_system_window import AddSystemWindow
-from .my_systems_window import MySystemsWindow
-from .orders_window import OrdersWindow
-from .permissions_window import PermissionsWindow
-from .users_window import UsersWindow
 from ..core.translations import TranslationManager
 from .copyable_message_box import CopyableMessageBox
 
+
+def _authed_page(page_attr, refresh=False):
+    """Turn a show_* method into 'switch to page_attr if logged in, else show login'.
+    With refresh=True the page's refresh_data() is called after switching if its data is stale.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self):
+            if not self.app_manager.current_user:
+                return self.show_login()
+            page = getattr(self, page_attr)
+            self.stacked_widget.setCurrentWidget(page)
+            if refresh:
+                self._refresh_page_if_stale(page_attr, page)
+        return wrapper
+    return decorator
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Window control glyphs (Unicode "Miscellaneous Symbols and Pictographs")
+    MINIMIZE_GLYPH = "\U0001F5D5"
+    MAXIMIZE_GLYPH = "\U0001F5D6"
+    RESTORE_GLYPH = "\U0001F5D7"
+    CLOSE_GLYPH = "\U0001F5D9"
+    
+    # Auto-logout after 5 minutes of inactivity; activity resets are coalesced
+    AUTO_LOGOUT_TIMEOUT_MS = 5 * 60 * 1000
+    AUTO_LOGOUT_RESET_INTERVAL = 5.0  # seconds
+    
+    # Pages are reloaded on show only when marked dirty or when older than this
+    # (other users may change the shared database)
+    PAGE_STALE_AFTER = 30.0  # seconds
+    
+    # Backup status updates (timestamp_iso, source, path); may be emitted from worker threads
+    backup_status_changed = Signal(str, str, str)
+    
     def __init__(self, app_manager, db_manager, version_manager):
         super().__init__()
         self.app_manager = app_manager
         self.db_manager = db_manager
         
+        # Close the database once, whichever path ends the application
+        QApplication.instance().aboutToQuit.connect(self.db_manager.close)
+        
         # Set reference to this main window in app_manager for backup status updates
         self.app_manager.main_window = self
         
@@ -41,6 +77,8 @@ class MainWindow(QMainWindow):
         self.logger = UserLogger(db_manager)
         self.version_manager = version_manager
         self.theme_manager = ThemeManager()
+        self._current_theme_name = None
+        self._close_confirmed = False
         self.translation_manager = TranslationManager()
         
         # Set initial language from settings
@@ -51,12 +89,33 @@ class MainWindow(QMainWindow):
         self.auto_logout_timer = QTimer()
         self.auto_logout_timer.setSingleShot(True)
         self.auto_logout_timer.timeout.connect(self.auto_logout)
-        self.last_activity_time = None
         
-        # Backup monitoring timer (60 seconds)
+        # Activity tracking without an application-wide event filter:
+        # poll the cursor position and watch only the focused widget for input
+        self.activity_poll_timer = QTimer()
+        self.activity_poll_timer.setTimerType(Qt.CoarseTimer)
+        self.activity_poll_timer.setInterval(1000)
+        self.activity_poll_timer.timeout.connect(self._poll_user_activity)
+        self._last_cursor_pos = None
+        self._watched_focus_widget = None
+        self._activity_tracking = False
+        
+        # Precomputed for the eventFilter fast path
+        self._activity_event_types = frozenset({QEvent.MouseButtonPress, QEvent.KeyPress})
+        self._last_reset_monotonic = 0.0
+        
+        # Backup monitoring: react to changes in the backup folder instead of polling
+        self._backup_dir = self._resolve_backup_dir()
+        self._fs_watcher = QFileSystemWatcher(self)
+        if os.path.isdir(self._backup_dir):
+            self._fs_watcher.addPath(self._backup_dir)
+        self._fs_watcher.directoryChanged.connect(self.check_latest_backup)
+        
+        # Slow heartbeat as a fallback (10 minutes, coarse so the OS can coalesce wakeups)
         self.backup_monitor_timer = QTimer()
+        self.backup_monitor_timer.setTimerType(Qt.VeryCoarseTimer)
         self.backup_monitor_timer.timeout.connect(self.check_latest_backup)
-        self.backup_monitor_timer.start(60000)  # 60 seconds = 60000 ms
+        self.backup_monitor_timer.start(10 * 60 * 1000)
         self.last_backup_check = None
         
         # Perform initial backup check after UI is set up
@@ -65,6 +124,9 @@ class MainWindow(QMainWindow):
         self.setup_ui()
         self.setup_connections()
         
+        # Always deliver backup status updates through the event loop on the UI thread
+        self.backup_status_changed.connect(self._set_backup_status_text, Qt.QueuedConnection)
+        
         # Apply theme AFTER all windows are created
         self.apply_theme()
         
@@ -80,14 +142,23 @@ class MainWindow(QMainWindow):
     def mousePressEvent(self, event):
         """Handle mouse press for window dragging"""
         if event.button() == Qt.LeftButton:
+            # Let the window manager move the window; no Python runs per move sample
+            handle = self.windowHandle()
+            if handle is not None and handle.startSystemMove():
+                event.accept()
+                return
+            # Fallback: offset kept as plain ints so moves don't build QPoints
+            pos = event.globalPosition()
             self.dragging = True
-            self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            self.drag_position = (int(pos.x()) - self.x(), int(pos.y()) - self.y())
             event.accept()
     
     def mouseMoveEvent(self, event):
         """Handle mouse move for window dragging"""
-        if event.buttons() == Qt.LeftButton and self.dragging:
-            self.move(event.globalPosition().toPoint() - self.drag_position)
+        if self.dragging and event.buttons() == Qt.LeftButton:
+            pos = event.globalPosition()
+            dx, dy = self.drag_position
+            self.move(int(pos.x()) - dx, int(pos.y()) - dy)
             event.accept()
     
     def mouseReleaseEvent(self, event):
@@ -117,15 +188,28 @@ class MainWindow(QMainWindow):
             region = QRegion(pixmap.mask())
             self.setMask(region)
             self.rounded_corners_applied = True
-            print(f"DEBUG: Applied smooth rounded corners mask to window: {rect}")
         except Exception as e:
             print(f"ERROR: Failed to apply smooth rounded corners mask: {e}")
             self.rounded_corners_applied = True
     
+    def _should_apply_rounded_corners(self):
+        """Rounded corners only make sense for a normal (restored) window"""
+        if self.isMinimized():
+            return False
+        if self.isMaximized():
+            # Maximized windows fill the screen; drop any mask so content isn't clipped
+            if self.rounded_corners_applied:
+                self.clearMask()
+                self.rounded_corners_applied = False
+            return False
+        return True
+    
     def resizeEvent(self, event):
         """Handle window resize and reapply mask"""
         super().resizeEvent(event)
         # Reapply mask when window is resized
+        if not self._should_apply_rounded_corners():
+            return
         self.rounded_corners_applied = False
         self.apply_rounded_corners_mask()
     
@@ -133,6 +217,8 @@ class MainWindow(QMainWindow):
         """Handle window show event"""
         super().showEvent(event)
         # Apply rounded corners when window is shown
+        if not self._should_apply_rounded_corners():
+            return
         QTimer.singleShot(100, self.apply_rounded_corners_mask)
     
     def create_title_bar(self):
@@ -165,9 +251,17 @@ class MainWindow(QMainWindow):
                     widget.deleteLater()
                     single_layout.removeWidget(widget)
         
+        # Menu buttons live in one container so they can be shown/hidden together
+        self.menu_bar_container = QWidget()
+        self.menu_bar_container.setObjectName("menuBarContainer")
+        menu_bar_layout = QHBoxLayout(self.menu_bar_container)
+        menu_bar_layout.setContentsMargins(0, 0, 0, 0)
+        menu_bar_layout.setSpacing(8)
+        single_layout.addWidget(self.menu_bar_container)
+        
         # Create COMPLETELY NEW menu system
         try:
-            self.create_radical_new_menu_system(single_layout)
+            self.create_radical_new_menu_system(menu_bar_layout)
             print("DEBUG: *** FINISHED CREATING RADICAL NEW MENU SYSTEM ***")
         except Exception as e:
             print(f"DEBUG: *** ERROR in create_radical_new_menu_system: {e} ***")
@@ -177,16 +271,22 @@ class MainWindow(QMainWindow):
         single_layout.addStretch()
         
         # Modern window control buttons with icons matching menu button style
-        self.minimize_btn = QPushButton("🗕")  # Modern minimize icon
+        # Resolve the glyph font once so fallback isn't re-resolved on every show
+        control_font = QFont("Segoe UI Symbol")
+        
+        self.minimize_btn = QPushButton(self.MINIMIZE_GLYPH)  # Modern minimize icon
         self.minimize_btn.setObjectName("modernWindowControlButton")
+        self.minimize_btn.setFont(control_font)
         self.minimize_btn.clicked.connect(self.showMinimized)
         
-        self.maximize_btn = QPushButton("🗖")  # Modern maximize icon
+        self.maximize_btn = QPushButton(self.MAXIMIZE_GLYPH)  # Modern maximize icon
         self.maximize_btn.setObjectName("modernWindowControlButton")
+        self.maximize_btn.setFont(control_font)
         self.maximize_btn.clicked.connect(self.toggle_maximize)
         
-        self.close_btn = QPushButton("🗙")  # Modern close icon
+        self.close_btn = QPushButton(self.CLOSE_GLYPH)  # Modern close icon
         self.close_btn.setObjectName("modernWindowControlCloseButton")  # Special styling for close
+        self.close_btn.setFont(control_font)
         self.close_btn.clicked.connect(self.close)
         
         single_layout.addWidget(self.maximize_btn)
@@ -195,10 +295,10 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(single_row)
         
-        # Make title bar draggable
-        self.title_bar.mousePressEvent = self.title_bar_mouse_press
-        self.title_bar.mouseMoveEvent = self.title_bar_mouse_move
-        self.title_bar.mouseReleaseEvent = self.title_bar_mouse_release
+        # Make title bar draggable (shares the window's drag handlers)
+        self.title_bar.mousePressEvent = self.mousePressEvent
+        self.title_bar.mouseMoveEvent = self.mouseMoveEvent
+        self.title_bar.mouseReleaseEvent = self.mouseReleaseEvent
     
     def create_radical_new_menu_system(self, layout):
         """COMPLETELY NEW menu system - DESTROY AND REBUILD"""
@@ -246,17 +346,34 @@ class MainWindow(QMainWindow):
             # Add to layout
             layout.addWidget(button)
             
-            # Store references for backward compatibility
-            if menu_name == "Hem":
-                self.home_menu_btn = button
-            elif menu_name == "System":
-                self.system_menu_btn = button
-            elif menu_name == "Användare":
-                self.users_menu_btn = button
-            elif menu_name == "Inställningar":
-                self.settings_menu_btn = button
-            elif menu_name == "Hjälp":
-                self.help_menu_btn = button
+            # Store reference keyed by menu name
+            self._menu_buttons[menu_name] = button
+    
+    # Backward compatible aliases for the top menu buttons
+    @property
+    def home_menu_btn(self):
+        return self._menu_buttons.get("Hem")
+    
+    @property
+    def system_menu_btn(self):
+        return self._menu_buttons.get("System")
+    
+    @property
+    def users_menu_btn(self):
+        return self._menu_buttons.get("Användare")
+    
+    @property
+    def settings_menu_btn(self):
+        return self._menu_buttons.get("Inställningar")
+    
+    @property
+    def help_menu_btn(self):
+        return self._menu_buttons.get("Hjälp")
+    
+    def set_menu_buttons_visible(self, visible):
+        """Show or hide all top menu buttons"""
+        if self.menu_bar_container.isHidden() == visible:
+            self.menu_bar_container.setVisible(visible)
     
     def show_extreme_popup(self, menu_name, button):
         """Show popup menu EXACTLY like right-click context menu"""
@@ -296,31 +413,11 @@ class MainWindow(QMainWindow):
     
     def refresh_menu_styling(self):
         """Force refresh menu styling after theme changes - EXTREME NEW SYSTEM"""
-        print("DEBUG: REFRESHING EXTREME menu styling...")
-        
         # Re-apply object names for the EXTREME system
-        if hasattr(self, 'home_menu_btn') and self.home_menu_btn:
-            self.home_menu_btn.setObjectName("EXTREME_NEW_MENU_BUTTON")
-            print(f"DEBUG: Set home_menu_btn objectName to: {self.home_menu_btn.objectName()}")
-        
-        if hasattr(self, 'system_menu_btn') and self.system_menu_btn:
-            self.system_menu_btn.setObjectName("EXTREME_NEW_MENU_BUTTON")
-            print(f"DEBUG: Set system_menu_btn objectName to: {self.system_menu_btn.objectName()}")
-        
-        if hasattr(self, 'users_menu_btn') and self.users_menu_btn:
-            self.users_menu_btn.setObjectName("EXTREME_NEW_MENU_BUTTON")
-            print(f"DEBUG: Set users_menu_btn objectName to: {self.users_menu_btn.objectName()}")
-        
-        if hasattr(self, 'settings_menu_btn') and self.settings_menu_btn:
-            self.settings_menu_btn.setObjectName("EXTREME_NEW_MENU_BUTTON")
-            print(f"DEBUG: Set settings_menu_btn objectName to: {self.settings_menu_btn.objectName()}")
-        
-        if hasattr(self, 'help_menu_btn') and self.help_menu_btn:
-            self.help_menu_btn.setObjectName("EXTREME_NEW_MENU_BUTTON")
-            print(f"DEBUG: Set help_menu_btn objectName to: {self.help_menu_btn.objectName()}")
+        for button in self._menu_buttons.values():
+            button.setObjectName("EXTREME_NEW_MENU_BUTTON")
         
         # Force style refresh
-        print("DEBUG: Forcing Qt style refresh...")
         self.style().unpolish(self)
         self.style().polish(self)
     
@@ -332,31 +429,16 @@ class MainWindow(QMainWindow):
             self.setMinimumSize(1250, 1000)
             self.setMaximumSize(1250, 1000)
             self.resize(1250, 1000)
-            self.maximize_btn.setText("🗖")  # Restore icon
+            self.maximize_btn.setText(self.MAXIMIZE_GLYPH)  # Restore icon
         else:
             # Remove size constraints for maximizing
             self.setMaximumSize(16777215, 16777215)  # Qt's maximum size
             self.showMaximized()
-            self.maximize_btn.setText("🗗")  # Restore down icon
-    
-    def title_bar_mouse_press(self, event):
-        """Handle title bar mouse press"""
-        if event.button() == Qt.LeftButton:
-            self.dragging = True
-            self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
-    
-    def title_bar_mouse_move(self, event):
-        """Handle title bar mouse move"""
-        if event.buttons() == Qt.LeftButton and self.dragging:
-            self.move(event.globalPosition().toPoint() - self.drag_position)
-    
-    def title_bar_mouse_release(self, event):
-        """Handle title bar mouse release"""
-        self.dragging = False
+            self.maximize_btn.setText(self.RESTORE_GLYPH)  # Restore down icon
     
     def setup_ui(self):
         """Setup the main UI"""
-        self.setWindowTitle(self.translation_manager.get_text("app_title"))
+        self.setWindowTitle(self.translation_manager.t["app_title"])
         self.setMinimumSize(1250, 1000)
         self.setMaximumSize(1250, 1000)
         
@@ -372,6 +454,9 @@ class MainWindow(QMainWindow):
         self.dragging = False
         self.drag_position = None
         
+        # Top menu buttons keyed by menu name (filled by create_radical_new_menu_system)
+        self._menu_buttons = {}
+        
         # Create custom title bar
         self.create_title_bar()
         
@@ -406,24 +491,21 @@ class MainWindow(QMainWindow):
         self.main_layout.addWidget(self.stacked_widget)
         
         # Create different windows
+        # Settings stays eager since it persists automatic backup info for the status bar;
+        # the remaining pages are created on first navigation (see the page properties)
         self.login_window = LoginWindow(self.app_manager, self.db_manager, self.translation_manager)
         self.home_window = HomeWindow(self.app_manager, self.db_manager, self.translation_manager)
         self.settings_window = SettingsWindow(self.app_manager, self.db_manager, self.translation_manager)
-        self.add_system_window = AddSystemWindow(self.app_manager, self.db_manager, self.translation_manager)
-        self.my_systems_window = MySystemsWindow(self.app_manager, self.db_manager, self.translation_manager)
-        self.orders_window = OrdersWindow(self.app_manager, self.db_manager, self.translation_manager)
-        self.permissions_window = PermissionsWindow(self.db_manager, self.app_manager, self.translation_manager)
-        self.users_window = UsersWindow(self.app_manager, self.db_manager, self.translation_manager)
+        self._pages = {}
+        # page attribute -> time.monotonic() of the last refresh triggered on show
+        self._page_loaded_at = {}
+        # Stacked pages that implement update_ui_text, collected as pages are added
+        self._translatable_widgets = []
         
         # Add windows to stack
-        self.stacked_widget.addWidget(self.login_window)
-        self.stacked_widget.addWidget(self.home_window)
-        self.stacked_widget.addWidget(self.settings_window)
-        self.stacked_widget.addWidget(self.add_system_window)
-        self.stacked_widget.addWidget(self.my_systems_window)
-        self.stacked_widget.addWidget(self.orders_window)
-        self.stacked_widget.addWidget(self.permissions_window)
-        self.stacked_widget.addWidget(self.users_window)
+        self._add_to_stack(self.login_window)
+        self._add_to_stack(self.home_window)
+        self._add_to_stack(self.settings_window)
         
         # Create status bar
         self.status_bar = QStatusBar()
@@ -442,24 +524,14 @@ class MainWindow(QMainWindow):
         try:
             info_manual = self.app_manager.get_setting("last_manual_backup_info", {}) or {}
             info_auto = self.app_manager.get_setting("last_auto_backup_info", {}) or {}
-            latest_ts = None
-            latest_src = None
-            latest_path = None
-            if isinstance(info_manual, dict) and info_manual.get("timestamp"):
-                latest_ts = info_manual.get("timestamp")
-                latest_src = "manuell"
-                latest_path = info_manual.get("path", "")
-            if isinstance(info_auto, dict) and info_auto.get("timestamp"):
-                # Prefer newer timestamp
-                ts_m = info_manual.get("timestamp") if isinstance(info_manual, dict) else None
-                if (not ts_m) or (info_auto.get("timestamp") > ts_m):
-                    latest_ts = info_auto.get("timestamp")
-                    latest_src = "automatisk"
-                    latest_path = info_auto.get("path", "")
-            if latest_ts:
-                from datetime import datetime
-                dt = datetime.fromisoformat(latest_ts)
-                self.backup_status_label.setText(f"Backup: {dt.strftime('%Y-%m-%d')}, {dt.strftime('%H:%M')}, {latest_src}")
+            candidates = []
+            for src, info in (("manuell", info_manual), ("automatisk", info_auto)):
+                if isinstance(info, dict) and info.get("timestamp"):
+                    candidates.append((info["timestamp"], src, info.get("path", "")))
+            if candidates:
+                # ISO timestamps compare correctly as strings; newest wins
+                latest_ts, latest_src, latest_path = max(candidates)
+                self.backup_status_label.setText(f"Backup: {latest_ts[:10]}, {latest_ts[11:16]}, {latest_src}")
             else:
                 self.backup_status_label.setText("Backup: -")
         except Exception:
@@ -490,15 +562,19 @@ class MainWindow(QMainWindow):
     def update_backup_status(self, timestamp_iso: str, source: str, path: str = ""):
         """Update backup status label in the status bar.
         source: 'manuell' or 'automatisk'
+        Safe to call from any thread; the label is updated on the UI thread.
         """
+        self.backup_status_changed.emit(timestamp_iso, source, path or "")
+    
+    def _set_backup_status_text(self, timestamp_iso: str, source: str, path: str = ""):
+        """Slot for backup_status_changed - updates the label only when the text changes"""
         try:
-            from datetime import datetime
             dt = datetime.fromisoformat(timestamp_iso)
-            self.backup_status_label.setText(
-                f"Backup: {dt.strftime('%Y-%m-%d')}, {dt.strftime('%H:%M')}, {source}"
-            )
+            text = f"Backup: {dt.strftime('%Y-%m-%d')}, {dt.strftime('%H:%M')}, {source}"
         except Exception:
-            self.backup_status_label.setText("Backup: -")
+            text = "Backup: -"
+        if self.backup_status_label.text() != text:
+            self.backup_status_label.setText(text)
     
     def update_version_display(self):
         """Update version display in status bar"""
@@ -511,26 +587,34 @@ class MainWindow(QMainWindow):
             print(f"Error updating version display: {e}")
             self.version_label.setText("v1.05")
     
+    def _resolve_backup_dir(self):
+        """Resolve the absolute backup directory path"""
+        backup_dir = "backups"
+        if not os.path.isabs(backup_dir):
+            import sys
+            if hasattr(sys, '_MEIPASS'):
+                # Running as PyInstaller bundle
+                app_root = os.path.dirname(sys.executable)
+            else:
+                # Running as script
+                app_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+            backup_dir = os.path.join(app_root, backup_dir)
+        return backup_dir
+    
     def check_latest_backup(self):
-        """Check for the latest backup file and update status bar every 60 seconds"""
+        """Check for the latest backup file and update status bar when the backup folder changes"""
         print(f"Checking latest backup at {datetime.now().strftime('%H:%M:%S')}")
         try:
-            # Get backup directory path
-            backup_dir = "backups"
-            if not os.path.isabs(backup_dir):
-                import sys
-                if hasattr(sys, '_MEIPASS'):
-                    # Running as PyInstaller bundle
-                    app_root = os.path.dirname(sys.executable)
-                else:
-                    # Running as script
-                    app_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-                backup_dir = os.path.join(app_root, backup_dir)
+            backup_dir = self._backup_dir
             
             if not os.path.exists(backup_dir):
                 self.backup_status_label.setText("Backup: -")
                 return
             
+            # Start watching the folder once it appears
+            if backup_dir not in self._fs_watcher.directories():
+                self._fs_watcher.addPath(backup_dir)
+            
             # Get all backup files
             backup_files = []
             for item in os.listdir(backup_dir):
@@ -582,14 +666,26 @@ class MainWindow(QMainWindow):
         self.user_label = QLabel()
         self.user_label.setProperty("kb_label_type", "caption")
         
-        # Create vertical layout for user area (no logout button)
-        self.user_vertical_layout = QVBoxLayout()
-        self.user_vertical_layout.addWidget(self.user_label)
-        self.user_vertical_layout.setSpacing(5)
-        self.user_vertical_layout.setAlignment(Qt.AlignCenter)
-        
-        # Add vertical layout to horizontal layout
-        self.user_info_layout.addLayout(self.user_vertical_layout)
+        # Profile picture label (filled in on login)
+        self.profile_pic_label = QLabel()
+        self.profile_pic_label.setFixedSize(64, 64)
+        self.profile_pic_label.setObjectName("profilePicture")  # Use global styling
+        self.profile_pic_label.setAlignment(Qt.AlignCenter)
+        self.profile_pic_label.setScaledContents(True)
+        
+        # Create vertical layout for username only (no logout button)
+        self.user_text_layout = QVBoxLayout()
+        self.user_text_layout.addWidget(self.user_label)
+        self.user_text_layout.setSpacing(5)
+        self.user_text_layout.setAlignment(Qt.AlignCenter)
+        
+        # Picture and name side by side
+        self.user_display_layout = QHBoxLayout()
+        self.user_display_layout.addWidget(self.profile_pic_label)
+        self.user_display_layout.addSpacing(10)  # Add spacing between picture and name
+        self.user_display_layout.addLayout(self.user_text_layout)
+        
+        self.user_info_layout.addLayout(self.user_display_layout)
         self.user_info_widget.hide()
         
         # Add to header layout
@@ -623,15 +719,94 @@ class MainWindow(QMainWindow):
         self.home_window.navigate_to_my_systems.connect(self.show_my_systems)
         self.home_window.navigate_to_settings.connect(self.show_settings)
         
-        # Window navigation signals
-        self.add_system_window.navigate_home.connect(self.show_home)
-        self.my_systems_window.navigate_home.connect(self.show_home)
-        self.my_systems_window.navigate_to_home.connect(self.show_home)
-        self.my_systems_window.navigate_to_orders.connect(self.show_orders)
-        self.my_systems_window.order_created.connect(self.orders_window.refresh_data)
-        self.orders_window.navigate_home.connect(self.show_home)
+        # Window navigation signals (lazily created pages connect in their properties)
         self.settings_window.navigate_home.connect(self.show_home)
-        self.users_window.navigate_home.connect(self.show_home)
+    
+    def _add_to_stack(self, page):
+        """Add a page to the stack and remember it if it has translatable text"""
+        self.stacked_widget.addWidget(page)
+        if hasattr(page, 'update_ui_text'):
+            self._translatable_widgets.append(page)
+    
+    def _add_page(self, name, page):
+        """Register a lazily created page and add it to the stack"""
+        self._pages[name] = page
+        self._add_to_stack(page)
+        return page
+    
+    @property
+    def add_system_window(self):
+        """Add system page, created on first use"""
+        page = self._pages.get("add_system_window")
+        if page is None:
+            from .add_system_window import AddSystemWindow
+            page = AddSystemWindow(self.app_manager, self.db_manager, self.translation_manager)
+            page.navigate_home.connect(self.show_home)
+            page.system_added.connect(lambda: self.mark_page_dirty("my_systems_window"))
+            self._add_page("add_system_window", page)
+        return page
+    
+    @property
+    def my_systems_window(self):
+        """My systems page, created on first use"""
+        page = self._pages.get("my_systems_window")
+        if page is None:
+            from .my_systems_window import MySystemsWindow
+            page = MySystemsWindow(self.app_manager, self.db_manager, self.translation_manager)
+            page.navigate_home.connect(self.show_home)
+            page.navigate_to_home.connect(self.show_home)
+            page.navigate_to_orders.connect(self.show_orders)
+            page.order_created.connect(self.on_order_created)
+            self._add_page("my_systems_window", page)
+        return page
+    
+    @property
+    def orders_window(self):
+        """Orders page, created on first use"""
+        page = self._pages.get("orders_window")
+        if page is None:
+            from .orders_window import OrdersWindow
+            page = OrdersWindow(self.app_manager, self.db_manager, self.translation_manager)
+            page.navigate_home.connect(self.show_home)
+            self._add_page("orders_window", page)
+        return page
+    
+    @property
+    def permissions_window(self):
+        """Permissions page, created on first use"""
+        page = self._pages.get("permissions_window")
+        if page is None:
+            from .permissions_window import PermissionsWindow
+            page = PermissionsWindow(self.db_manager, self.app_manager, self.translation_manager)
+            self._add_page("permissions_window", page)
+        return page
+    
+    @property
+    def users_window(self):
+        """Users page, created on first use"""
+        page = self._pages.get("users_window")
+        if page is None:
+            from .users_window import UsersWindow
+            page = UsersWindow(self.app_manager, self.db_manager, self.translation_manager)
+            page.navigate_home.connect(self.show_home)
+            self._add_page("users_window", page)
+        return page
+    
+    def on_order_created(self):
+        """A new order makes the orders page stale; it reloads the next time it is shown"""
+        self.mark_page_dirty("orders_window")
+    
+    def mark_page_dirty(self, page_attr):
+        """Force the page to reload its data the next time it is shown"""
+        self._page_loaded_at.pop(page_attr, None)
+    
+    def _refresh_page_if_stale(self, page_attr, page):
+        """Call page.refresh_data() if the page is dirty or its data is older than PAGE_STALE_AFTER"""
+        now = time.monotonic()
+        loaded_at = self._page_loaded_at.get(page_attr)
+        if loaded_at is None or now - loaded_at >= self.PAGE_STALE_AFTER:
+            page.refresh_data()
+            self._page_loaded_at[page_attr] = now
     
     def setup_version_connections(self):
         """Setup version manager signal connections"""
@@ -646,6 +821,8 @@ class MainWindow(QMainWindow):
     
     def setup_system_tray(self):
         """Setup system tray functionality"""
+        self.tray_icon = None
+        self.first_minimize = False
         if not QSystemTrayIcon.isSystemTrayAvailable():
             return
         
@@ -686,6 +863,15 @@ class MainWindow(QMainWindow):
         # Show notification on first minimize
         self.first_minimize = True
     
+    def _show_minimized_to_tray_message(self):
+        """Tell the user the application keeps running in the system tray"""
+        self.tray_icon.showMessage(
+            "KeyBuddy",
+            "Applikationen minimerades till systemfältet. Dubbelklicka på ikonen för att visa den igen.",
+            QSystemTrayIcon.Information,
+            3000
+        )
+    
     def on_tray_icon_activated(self, reason):
         """Handle tray icon activation"""
         if reason == QSystemTrayIcon.DoubleClick:
@@ -699,25 +885,21 @@ class MainWindow(QMainWindow):
     
     def quit_application(self):
         """Quit application completely"""
-        # Close database connection
-        self.db_manager.close()
+        # Database connection is closed from aboutToQuit
         QApplication.quit()
     
     def apply_theme(self):
         """Apply current theme"""
         theme_name = self.app_manager.get_setting("theme", "light")
+        # Re-applying the same stylesheet forces a full repolish; skip it
+        if self._current_theme_name == theme_name:
+            return
+        self._current_theme_name = theme_name
         stylesheet = self.theme_manager.get_stylesheet(theme_name)
         
         # Apply the global stylesheet (which now includes rounded corners)
         self.setStyleSheet(stylesheet)
         
-        # DEBUG: Print stylesheet size and radical menu styling presence
-        print(f"DEBUG: Applied stylesheet with {len(stylesheet)} characters")
-        if "radicalNewMenuButton" in stylesheet:
-            print("DEBUG: RADICAL menu button styling FOUND in stylesheet")
-        else:
-            print("DEBUG: RADICAL menu button styling NOT FOUND in stylesheet")
-        
         # FORCE REFRESH MENU STYLING AFTER THEME APPLICATION
         self.refresh_menu_styling()
         
@@ -732,7 +914,12 @@ class MainWindow(QMainWindow):
         """Update company logo"""
         logo_path = self.app_manager.get_setting("company_logo", "")
         if logo_path and os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
+            # Decode the image once per file version; later refreshes hit the pixmap cache
+            key = f"logo::{logo_path}::{os.path.getmtime(logo_path)}"
+            pixmap = QPixmap()
+            if not QPixmapCache.find(key, pixmap):
+                pixmap = QPixmap(logo_path)
+                QPixmapCache.insert(key, pixmap)
             self.logo_label.setPixmap(pixmap)
         else:
             # Default logo placeholder
@@ -747,19 +934,20 @@ class MainWindow(QMainWindow):
     
     def on_theme_changed(self, theme_name):
         """Handle theme change"""
-        print(f"DEBUG: on_theme_changed called with theme: {theme_name}")
         self.apply_theme()
-        print("DEBUG: Global stylesheet applied - dashboard cards should update automatically")
     
     def on_update_available(self, version_info):
         """Handle update available notification"""
-        reply = CopyableMessageBox.question(
-            self, self.translation_manager.get_text("update_available"),
+        CopyableMessageBox.open_question(
+            self, self.translation_manager.t["update_available"],
             f"En ny version ({version_info['version']}) är tillgänglig.\n"
             f"Vill du ladda ner och installera den nu?",
+            lambda reply: self._on_update_available_reply(reply, version_info),
             CopyableMessageBox.Yes | CopyableMessageBox.No
         )
-        
+    
+    def _on_update_available_reply(self, reply, version_info):
+        """Start the download if the user accepted the update"""
         if reply == CopyableMessageBox.Yes:
             self.version_manager.download_update(version_info['download_url'])
     
@@ -771,13 +959,16 @@ class MainWindow(QMainWindow):
         """Handle update download completed"""
         # self.status_bar.showMessage("Uppdatering nedladdad")
         
-        reply = CopyableMessageBox.question(
-            self, self.translation_manager.get_text("install_update"),
+        CopyableMessageBox.open_question(
+            self, self.translation_manager.t["install_update"],
             "Uppdateringen har laddats ner.\n"
             "Vill du installera den nu? (Applikationen kommer att starta om)",
+            lambda reply: self._on_install_update_reply(reply, update_file),
             CopyableMessageBox.Yes | CopyableMessageBox.No
         )
-        
+    
+    def _on_install_update_reply(self, reply, update_file):
+        """Install the downloaded update and quit if the user accepted"""
         if reply == CopyableMessageBox.Yes:
             self.version_manager.install_update(update_file)
             QApplication.quit()
@@ -786,45 +977,74 @@ class MainWindow(QMainWindow):
         """Handle update error"""
         # self.status_bar.showMessage("Uppdateringsfel")
         CopyableMessageBox.critical(
-            self, self.translation_manager.get_text("update_error"),
+            self, self.translation_manager.t["update_error"],
             f"Ett fel uppstod vid uppdatering:\n{error_msg}"
         )
     
     def eventFilter(self, obj, event):
-        """Filter events to detect user activity for auto-logout"""
-        # Simple check without isinstance to avoid import issues
-        if not hasattr(obj, 'metaObject'):
-            return False
-            
-        if self.app_manager.get_current_user() and self.app_manager.get_setting("auto_logout_enabled", True):
-            # Track mouse and keyboard activity
-            if event.type() in [QEvent.MouseMove, QEvent.MouseButtonPress, QEvent.KeyPress]:
-                self.reset_auto_logout_timer()
-        
-        try:
-            return super().eventFilter(obj, event)
-        except (TypeError, AttributeError):
-            # Handle cases where obj is not a proper QObject
-            return False
+        """Filter events on the focused widget to detect user activity for auto-logout"""
+        # Track keyboard and click activity (mouse movement is polled)
+        if (event.type() in self._activity_event_types and self.app_manager.auto_logout_enabled
+                and self.app_manager.current_user is not None):
+            self.reset_auto_logout_timer()
+        return False
     
-    def reset_auto_logout_timer(self):
-        """Reset the auto-logout timer"""
-        if self.app_manager.get_setting("auto_logout_enabled", True):
-            self.auto_logout_timer.stop()
-            self.auto_logout_timer.start(5 * 60 * 1000)  # 5 minutes in milliseconds
-            self.last_activity_time = datetime.now()
+    def _poll_user_activity(self):
+        """Treat cursor movement since the last poll as user activity"""
+        pos = QCursor.pos()
+        if pos != self._last_cursor_pos:
+            self._last_cursor_pos = pos
+            self.reset_auto_logout_timer()
+    
+    def _on_focus_changed(self, old, new):
+        """Focus moving between widgets counts as activity; follow it with the event filter"""
+        self._watch_focus_widget(new)
+        self.reset_auto_logout_timer()
+    
+    def _watch_focus_widget(self, widget):
+        """Scope the activity event filter to the currently focused widget"""
+        if self._watched_focus_widget is not None:
+            try:
+                self._watched_focus_widget.removeEventFilter(self)
+            except RuntimeError:
+                # Widget already deleted
+                pass
+        self._watched_focus_widget = widget
+        if widget is not None:
+            widget.installEventFilter(self)
+    
+    def reset_auto_logout_timer(self, force=False):
+        """Reset the auto-logout timer (coalesced to at most once per few seconds)"""
+        if not self.app_manager.auto_logout_enabled:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_reset_monotonic < self.AUTO_LOGOUT_RESET_INTERVAL:
+            return
+        self._last_reset_monotonic = now
+        # start() restarts an already running timer
+        self.auto_logout_timer.start(self.AUTO_LOGOUT_TIMEOUT_MS)
     
     def start_auto_logout_timer(self):
         """Start auto-logout timer when user logs in"""
-        if self.app_manager.get_setting("auto_logout_enabled", True):
-            # Install event filter to track activity
-            QApplication.instance().installEventFilter(self)
-            self.reset_auto_logout_timer()
+        if self.app_manager.auto_logout_enabled:
+            # Track activity via cursor polling and the focused widget
+            if not self._activity_tracking:
+                app = QApplication.instance()
+                app.focusChanged.connect(self._on_focus_changed)
+                self._watch_focus_widget(app.focusWidget())
+                self._last_cursor_pos = QCursor.pos()
+                self.activity_poll_timer.start()
+                self._activity_tracking = True
+            self.reset_auto_logout_timer(force=True)
     
     def stop_auto_logout_timer(self):
         """Stop auto-logout timer when user logs out"""
         self.auto_logout_timer.stop()
-        QApplication.instance().removeEventFilter(self)
+        if self._activity_tracking:
+            self.activity_poll_timer.stop()
+            QApplication.instance().focusChanged.disconnect(self._on_focus_changed)
+            self._watch_focus_widget(None)
+            self._activity_tracking = False
     
     def auto_logout(self):
         """Perform automatic logout due to inactivity"""
@@ -833,26 +1053,19 @@ class MainWindow(QMainWindow):
     
     def update_ui_text(self):
         """Update UI text for current language"""
-        self.setWindowTitle(self.translation_manager.get_text("app_title"))
+        self.setWindowTitle(self.translation_manager.t["app_title"])
         
         # Custom menu buttons are already created and don't need updating
         
         # Update all windows
-        for i in range(self.stacked_widget.count()):
-            widget = self.stacked_widget.widget(i)
-            if hasattr(widget, 'update_ui_text'):
-                widget.update_ui_text()
+        for widget in self._translatable_widgets:
+            widget.update_ui_text()
     
     def show_login(self):
         """Show login window"""
         self.stacked_widget.setCurrentWidget(self.login_window)
         # Hide custom menu buttons during login
-        if hasattr(self, 'home_menu_btn'):
-            self.home_menu_btn.hide()
-            self.system_menu_btn.hide()
-            self.users_menu_btn.hide()
-            self.settings_menu_btn.hide()
-            self.help_menu_btn.hide()
+        self.set_menu_buttons_visible(False)
         self.user_info_widget.hide()
         # self.status_bar.showMessage(self.translation_manager.get_text("login"))
     
@@ -862,48 +1075,25 @@ class MainWindow(QMainWindow):
             self.stacked_widget.setCurrentWidget(self.home_window)
             # self.status_bar.showMessage(self.translation_manager.get_text("home"))
             # Show custom menu buttons when logged in
-            if hasattr(self, 'home_menu_btn'):
-                self.home_menu_btn.show()
-                self.system_menu_btn.show()
-                self.users_menu_btn.show()
-                self.settings_menu_btn.show()
-                self.help_menu_btn.show()
+            self.set_menu_buttons_visible(True)
         else:
             self.show_login()
     
+    @_authed_page("settings_window")
     def show_settings(self):
         """Show settings window"""
-        if self.app_manager.get_current_user():
-            self.stacked_widget.setCurrentWidget(self.settings_window)
-            # self.status_bar.showMessage(self.translation_manager.get_text("settings"))
-        else:
-            self.show_login()
     
+    @_authed_page("add_system_window")
     def show_add_system(self):
         """Show add system window"""
-        if self.app_manager.get_current_user():
-            self.stacked_widget.setCurrentWidget(self.add_system_window)
-            # self.status_bar.showMessage(self.translation_manager.get_text("add_system"))
-        else:
-            self.show_login()
     
+    @_authed_page("my_systems_window", refresh=True)
     def show_my_systems(self):
         """Show my systems window"""
-        if self.app_manager.get_current_user():
-            self.stacked_widget.setCurrentWidget(self.my_systems_window)
-            self.my_systems_window.refresh_data()
-            # self.status_bar.showMessage(self.translation_manager.get_text("my_systems"))
-        else:
-            self.show_login()
     
+    @_authed_page("orders_window", refresh=True)
     def show_orders(self):
         """Show orders window"""
-        if self.app_manager.get_current_user():
-            self.stacked_widget.setCurrentWidget(self.orders_window)
-            self.orders_window.refresh_data()
-            # self.status_bar.showMessage(self.translation_manager.get_text("orders"))
-        else:
-            self.show_login()
     
     def show_users(self):
         """Show users management window (Admin only)"""
@@ -915,7 +1105,7 @@ class MainWindow(QMainWindow):
                 self.logger.log_system_access(current_user['user_id'], "User Management")
                 # Always refresh users list before showing
                 try:
-                    if hasattr(self, 'users_window') and hasattr(self.users_window, 'load_users'):
+                    if hasattr(self.users_window, 'load_users'):
                         self.users_window.load_users()
                 except Exception:
                     pass
@@ -926,27 +1116,16 @@ class MainWindow(QMainWindow):
         else:
             self.show_login()
     
+    @_authed_page("permissions_window")
     def show_permissions(self):
         """Show permissions window"""
-        if self.app_manager.get_current_user():
-            self.stacked_widget.setCurrentWidget(self.permissions_window)
-            # self.status_bar.showMessage("Behörigheter")
-        else:
-            self.show_login()
     
     def on_login_successful(self, user_data):
         """Handle successful login"""
-        print(f"DEBUG: Login successful, emitting signal")
         self.app_manager.set_current_user(user_data)
+        # show_home also shows the menu buttons
         self.show_home()
         self.update_user_display(user_data)
-        # Show custom menu buttons after login
-        if hasattr(self, 'home_menu_btn'):
-            self.home_menu_btn.show()
-            self.system_menu_btn.show()
-            self.users_menu_btn.show()
-            self.settings_menu_btn.show()
-            self.help_menu_btn.show()
         
         # Start auto-logout timer if enabled
         self.start_auto_logout_timer()
@@ -957,73 +1136,40 @@ class MainWindow(QMainWindow):
     
     def update_user_display(self, user_data):
         """Update user display with profile picture and username"""
-        print(f"DEBUG: Updating user display for {user_data['username']}")
-        
         # Show user info widget
         self.user_info_widget.show()
-        print(f"DEBUG: User info widget shown, visibility: {self.user_info_widget.isVisible()}")
         
         # Get profile picture from database
         try:
-            result = self.db_manager.execute_query(
+            row = self.db_manager.fetch_one(
                 "SELECT profile_picture FROM users WHERE id = ?",
                 (user_data['user_id'],)
             )
-            
-            profile_picture_path = None
-            if result and result[0] and result[0]['profile_picture']:
-                profile_picture_path = result[0]['profile_picture']
-            
-            print(f"DEBUG: Profile picture path: {profile_picture_path}")
-            
-            # Create layout for user info if not exists
-            if not hasattr(self, 'user_display_layout'):
-                print(f"DEBUG: Creating new user display layout")
-                self.user_display_layout = QHBoxLayout()
-                
-                
-                # Profile picture label
-                self.profile_pic_label = QLabel()
-                self.profile_pic_label.setFixedSize(64, 64)
-                self.profile_pic_label.setObjectName("profilePicture")  # Use global styling
-                self.profile_pic_label.setAlignment(Qt.AlignCenter)
-                self.profile_pic_label.setScaledContents(True)
-                
-                # Create vertical layout for username only
-                self.user_text_layout = QVBoxLayout()
-                self.user_text_layout.addWidget(self.user_label)
-                self.user_text_layout.setSpacing(5)
-                self.user_text_layout.setAlignment(Qt.AlignCenter)
-                
-                self.user_display_layout.addWidget(self.profile_pic_label)
-                self.user_display_layout.addSpacing(10)  # Add spacing between picture and name
-                self.user_display_layout.addLayout(self.user_text_layout)
-                
-                # Replace user_vertical_layout in user_info_layout
-                self.user_info_layout.removeItem(self.user_vertical_layout)
-                self.user_info_layout.insertLayout(0, self.user_display_layout)
-                
-                print(f"DEBUG: User display layout created and added")
+            profile_picture_path = row['profile_picture'] if row else None
             
             # Update profile picture
             if profile_picture_path and os.path.exists(profile_picture_path):
-                from PySide6.QtGui import QPixmap
-                pixmap = QPixmap(profile_picture_path)
-                if not pixmap.isNull():
-                    # Scale pixmap to fit label
-                    scaled_pixmap = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                # Cache the downscaled picture so re-logins skip decode + smooth scaling
+                key = (f"profile::{user_data['user_id']}::{profile_picture_path}"
+                       f"::{os.path.getmtime(profile_picture_path)}")
+                scaled_pixmap = QPixmap()
+                if not QPixmapCache.find(key, scaled_pixmap):
+                    pixmap = QPixmap(profile_picture_path)
+                    if not pixmap.isNull():
+                        # Scale pixmap to fit label
+                        scaled_pixmap = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                        QPixmapCache.insert(key, scaled_pixmap)
+                    else:
+                        scaled_pixmap = None
+                if scaled_pixmap is not None:
                     self.profile_pic_label.setPixmap(scaled_pixmap)
-                    print(f"DEBUG: Profile picture loaded and set")
                 else:
                     self.profile_pic_label.setText("👤")
-                    print(f"DEBUG: Invalid pixmap, using emoji")
             else:
                 self.profile_pic_label.setText("👤")
-                print(f"DEBUG: No profile picture file, using emoji")
             
             # Update username
             self.user_label.setText(user_data['username'])
-            print(f"DEBUG: Username set to: {user_data['username']}")
             
         except Exception as e:
             print(f"Error updating user display: {e}")
@@ -1044,41 +1190,47 @@ class MainWindow(QMainWindow):
         # Status message hidden by user request
         # self.status_bar.showMessage("Utloggad")
         
-        # Clear sensitive data from windows
+        # Clear sensitive data from windows (pages never opened hold no data)
         self.home_window.clear_data()
-        self.my_systems_window.clear_data()
-        self.orders_window.clear_data()
+        for name in ("my_systems_window", "orders_window"):
+            page = self._pages.get(name)
+            if page is not None:
+                page.clear_data()
+            self.mark_page_dirty(name)
     
     def closeEvent(self, event):
         """Handle application close - minimize to tray instead"""
-        if hasattr(self, 'tray_icon') and self.tray_icon.isVisible():
-            # Show notification on first minimize
-            if hasattr(self, 'first_minimize') and self.first_minimize:
-                self.tray_icon.showMessage(
-                    "KeyBuddy",
-                    "Applikationen minimerades till systemfältet. Dubbelklicka på ikonen för att visa den igen.",
-                    QSystemTrayIcon.Information,
-                    3000
-                )
+        # Ask the icon itself: it may have been hidden or lost since setup
+        if self.tray_icon is not None and self.tray_icon.isVisible():
+            # Show notification on first minimize; deferred so closeEvent returns immediately
+            if self.first_minimize:
                 self.first_minimize = False
+                QTimer.singleShot(0, self._show_minimized_to_tray_message)
             
             # Hide window instead of closing
             self.hide()
             event.ignore()
+        elif self._close_confirmed:
+            # User already confirmed quitting in the dialog below
+            # Stop backup monitoring timer
+            if hasattr(self, 'backup_monitor_timer'):
+                self.backup_monitor_timer.stop()
+            # Database connection is closed from aboutToQuit
+            event.accept()
         else:
-            # Fallback to normal close behavior if tray not available
-            reply = CopyableMessageBox.question(
+            # Fallback to normal close behavior if tray not available:
+            # ask without blocking and close again once confirmed
+            event.ignore()
+            CopyableMessageBox.open_question(
                 self,
-                self.translation_manager.get_text("app_title"),
+                self.translation_manager.t["app_title"],
                 "Är du säker på att du vill avsluta?",
+                self._on_close_reply,
                 CopyableMessageBox.Yes | CopyableMessageBox.No
             )
-            if reply == CopyableMessageBox.Yes:
-                # Stop backup monitoring timer
-                if hasattr(self, 'backup_monitor_timer'):
-                    self.backup_monitor_timer.stop()
-                # Close database connection
-                self.db_manager.close()
-                event.accept()
-            else:
-                event.ignore()
+    
+    def _on_close_reply(self, reply):
+        """Close the window if the user confirmed quitting"""
+        if reply == CopyableMessageBox.Yes:
+            self._close_confirmed = True
+            self.close()
@@ -3,24 +3,271 @@ My Systems window for searching and managing existing systems
 """
 
 import os
+import atexit
+import shutil
+import time
+import functools
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                              QLineEdit, QTextEdit, QTableWidget, QTableWidgetItem,
+                              QTableWidget, QTableWidgetItem,
                               QHeaderView, QPushButton, QMessageBox, QFormLayout,
-                              QGroupBox, QSpinBox, QCheckBox, QProgressBar, QDialog, QComboBox,
-                               QMessageBox, QAbstractItemView, QScrollArea, QDialogButtonBox, QToolButton, QMenu)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor
+                              QGroupBox, QSpinBox, QCheckBox, QDialog, QComboBox,
+                              QAbstractItemView, QToolButton, QMenu,
+                              QTableView, QStyledItemDelegate, QStyleOptionViewItem)
+from PySide6.QtCore import (Qt, Signal, QTimer, QThreadPool, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+                            QStandardPaths)
+from PySide6.QtGui import QColor, QBrush, QPalette
 from .copyable_message_box import CopyableMessageBox
 from ..core.pdf_generator import OrderPDFGenerator
 from ..core.auth import AuthManager
+from ..core.logo_manager import LogoManager
+from ..core.database import SUPPORTS_RETURNING
 from .key_fob_return_dialog import KeyFobReturnDialog
 from .edit_system_dialog import ModernEditSystemDialog
+from .orders_window import build_orders_query, ORDERS_PREFETCH_TTL
 
-from .styles import KeyBuddyButton, ButtonType
-from .copyable_message_box import CopyableMessageBox
+from .styles import KeyBuddyButton, ButtonType, KeyBuddyLineEdit, FieldType
 
 # Old EditSystemDialog removed - using ModernEditSystemDialog instead
 
+_SYSTEMS_QUERY = """
+    SELECT 
+        ks.id,
+        ks.customer_id,
+        c.company,
+        c.project,
+        ks.key_code,
+        ks.key_profile,
+        ks.series_id,
+        ks.fabrikat,
+        ks.koncept,
+        ks.last_sequence_number,
+        ks.is_paid,
+        ks.billing_plan,
+        ks.paid_at,
+        ks.invoice_count,
+        ks.last_invoice_date,
+        c.key_responsible_1,
+        date(ks.created_at) as created_date,
+        ks.key_code2,
+        ks.system_number,
+        ks.profile2,
+        ks.delning,
+        ks.key_location2,
+        ks.fabrikat2,
+        ks.koncept2,
+        ks.flex1,
+        ks.flex2,
+        ks.flex3,
+        c.key_location,
+        c.customer_number,
+        c.org_number,
+        c.address,
+        c.postal_code,
+        c.postal_address,
+        c.phone,
+        c.mobile_phone,
+        c.email,
+        c.website,
+        c.key_responsible_2,
+        c.key_responsible_3,
+        ks.notes,
+        ks.price_one_time
+    FROM key_systems ks
+    JOIN customers c ON ks.customer_id = c.id
+"""
+
+# Only what the systems table shows and the smart display data needs; the rest is fetched on demand
+_SYSTEMS_LIST_QUERY = """
+    SELECT 
+        ks.id,
+        ks.customer_id,
+        c.company,
+        c.project,
+        ks.key_code,
+        ks.key_profile,
+        ks.series_id,
+        ks.fabrikat,
+        ks.koncept,
+        ks.last_sequence_number,
+        ks.is_paid,
+        ks.billing_plan,
+        ks.paid_at,
+        ks.invoice_count,
+        c.key_responsible_1,
+        date(ks.created_at) as created_date,
+        ks.key_code2,
+        ks.system_number,
+        ks.profile2,
+        ks.delning,
+        ks.key_location2,
+        ks.fabrikat2,
+        ks.koncept2,
+        c.key_location
+    FROM key_systems ks
+    JOIN customers c ON ks.customer_id = c.id
+"""
+
+# Columns that are shown as empty text rather than None
+_SYSTEM_TEXT_FIELDS = (
+    'key_code2', 'system_number', 'profile2', 'delning', 'key_location2', 'fabrikat2', 'koncept2',
+    'flex1', 'flex2', 'flex3', 'key_location', 'customer_number', 'org_number', 'street_address',
+    'postal_code', 'postal_address', 'phone', 'mobile_phone', 'email', 'website',
+    'key_responsible_2', 'key_responsible_3', 'notes'
+)
+
+# Recurring billing plan (lowercase) -> days a payment covers
+_BILLING_DAYS = {'månadskostnad': 30, 'halvårskostnad': 182, 'helårskostnad': 365}
+
+# Recurring plans whose paid period has elapsed revert to Obetald
+_EXPIRED_PAID_WHERE = """WHERE is_paid AND paid_at IS NOT NULL AND (
+        """ + "\n        OR ".join(
+    f"(lower(billing_plan) = '{plan}' AND julianday('now', 'localtime') - julianday(paid_at) >= {days})"
+    for plan, days in _BILLING_DAYS.items()
+) + """
+    )"""
+_HAS_EXPIRED_PAID = "SELECT 1 FROM key_systems " + _EXPIRED_PAID_WHERE + " LIMIT 1"
+_EXPIRE_PAID_STATUS = "UPDATE key_systems SET is_paid = 0 " + _EXPIRED_PAID_WHERE
+
+
+def expire_paid_statuses(db_manager):
+    """Auto-revert elapsed recurring payments in one statement; only writes when a row has expired"""
+    try:
+        # A read first, so a refresh with nothing to expire takes no write lock on the shared database
+        if db_manager.execute_query(_HAS_EXPIRED_PAID):
+            db_manager.execute_update(_EXPIRE_PAID_STATUS)
+    except Exception as e:
+        print(f"Paid status expiry error: {e}")
+
+_MARK_PAID = """UPDATE key_systems SET is_paid = 1, paid_at = COALESCE(paid_at, ?),
+    invoice_count = invoice_count + 1, last_invoice_date = ? WHERE id = ?"""
+
+# System fields for smart data selection plus the customer fields the order PDF and receipt print
+_SYSTEM_PDF_QUERY = """SELECT ks.key_code, ks.key_profile, ks.series_id, ks.fabrikat, ks.koncept,
+    ks.last_sequence_number, ks.notes, ks.key_code2, ks.system_number, ks.profile2, ks.delning,
+    ks.key_location2, ks.fabrikat2, ks.koncept2, ks.flex1, ks.flex2, ks.flex3,
+    c.id AS c_id, c.company, c.project, c.key_responsible_1, c.key_location, c.mobile_phone,
+    c.address, c.postal_code, c.postal_address, c.org_number
+    FROM key_systems ks
+    LEFT JOIN customers c ON c.id = ks.customer_id
+    WHERE ks.id = ?"""
+_PDF_SYSTEM_FIELDS = (
+    'key_code', 'key_profile', 'series_id', 'fabrikat', 'koncept', 'notes',
+    'key_code2', 'system_number', 'profile2', 'delning', 'key_location2', 'fabrikat2', 'koncept2',
+    'flex1', 'flex2', 'flex3'
+)
+_PDF_CUSTOMER_FIELDS = (
+    'company', 'project', 'key_responsible_1', 'key_location', 'mobile_phone',
+    'address', 'postal_code', 'postal_address', 'org_number'
+)
+
+# Plaintext invoice PDFs kept on disk per system for "Visa faktura"
+_PDF_CACHE_SIZE = 16
+
+_invoice_cache_dir = None
+
+
+def get_invoice_cache_dir():
+    """Folder for decrypted invoice PDFs (one stable file per invoice id), removed on exit"""
+    global _invoice_cache_dir
+    if _invoice_cache_dir is None:
+        base = QStandardPaths.writableLocation(QStandardPaths.CacheLocation) or tempfile.gettempdir()
+        _invoice_cache_dir = os.path.join(base, 'keybuddy_invoices')
+        os.makedirs(_invoice_cache_dir, exist_ok=True)
+        atexit.register(clear_invoice_cache_dir, recreate=False)
+    return _invoice_cache_dir
+
+
+def clear_invoice_cache_dir(recreate=True):
+    """Delete decrypted invoice PDFs written this session"""
+    if _invoice_cache_dir:
+        shutil.rmtree(_invoice_cache_dir, ignore_errors=True)
+        if recreate:
+            os.makedirs(_invoice_cache_dir, exist_ok=True)
+
+
+# Ids per "WHERE id IN (...)" statement, well below SQLite's bound-parameter limit
+_IN_BATCH = 500
+
+# Invoice history lists ids only; the encrypted PDF is loaded when an invoice is opened
+_INVOICE_HISTORY_QUERY = "SELECT id, created_at FROM invoices WHERE system_id = ? ORDER BY created_at DESC"
+# Newest stored invoice for a system; served by idx_invoices_sys_created
+_LATEST_INVOICE_QUERY = "SELECT pdf_encrypted FROM invoices WHERE system_id = ? ORDER BY created_at DESC LIMIT 1"
+_LATEST_INVOICE_ID_QUERY = "SELECT id FROM invoices WHERE system_id = ? ORDER BY created_at DESC LIMIT 1"
+
+# Faktura column texts and hover tooltip
+STATUS_PAID = "Betald"
+STATUS_UNPAID = "Obetald"
+_FAKTURA_TOOLTIP = "Plan: {plan}\nBetald: {paid}\nNästa förfallodatum: {due}\nAntal fakturor: {count}"
+
+# Custom role returning every paint role of a cell in one data() call
+MULTIPLE_ROLES = Qt.UserRole + 1
+
+# Fields that decide which data set (Nyckelkort or Standard & System-nycklar) is shown
+NYCKELKORT_KEYS = ('key_code', 'series_id', 'key_profile', 'key_location', 'fabrikat', 'koncept')
+STANDARD_KEYS = ('key_code2', 'system_number', 'profile2', 'delning', 'key_location2', 'fabrikat2', 'koncept2')
+_SMART_CACHE_KEY = '_smart_cache'
+
+
+def get_smart_display_data(system_data):
+    """Smart logic to choose between Nyckelkort and Standard & System-nycklar data for display"""
+    # Reuse the previous result while none of the deciding fields have changed
+    values = tuple(system_data.get(k) for k in NYCKELKORT_KEYS + STANDARD_KEYS)
+    cached = system_data.get(_SMART_CACHE_KEY)
+    if cached and cached[0] == values:
+        return cached[1]
+    
+    # Check if Nyckelkort data exists
+    nyckelkort_has_data = any((system_data.get(k) or '').strip() for k in NYCKELKORT_KEYS)
+    
+    # Check if Standard & System-nycklar data exists
+    standard_has_data = any((system_data.get(k) or '').strip() for k in STANDARD_KEYS)
+    
+    # Smart key_location logic: prioritize nyckelplats, fallback to nyckelplats 2
+    smart_key_location = (system_data.get('key_location') or '').strip()
+    if not smart_key_location:
+        smart_key_location = (system_data.get('key_location2') or '').strip()
+    
+    # Return the appropriate data set for display
+    if nyckelkort_has_data:
+        result = {
+            'key_code': system_data.get('key_code', ''),
+            'series_id': system_data.get('series_id', ''),
+            'key_profile': system_data.get('key_profile', ''),
+            'key_location': smart_key_location,  # Use smart key_location
+            'fabrikat': system_data.get('fabrikat', ''),
+            'koncept': system_data.get('koncept', ''),
+            'data_source': 'nyckelkort'
+        }
+    elif standard_has_data:
+        result = {
+            'key_code': system_data.get('key_code2', ''),  # Map key_code2 -> key_code
+            'series_id': system_data.get('system_number', ''),  # Map system_number -> series_id
+            'key_profile': system_data.get('profile2', ''),  # Map profile2 -> key_profile
+            'key_location': smart_key_location,  # Use smart key_location
+            'fabrikat': system_data.get('fabrikat2', ''),  # Map fabrikat2 -> fabrikat
+            'koncept': system_data.get('koncept2', ''),  # Map koncept2 -> koncept
+            'data_source': 'standard'
+        }
+    else:
+        # No data in either, return empty
+        result = {
+            'key_code': '',
+            'series_id': '',
+            'key_profile': '',
+            'key_location': smart_key_location,  # Use smart key_location
+            'fabrikat': '',
+            'koncept': '',
+            'data_source': 'none'
+        }
+    
+    system_data[_SMART_CACHE_KEY] = (values, result)
+    return result
+
+
 class CreateKeyDialog(QDialog):
     """Dialog for creating key manufacturing order"""
     
@@ -109,64 +356,7 @@ class CreateKeyDialog(QDialog):
     
     def get_smart_display_data(self, system_data):
         """Smart logic to choose between Nyckelkort and Standard & System-nycklar data for display"""
-        # Check if Nyckelkort data exists
-        nyckelkort_has_data = (
-            system_data.get('key_code', '').strip() or
-            system_data.get('series_id', '').strip() or
-            system_data.get('key_profile', '').strip() or
-            system_data.get('key_location', '').strip() or
-            system_data.get('fabrikat', '').strip() or
-            system_data.get('koncept', '').strip()
-        )
-        
-        # Check if Standard & System-nycklar data exists
-        standard_has_data = (
-            system_data.get('key_code2', '').strip() or
-            system_data.get('system_number', '').strip() or
-            system_data.get('profile2', '').strip() or
-            system_data.get('delning', '').strip() or
-            system_data.get('key_location2', '').strip() or
-            system_data.get('fabrikat2', '').strip() or
-            system_data.get('koncept2', '').strip()
-        )
-        
-        # Smart key_location logic: prioritize nyckelplats, fallback to nyckelplats 2
-        smart_key_location = system_data.get('key_location', '').strip()
-        if not smart_key_location:
-            smart_key_location = system_data.get('key_location2', '').strip()
-        
-        # Return the appropriate data set for display
-        if nyckelkort_has_data:
-            return {
-                'key_code': system_data.get('key_code', ''),
-                'series_id': system_data.get('series_id', ''),
-                'key_profile': system_data.get('key_profile', ''),
-                'key_location': smart_key_location,  # Use smart key_location
-                'fabrikat': system_data.get('fabrikat', ''),
-                'koncept': system_data.get('koncept', ''),
-                'data_source': 'nyckelkort'
-            }
-        elif standard_has_data:
-            return {
-                'key_code': system_data.get('key_code2', ''),  # Map key_code2 -> key_code
-                'series_id': system_data.get('system_number', ''),  # Map system_number -> series_id
-                'key_profile': system_data.get('profile2', ''),  # Map profile2 -> key_profile
-                'key_location': smart_key_location,  # Use smart key_location
-                'fabrikat': system_data.get('fabrikat2', ''),  # Map fabrikat2 -> fabrikat
-                'koncept': system_data.get('koncept2', ''),  # Map koncept2 -> koncept
-                'data_source': 'standard'
-            }
-        else:
-            # No data in either, return empty
-            return {
-                'key_code': '',
-                'series_id': '',
-                'key_profile': '',
-                'key_location': smart_key_location,  # Use smart key_location
-                'fabrikat': '',
-                'koncept': '',
-                'data_source': 'none'
-            }
+        return get_smart_display_data(system_data)
     
     def get_order_data(self):
         """Get order data from dialog"""
@@ -177,325 +367,245 @@ class CreateKeyDialog(QDialog):
             'create_receipt': self.create_receipt_cb.isChecked()
         }
 
-class MySystemsWindow(QWidget):
-    """Window for viewing and managing existing systems"""
-    
-    navigate_home = Signal()
-    navigate_to_home = Signal()
-    navigate_to_orders = Signal()
-    order_created = Signal()
-    
-    def __init__(self, app_manager, db_manager, translation_manager):
-        super().__init__()
-        self.app_manager = app_manager
-        self.db_manager = db_manager
-        self.translation_manager = translation_manager
-        
-        self.setup_ui()
-        self.refresh_data()
-    
-    def setup_ui(self):
-        """Setup my systems UI"""
-        layout = QVBoxLayout(self)
-        layout.setSpacing(20)
-        
-        # Title
-        title = QLabel(self.translation_manager.get_text("my_systems"))
-        title.setProperty("class", "title")
-        layout.addWidget(title)
-        
-        # Search section - styled to match orders window dropdowns
-        search_group = QGroupBox("Filter")
-        search_group.setMaximumWidth(700)  # Wider to hold extra filters
-        search_layout = QHBoxLayout(search_group)
-        search_layout.setSpacing(15)
-        search_layout.setContentsMargins(15, 15, 15, 15)  # Add margins to center content
-        search_layout.setAlignment(Qt.AlignVCenter)  # Center vertically
-        
-        # Use global styling - no local overrides
-        
-        search_label = QLabel("Sök:")
-        search_label.setProperty("kb_label_type", "caption")
-        from .styles import KeyBuddyLineEdit, FieldType
-        
-        cancel_btn = QPushButton("Avbryt")
-        cancel_btn.clicked.connect(self.reject)
-        self.apply_logout_button_style(cancel_btn)
-        
-        button_layout.addStretch()
-        button_layout.addWidget(cancel_btn)
-        button_layout.addWidget(save_btn)
-        
-        layout.addLayout(button_layout)
-    
-    def populate_fabrikat_combo(self):
-        try:
-            self.fabrikat_combo.clear()
-            self.fabrikat_combo.addItem("Välj fabrikat...")
-            rows = self.db_manager.execute_query("SELECT DISTINCT fabrikat FROM key_catalog ORDER BY fabrikat")
-            for r in rows:
-                val = r[0] if isinstance(r, (list, tuple)) else r['fabrikat']
-                if val:
-                    self.fabrikat_combo.addItem(str(val))
-        except Exception:
-            pass
+class SystemsTableModel(QAbstractTableModel):
+    """Table model for the systems list, backed by plain Python rows"""
 
-    def on_fabrikat_changed(self, fabrikat):
-        """Load concepts for selected Fabrikat"""
-        try:
-            self.koncept_combo.clear()
-            self.koncept_combo.addItem("Välj koncept...")
-            self.koncept_combo.setEnabled(False)
-            if not fabrikat or fabrikat == "Välj fabrikat...":
-                return
-            rows = self.db_manager.execute_query(
-                "SELECT koncept FROM key_catalog WHERE fabrikat = ? ORDER BY koncept", (fabrikat,)
-            )
-            for r in rows:
-                val = r[0] if isinstance(r, (list, tuple)) else r['koncept']
-                if val:
-                    self.koncept_combo.addItem(str(val))
-            self.koncept_combo.setEnabled(self.koncept_combo.count() > 1)
-        except Exception:
-            pass
-    
-    def apply_logout_button_style(self, button):
-        """Apply small button style - DEPRECATED, use ButtonType.SMALL instead"""
-        button.setProperty("kb_button_type", "small")
-    
-    def load_data(self):
-        """Load system data into form"""
-        # Get complete customer data
-        customer_query = """SELECT company, project, customer_number, org_number, address,
-                           postal_code, postal_address, phone, mobile_phone, email, website,
-                           key_responsible_1, key_responsible_2, key_responsible_3, key_location
-                           FROM customers WHERE id = ?"""
-        customer_result = self.db_manager.execute_query(customer_query, (self.system_data['customer_id'],))
-        
-        if customer_result:
-            customer_data = customer_result[0]
-            self.company_edit.setText(customer_data[0] or '')
-            self.project_edit.setText(customer_data[1] or '')
-            self.customer_number_edit.setText(customer_data[2] or '')
-            self.org_number_edit.setText(customer_data[3] or '')
-            self.address_edit.setText(customer_data[4] or '')
-            self.postal_code_edit.setText(customer_data[5] or '')
-            self.postal_address_edit.setText(customer_data[6] or '')
-            self.phone_edit.setText(customer_data[7] or '')
-            self.mobile_phone_edit.setText(customer_data[8] or '')
-            self.email_edit.setText(customer_data[9] or '')
-            self.website_edit.setText(customer_data[10] or '')
-            self.key_responsible_1_edit.setText(customer_data[11] or '')
-            self.key_responsible_2_edit.setText(customer_data[12] or '')
-            self.key_responsible_3_edit.setText(customer_data[13] or '')
-            self.key_location_edit.setText(customer_data[14] or '')
-        
-        # Load system data
-        self.key_code_edit.setText(self.system_data.get('key_code', '') or '')
-        self.key_profile_edit.setText(self.system_data.get('key_profile', '') or '')
-        self.series_id_edit.setText(self.system_data.get('series_id', '') or '')
-        
-        # Load fabrikat/koncept from existing system
-        try:
-            fab = self.system_data.get('fabrikat', '') or ""
-            self.fabrikat_combo.setCurrentText(fab if fab else "Välj fabrikat...")
-            # Populate koncept for selected fabrikat
-            self.on_fabrikat_changed(self.fabrikat_combo.currentText())
-            ktxt = self.system_data.get('koncept', '') or ""
-            if ktxt:
-                idx = self.koncept_combo.findText(ktxt)
-                if idx >= 0:
-                    self.koncept_combo.setCurrentIndex(idx)
-        except Exception:
-            pass
-        
-        # Load billing fields from DB
-        try:
-            ks = self.db_manager.execute_query(
-                """
-                SELECT billing_plan, price_one_time, price_monthly, price_half_year, price_yearly
-                FROM key_systems WHERE id = ?
-                """,
-                (self.system_data['id'],)
-            )
-            if ks:
-                billing_plan = ks[0][0]
-                # Set plan
-                if billing_plan:
-                    idx = self.billing_plan_combo.findText(billing_plan)
-                    if idx >= 0:
-                        self.billing_plan_combo.setCurrentIndex(idx)
-                # Prices
-                def _fmt(v):
-                    try:
-                        return ("%g" % float(v)) if v is not None else ""
-                    except Exception:
-                        return ""
-                self.price_one_time_edit.setText(_fmt(ks[0][1]))
-                self.price_monthly_edit.setText(_fmt(ks[0][2]))
-                self.price_half_year_edit.setText(_fmt(ks[0][3]))
-                self.price_yearly_edit.setText(_fmt(ks[0][4]))
-        except Exception:
-            pass
-        
-        # Load notes
-        try:
-            notes = self.system_data.get('notes', '') or ''
-            self.notes_edit.setText(notes)
-        except Exception:
-            pass
-        
-        # Always refresh from DB to ensure all dependent fields (like next due date) are recalculated
+    HEADERS = [
+        "ID", "Företag", "Projekt", "Nyckelkod", "Profil",
+        "Serie-ID", "Löpnr", "Nyckelansvarig", "Faktura", "Nästa förfallodatum", "Skapad"
+    ]
+    FAKTURA_COLUMN = 8
+    # Search only in Företag (1), Projekt (2), Nyckelkod (3), Profil (4), Nyckelansvarig (7)
+    SEARCH_COLUMNS = (1, 2, 3, 4, 7)
+    PAID_BACKGROUND = QColor(198, 239, 206)
+    PAID_FOREGROUND = QColor(0, 97, 0)
+    UNPAID_BACKGROUND = QColor(255, 199, 206)
+    UNPAID_FOREGROUND = QColor(156, 0, 6)
+    ALIGNMENT = Qt.AlignLeft | Qt.AlignVCenter
+    # Rows handed to the view per fetchMore call
+    FETCH_BATCH = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._rows_lower = []
+        self._systems = []
+        self._id_to_row = {}
+        self._loaded = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        take = min(self.FETCH_BATCH, len(self._rows) - self._loaded)
+        if take <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + take - 1)
+        self._loaded += take
+        self.endInsertRows()
+
+    def fetch_all(self):
+        """Hand every remaining row to the view (needed before filtering or sorting)"""
+        if self._loaded < len(self._rows):
+            self.beginInsertRows(QModelIndex(), self._loaded, len(self._rows) - 1)
+            self._loaded = len(self._rows)
+            self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+        if role == MULTIPLE_ROLES:
+            bundle = {Qt.DisplayRole: self._rows[row][col], Qt.TextAlignmentRole: self.ALIGNMENT}
+            if col == self.FAKTURA_COLUMN:
+                paid = self._systems[row].get('is_paid')
+                bundle[Qt.BackgroundRole] = self.PAID_BACKGROUND if paid else self.UNPAID_BACKGROUND
+                bundle[Qt.ForegroundRole] = self.PAID_FOREGROUND if paid else self.UNPAID_FOREGROUND
+            return bundle
+        if role == Qt.DisplayRole:
+            return self._rows[row][col]
+        if role == Qt.UserRole:
+            return self._systems[row]
+        if role == Qt.TextAlignmentRole:
+            return int(self.ALIGNMENT)
+        if col == self.FAKTURA_COLUMN:
+            paid = self._systems[row].get('is_paid')
+            if role == Qt.BackgroundRole:
+                return self.PAID_BACKGROUND if paid else self.UNPAID_BACKGROUND
+            if role == Qt.ForegroundRole:
+                return self.PAID_FOREGROUND if paid else self.UNPAID_FOREGROUND
+            if role == Qt.ToolTipRole:
+                return self._faktura_tooltip(row)
+        elif col == 1 and role == Qt.ToolTipRole:
+            # Hint right-click options on the company cell
+            return "Högerklicka för flera val"
+        return None
+
+    @classmethod
+    def prepare(cls, systems):
+        """Build display and search rows for system dicts; pure Python, safe off the UI thread"""
+        systems = list(systems)
+        rows = [cls._build_row(system) for system in systems]
+        return systems, rows, [cls._search_text(row) for row in rows]
+
+    def set_systems(self, systems, prepared=None):
+        """Replace all rows with the given system dicts (or the result of prepare())"""
+        if prepared is None:
+            prepared = self.prepare(systems)
+        self.beginResetModel()
+        self._systems, self._rows, self._rows_lower = prepared
+        self._id_to_row = {system['id']: row for row, system in enumerate(self._systems)}
+        self._loaded = min(self.FETCH_BATCH, len(self._rows))
+        self.endResetModel()
+
+    def system_at(self, row):
+        """Return the system dict stored for a source row"""
+        if 0 <= row < len(self._systems):
+            return self._systems[row]
+        return None
+
+    def update_system(self, row, system):
+        """Rebuild a single row after its system dict changed"""
+        self._systems[row] = system
+        self._rows[row] = self._build_row(system)
+        self._rows_lower[row] = self._search_text(self._rows[row])
+        if row < self._loaded:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def update_systems(self, changes):
+        """Rebuild several (row, system) pairs and announce them with one dataChanged"""
+        rows = []
+        for row, system in changes:
+            self._systems[row] = system
+            self._rows[row] = self._build_row(system)
+            self._rows_lower[row] = self._search_text(self._rows[row])
+            if row < self._loaded:
+                rows.append(row)
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), len(self.HEADERS) - 1))
+
+    def update_row_by_id(self, system_id, system):
+        """Update the row for a system id in place; returns False if it is not loaded"""
+        row = self._id_to_row.get(system_id)
+        if row is None:
+            return False
+        self.update_system(row, system)
+        return True
+
+    @classmethod
+    def _build_row(cls, system):
+        smart_data = get_smart_display_data(system)
+        return (
+            str(system['id']),
+            system['company'] or '',
+            system['project'] or '',
+            smart_data.get('key_code', '') or '',
+            smart_data.get('key_profile', '') or '',
+            smart_data.get('series_id', '') or '',
+            str(system['last_sequence_number'] or 0),
+            system['key_responsible_1'] or '',
+            STATUS_PAID if system.get('is_paid') else STATUS_UNPAID,
+            cls._next_due_text(system),
+            system['created_date'] or '',
+        )
+
+    @classmethod
+    def _search_text(cls, row):
+        return "\x1f".join(row[col] for col in cls.SEARCH_COLUMNS).lower()
+
+    @staticmethod
+    def _next_due_text(system):
         try:
-            current_id = None
-            row = self.systems_table.currentRow()
-            if row >= 0:
-                id_item = self.systems_table.item(row, 0)
-                if id_item:
-                    current_id = id_item.text()
-            self.refresh_data()
-            # Reselect the same system if possible
-            if current_id:
-                for r in range(self.systems_table.rowCount()):
-                    it = self.systems_table.item(r, 0)
-                    if it and it.text() == current_id:
-                        self.systems_table.selectRow(r)
-                        break
+            add_days = _BILLING_DAYS.get((system.get('billing_plan') or '').lower())
+            paid_at = system.get('paid_at')
+            if paid_at and add_days:
+                paid_dt = datetime.fromisoformat(paid_at) if isinstance(paid_at, str) else paid_at
+                return (paid_dt + timedelta(days=add_days)).strftime('%Y-%m-%d')
         except Exception:
             pass
-    
-    def save_changes(self):
-        """Save changes to database with comprehensive validation"""
-        try:
-            # Validate all fields with strict requirements
-            errors = []
-            
-            # Required fields
-            if not self.company_edit.text().strip():
-                errors.append("Företag är obligatoriskt")
-            
-            if not self.mobile_phone_edit.text().strip():
-                errors.append("Mobiltelefon är obligatoriskt")
-            
-            if not self.email_edit.text().strip():
-                errors.append("E-post är obligatoriskt")
-            
-            if not self.key_responsible_1_edit.text().strip():
-                errors.append("Nyckelansvarig 1 är obligatoriskt")
-            
-            # Nyckelkod validation - must be exactly 7 digits
-            key_code = self.key_code_edit.text().strip()
-            if not key_code:
-                errors.append("Nyckelkod är obligatoriskt")
-            elif not key_code.isdigit():
-                errors.append("Nyckelkod får endast innehålla siffror")
-            elif len(key_code) != 7:
-                errors.append("Nyckelkod måste vara exakt 7 siffror")
-            
-            # Nyckelprofil validation - must be 1-3 digits
-            key_profile = self.key_profile_edit.text().strip()
-            if not key_profile:
-                errors.append("Nyckelprofil är obligatoriskt")
-            elif not key_profile.isdigit():
-                errors.append("Nyckelprofil får endast innehålla siffror")
-            elif len(key_profile) < 1 or len(key_profile) > 3:
-                errors.append("Nyckelprofil måste vara 1-3 siffror")
-            
-            # Serie-ID validation - optional but if provided must be exactly 3 digits
-            series_id = self.series_id_edit.text().strip()
-            if series_id:  # Only validate if provided
-                if not series_id.isdigit():
-                    errors.append("Serie-ID får endast innehålla siffror")
-                elif len(series_id) != 3:
-                    errors.append("Serie-ID måste vara exakt 3 siffror")
-            
-            # Email validation - more thorough
-            email = self.email_edit.text().strip()
-            if email:
-                import re
-                email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-                if not re.match(email_pattern, email):
-                    errors.append("Ogiltig e-postadress")
-            
-            # Show all errors at once
-            if errors:
-                CopyableMessageBox.warning(
-                    self, 
-                    "Valideringsfel", 
-                    "\n".join(errors)
-                )
-                return
-            
-            # Update customer data with all fields
-            self.db_manager.execute_update(
-                """UPDATE customers SET 
-                   company = ?, project = ?, customer_number = ?, org_number = ?, 
-                   address = ?, postal_code = ?, postal_address = ?, phone = ?, 
-                   mobile_phone = ?, email = ?, website = ?, key_responsible_1 = ?, 
-                   key_responsible_2 = ?, key_responsible_3 = ?, key_location = ?
-                   WHERE id = ?""",
-                (
-                    self.company_edit.text().strip(),
-                    self.project_edit.text().strip(),
-                    self.customer_number_edit.text().strip(),
-                    self.org_number_edit.text().strip(),
-                    self.address_edit.text().strip(),
-                    self.postal_code_edit.text().strip(),
-                    self.postal_address_edit.text().strip(),
-                    self.phone_edit.text().strip(),
-                    self.mobile_phone_edit.text().strip(),
-                    self.email_edit.text().strip(),
-                    self.website_edit.text().strip(),
-                    self.key_responsible_1_edit.text().strip(),
-                    self.key_responsible_2_edit.text().strip(),
-                    self.key_responsible_3_edit.text().strip(),
-                    self.key_location_edit.text().strip(),
-                    self.system_data['customer_id']
-                )
-            )
-            
-            # Parse billing values
-            billing_plan = self.billing_plan_combo.currentText()
-            if billing_plan == "Välj plan...":
-                billing_plan = None
-            def _p(txt):
-                try:
-                    t = txt.strip()
-                    return float(t) if t else None
-                except Exception:
-                    return None
-            p_one = _p(self.price_one_time_edit.text())
-            p_month = _p(self.price_monthly_edit.text())
-            p_half = _p(self.price_half_year_edit.text())
-            p_year = _p(self.price_yearly_edit.text())
+        return ""
+
+    def _faktura_tooltip(self, row):
+        system = self._systems[row]
+        paid_at = system.get('paid_at')
+        if isinstance(paid_at, str):
+            paid_at_txt = paid_at[:16].replace('T', ' ')
+        else:
+            paid_at_txt = str(paid_at) if paid_at else ''
+        # Next due date comes from the display row instead of re-parsing paid_at
+        return _FAKTURA_TOOLTIP.format(
+            plan=system.get('billing_plan') or '',
+            paid=paid_at_txt or '-',
+            due=self._rows[row][9] or '-',
+            count=system.get('invoice_count', 0),
+        )
+
+
+class FastDelegate(QStyledItemDelegate):
+    """Item delegate that fills the style option from a single MULTIPLE_ROLES lookup"""
+
+    def initStyleOption(self, option, index):
+        bundle = index.data(MULTIPLE_ROLES)
+        if not bundle:
+            super().initStyleOption(option, index)
+            return
+        option.index = index
+        option.text = bundle[Qt.DisplayRole]
+        option.features |= QStyleOptionViewItem.HasDisplay
+        option.displayAlignment = bundle[Qt.TextAlignmentRole]
+        background = bundle.get(Qt.BackgroundRole)
+        if background is not None:
+            option.backgroundBrush = QBrush(background)
+        foreground = bundle.get(Qt.ForegroundRole)
+        if foreground is not None:
+            option.palette.setBrush(QPalette.Text, QBrush(foreground))
+
+
+class SystemsFilterProxy(QSortFilterProxyModel):
+    """Sort/filter proxy for the search text and Faktura status filter"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+        self._status = ""
+
+    def set_needle(self, text):
+        needle = text.lower()
+        if needle != self._needle:
+            self._needle = needle
+            self.invalidateFilter()
+
+    def set_status(self, status_text):
+        status = status_text.lower() if status_text in (STATUS_PAID, STATUS_UNPAID) else ""
+        if status != self._status:
+            self._status = status
+            self.invalidateFilter()
+
+    def is_filtering(self):
+        return bool(self._needle or self._status)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        if self._needle and self._needle not in model._rows_lower[source_row]:
+            return False
+        if self._status and model._rows[source_row][model.FAKTURA_COLUMN].lower() != self._status:
+            return False
+        return True
 
-            # Update key system data including billing and notes
-            self.db_manager.execute_update(
-                """UPDATE key_systems SET 
-                   key_code = ?, key_profile = ?, series_id = ?, fabrikat = ?, koncept = ?, last_sequence_number = ?,
-                   billing_plan = ?, price_one_time = ?, price_monthly = ?, price_half_year = ?, price_yearly = ?, notes = ?
-                   WHERE id = ?""",
-                (
-                    self.key_code_edit.text().strip(),
-                    self.key_profile_edit.text().strip(), 
-                    self.series_id_edit.text().strip(),
-                    self.fabrikat_combo.currentText().strip() if self.fabrikat_combo.currentText() != "Välj fabrikat..." else "",
-                    self.koncept_combo.currentText().strip() if self.koncept_combo.currentText() != "Välj koncept..." else "",
-                    self.last_seq_spin.value(),
-                    billing_plan, p_one, p_month, p_half, p_year,
-                    (self.notes_edit.toPlainText().strip() if hasattr(self, 'notes_edit') else ""),
-                    self.system_data['id']
-                )
-            )
-            
-            self.accept()
-            
-        except Exception as e:
-            CopyableMessageBox.critical(
-                self,
-                "Databasfel",
-                f"Kunde inte spara ändringar: {str(e)}"
-            )
 
 class MySystemsWindow(QWidget):
     """Window for viewing and managing existing systems"""
@@ -504,6 +614,14 @@ class MySystemsWindow(QWidget):
     navigate_to_home = Signal()
     navigate_to_orders = Signal()
     order_created = Signal()
+    # (generation, prepared rows, error) from the background systems load
+    systems_loaded = Signal(object)
+    # (system_data, order_data, order_id, customer, pdf_path) from the background order PDF build
+    order_pdf_ready = Signal(object)
+    # (pdf_path, error) from the background receipt build
+    receipt_ready = Signal(object)
+    # (recipient, error) from the background invoice mail send
+    invoice_mail_done = Signal(object)
     
     def __init__(self, app_manager, db_manager, translation_manager):
         super().__init__()
@@ -511,9 +629,63 @@ class MySystemsWindow(QWidget):
         self.db_manager = db_manager
         self.translation_manager = translation_manager
         
+        # Background refresh latch: one load in flight, at most one queued behind it
+        self._refresh_running = False
+        self._refresh_pending = False
+        self._refresh_generation = 0
+        # At most one orders prefetch on the thread pool at a time
+        self._orders_prefetch_running = False
+        self.systems_loaded.connect(self._on_systems_loaded)
+        self.order_pdf_ready.connect(self._on_order_pdf_ready)
+        self.receipt_ready.connect(self._on_receipt_ready)
+        self.invoice_mail_done.connect(self._on_invoice_mail_done)
+        # Customer rows by id; cleared on every refresh and after edits
+        self._customer_cache = functools.lru_cache(maxsize=128)(self._fetch_customer)
+        # One PDF generator (and its ReportLab stylesheet) for every export from this window
+        self._pdf_gen = OrderPDFGenerator()
+        # Resolved logo path (None if the file is missing); re-checked after a logo change
+        self._logo_path = None
+        self._logo_checked = False
+        self.app_manager.logo_changed.connect(self._invalidate_logo_cache)
+        # system_id -> plaintext path of its newest invoice PDF (most recent last)
+        self._pdf_cache = OrderedDict()
+        
         self.setup_ui()
         self.refresh_data()
     
+    def showEvent(self, event):
+        """Warm the orders list while the user is here; Visa Ordrar is the usual next step"""
+        super().showEvent(event)
+        self._prefetch_orders()
+    
+    def _prefetch_orders(self):
+        """Run today's default orders query on the thread pool and stash it on app_manager"""
+        if self._orders_prefetch_running:
+            return
+        today = date.today().isoformat()
+        query, params = build_orders_query(today, today)
+        app_manager = self.app_manager
+        db_manager = self.db_manager
+        generation = app_manager.orders_generation
+        stash = app_manager.prefetched_orders
+        if (stash and stash[0] == (query, params) and stash[3] == generation
+                and time.monotonic() - stash[1] < ORDERS_PREFETCH_TTL):
+            return
+        self._orders_prefetch_running = True
+        
+        def run():
+            try:
+                rows = db_manager.execute_query(query, params)
+                # An order saved meanwhile makes these rows stale; OrdersWindow re-checks the generation too
+                if app_manager.orders_generation == generation:
+                    app_manager.prefetched_orders = ((query, params), time.monotonic(), rows, generation)
+            except Exception as e:
+                print(f"Orders prefetch error: {e}")
+            finally:
+                self._orders_prefetch_running = False
+        
+        QThreadPool.globalInstance().start(run)
+    
     def setup_ui(self):
         """Setup my systems UI"""
         layout = QVBoxLayout(self)
@@ -536,20 +708,17 @@ class MySystemsWindow(QWidget):
         
         search_label = QLabel("Sök:")
         search_label.setProperty("kb_label_type", "caption")
-        from .styles import KeyBuddyLineEdit, FieldType
         self.search_edit = KeyBuddyLineEdit(FieldType.STANDARD, "Sök företag, projekt, nyckelkod, profil, ansvarig...")
         # Now uses EXACT same class and styling as all other input fields
         # Search field styling handled by global CSS
-        self.search_edit.textChanged.connect(self.filter_systems)
 
         # Invoice status filter (Alla/Betald/Obetald)
         status_label = QLabel("Faktura:")
         status_label.setProperty("kb_label_type", "caption")
         self.invoice_status_combo = QComboBox()
-        self.invoice_status_combo.addItems(["Alla", "Betald", "Obetald"]) 
+        self.invoice_status_combo.addItems(["Alla", STATUS_PAID, STATUS_UNPAID]) 
         self.invoice_status_combo.setMinimumWidth(120)
         # Combo styling handled by global CSS
-        self.invoice_status_combo.currentTextChanged.connect(self.filter_systems)
 
         # Add widgets to horizontal layout - no filter button needed
         search_layout.addWidget(search_label)
@@ -561,11 +730,19 @@ class MySystemsWindow(QWidget):
         layout.addWidget(search_group)
         
         # Systems table
-        self.systems_table = QTableWidget()
+        self.systems_table = QTableView()
         self.systems_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # Disable editing
         self.setup_table()
         layout.addWidget(self.systems_table)
         
+        # Filtering runs in the proxy model; coalesce rapid keystrokes into one pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(60)
+        self._filter_timer.timeout.connect(self._do_filter)
+        self.search_edit.textChanged.connect(self._filter_timer.start)
+        self.invoice_status_combo.currentTextChanged.connect(self._filter_timer.start)
+        
         # Info label
         self.info_label = QLabel()
         layout.addWidget(self.info_label)
@@ -607,13 +784,11 @@ class MySystemsWindow(QWidget):
     
     def setup_table(self):
         """Setup systems table"""
-        headers = [
-            "ID", "Företag", "Projekt", "Nyckelkod", "Profil", 
-            "Serie-ID", "Löpnr", "Nyckelansvarig", "Faktura", "Nästa förfallodatum", "Skapad"
-        ]
-        
-        self.systems_table.setColumnCount(len(headers))
-        self.systems_table.setHorizontalHeaderLabels(headers)
+        self.systems_model = SystemsTableModel(self)
+        self.systems_proxy = SystemsFilterProxy(self)
+        self.systems_proxy.setSourceModel(self.systems_model)
+        self.systems_table.setModel(self.systems_proxy)
+        self.systems_table.setItemDelegate(FastDelegate(self.systems_table))
         
         # Set column widths
         header = self.systems_table.horizontalHeader()
@@ -628,6 +803,8 @@ class MySystemsWindow(QWidget):
         header.setSectionResizeMode(8, QHeaderView.ResizeToContents)  # Faktura
         header.setSectionResizeMode(9, QHeaderView.ResizeToContents)  # Nästa förfallodatum
         header.setSectionResizeMode(10, QHeaderView.ResizeToContents)  # Skapad
+        # Rows keep the style's default height; never measure them per row
+        self.systems_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         # Make Löpnr narrow to ~5 digits
         try:
             self.systems_table.setColumnWidth(6, 60)
@@ -639,6 +816,11 @@ class MySystemsWindow(QWidget):
         except Exception:
             pass
         
+        # Rows are fetched in batches while scrolling; start in query order (newest first)
+        self.systems_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        header.setSortIndicator(-1, Qt.AscendingOrder)
+        header.sortIndicatorChanged.connect(self._on_sort_indicator_changed)
+        
         # Enable sorting and selection (single selection only)
         try:
             self.systems_table.setSortingEnabled(True)
@@ -646,14 +828,14 @@ class MySystemsWindow(QWidget):
             pass
         
         # Enable selection (single selection only)
-        self.systems_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.systems_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.systems_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.systems_table.setSelectionMode(QAbstractItemView.SingleSelection)
         
         # Connect table selection change to enable/disable buttons
-        self.systems_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.systems_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         
         # Connect selection change to enable edit button
-        self.systems_table.itemSelectionChanged.connect(self.update_edit_button_state)
+        self.systems_table.selectionModel().selectionChanged.connect(self.update_edit_button_state)
 
         # Do not use double-click behavior; rely on context menu only
         # Right-click context menu for Faktura column
@@ -662,116 +844,118 @@ class MySystemsWindow(QWidget):
             self.systems_table.customContextMenuRequested.connect(self.on_systems_context_menu)
         except Exception:
             pass
+        self.setup_context_menus()
+
+    def _create_context_menu(self, parent=None):
+        """Create a styled context menu; built once and reused on every right-click"""
+        menu = QMenu(parent or self)
+        menu.setObjectName("newDropdownMenu")  # Use new styling
+        # Make menu frameless/translucent so rounded corners render on Windows
+        try:
+            menu.setWindowFlags(menu.windowFlags() | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
+            menu.setAttribute(Qt.WA_TranslucentBackground, True)
+        except Exception:
+            pass
+        return menu
+
+    def setup_context_menus(self):
+        """Build the Faktura and company column menus; actions act on the current row"""
+        # Faktura menu
+        self._faktura_menu = self._create_context_menu()
+        self._faktura_menu.addAction("Visa faktura").triggered.connect(self.view_invoice_stub)
+        self._faktura_menu.addAction("Maila faktura").triggered.connect(self.email_invoice_stub)
+        self._faktura_menu.addAction("Skapa faktura").triggered.connect(self.create_invoice_stub)
+        self._faktura_menu.addAction("Skriv ut faktura")
+        self._faktura_menu.addAction("Fakturahistorik").triggered.connect(self.show_selected_invoice_history)
+        self._faktura_menu.addSeparator()
+        self._faktura_menu.addAction("Sätt betald").triggered.connect(lambda: self.set_selected_invoice_status(True))
+        self._faktura_menu.addAction("Sätt obetald").triggered.connect(lambda: self.set_selected_invoice_status(False))
+        
+        # Company column menu
+        self._company_menu = self._create_context_menu()
+        self._company_menu.addAction("Redigera").triggered.connect(self.edit_selected_system)
+        self._company_menu.addAction("Återlämna Nyckelbricka").triggered.connect(self.return_key_fob)
+        self._company_menu.addAction("Tillverka nyckel").triggered.connect(self.create_key_order)
 
     def on_systems_context_menu(self, point):
         try:
             index = self.systems_table.indexAt(point)
             if not index.isValid():
                 return
-            row = index.row(); col = index.column()
-            menu = QMenu(self)
-            menu.setObjectName("newDropdownMenu")  # Use new styling
-            # Make menu frameless/translucent so rounded corners render on Windows
-            try:
-                menu.setWindowFlags(menu.windowFlags() | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
-                menu.setAttribute(Qt.WA_TranslucentBackground, True)
-            except Exception:
-                pass
             # Use global menu styling instead of inline styles
-            if col == 8:
-                # Faktura menu
-                act_view = menu.addAction("Visa faktura")
-                act_email = menu.addAction("Maila faktura")
-                act_create = menu.addAction("Skapa faktura")
-                act_print = menu.addAction("Skriv ut faktura")
-                act_hist = menu.addAction("Fakturahistorik")
-                menu.addSeparator()
-                act_paid = menu.addAction("Sätt betald")
-                act_unpaid = menu.addAction("Sätt obetald")
-                chosen = menu.exec(self.systems_table.viewport().mapToGlobal(point))
-                if chosen == act_view:
-                    self.view_invoice_stub()
-                elif chosen == act_email:
-                    self.email_invoice_stub()
-                elif chosen == act_create:
-                    self.create_invoice_stub()
-                elif chosen == act_hist:
-                    id_item = self.systems_table.item(row, 0)
-                    if id_item:
-                        self.show_invoice_history(int(id_item.text()))
-                elif chosen == act_paid:
-                    self.set_selected_invoice_status(True)
-                elif chosen == act_unpaid:
-                    self.set_selected_invoice_status(False)
-            elif col == 1:
-                # Company column menu
-                act_edit = menu.addAction("Redigera")
-                act_return = menu.addAction("Återlämna Nyckelbricka")
-                act_make = menu.addAction("Tillverka nyckel")
-                chosen = menu.exec(self.systems_table.viewport().mapToGlobal(point))
-                if chosen == act_edit:
-                    self.edit_selected_system()
-                elif chosen == act_return:
-                    self.return_key_fob()
-                elif chosen == act_make:
-                    self.create_key_order()
+            if index.column() == 8:
+                menu = self._faktura_menu
+            elif index.column() == 1:
+                menu = self._company_menu
+            else:
+                return
+            self.systems_table.setCurrentIndex(index)
+            menu.exec(self.systems_table.viewport().mapToGlobal(point))
         except Exception:
             pass
+
+    def show_selected_invoice_history(self):
+        system = self._get_selected_system()
+        if system:
+            self.show_invoice_history(int(system['id']))
     
     def refresh_data(self):
-        """Refresh systems data from database"""
+        """Refresh systems data from database (the SQL runs on the thread pool)"""
+        self._customer_cache.cache_clear()
+        if self._refresh_running:
+            self._refresh_pending = True
+            return
+        self._refresh_running = True
+        generation = self._refresh_generation
+        db_manager = self.db_manager
+        loaded = self.systems_loaded
+        to_system_dict = self._to_system_dict
+        
+        def run():
+            prepared, error = None, None
+            expire_paid_statuses(db_manager)
+            try:
+                # Get systems with customer data including all fields for smart data selection
+                rows = db_manager.execute_query(_SYSTEMS_LIST_QUERY + " ORDER BY ks.created_at DESC")
+                # Build dicts and display rows here too; the UI thread only resets the model
+                prepared = SystemsTableModel.prepare([to_system_dict(row) for row in rows])
+            except Exception as e:
+                error = e
+            try:
+                loaded.emit((generation, prepared, error))
+            except RuntimeError:
+                # Window already destroyed
+                pass
+        
+        QThreadPool.globalInstance().start(run)
+    
+    def _on_systems_loaded(self, result):
+        """Apply a finished background load on the UI thread"""
+        generation, prepared, error = result
+        self._refresh_running = False
+        if generation == self._refresh_generation:
+            if error is not None:
+                self.show_message('critical', "Databasfel", f"Kunde inte ladda system: {str(error)}")
+            else:
+                with self._frozen_table():
+                    self.systems_model.set_systems(None, prepared)
+                    self._fetch_all_if_needed()
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_data()
+    
+    def refresh_customer_rows(self, customer_id):
+        """Reload only the rows belonging to one customer and update them in place"""
         try:
-            # Get systems with customer data including all fields for smart data selection
-            systems = self.db_manager.execute_query("""
-                SELECT 
-                    ks.id,
-                    ks.customer_id,
-                    c.company,
-                    c.project,
-                    ks.key_code,
-                    ks.key_profile,
-                    ks.series_id,
-                    ks.fabrikat,
-                    ks.koncept,
-                    ks.last_sequence_number,
-                    ks.is_paid,
-                    ks.billing_plan,
-                    ks.paid_at,
-                    ks.invoice_count,
-                    ks.last_invoice_date,
-                    c.key_responsible_1,
-                    date(ks.created_at) as created_date,
-                    ks.key_code2,
-                    ks.system_number,
-                    ks.profile2,
-                    ks.delning,
-                    ks.key_location2,
-                    ks.fabrikat2,
-                    ks.koncept2,
-                    ks.flex1,
-                    ks.flex2,
-                    ks.flex3,
-                    c.key_location,
-                    c.customer_number,
-                    c.org_number,
-                    c.address,
-                    c.postal_code,
-                    c.postal_address,
-                    c.phone,
-                    c.mobile_phone,
-                    c.email,
-                    c.website,
-                    c.key_responsible_2,
-                    c.key_responsible_3,
-                    ks.notes,
-                    ks.price_one_time
-                FROM key_systems ks
-                JOIN customers c ON ks.customer_id = c.id
-                ORDER BY ks.created_at DESC
-            """)
-            
-            self.populate_table(systems)
-            
+            expire_paid_statuses(self.db_manager)
+            systems = self.db_manager.execute_query(_SYSTEMS_LIST_QUERY + " WHERE ks.customer_id = ?", (customer_id,))
+            with self._frozen_table():
+                for system in systems:
+                    system_dict = self._to_system_dict(system)
+                    if not self.systems_model.update_row_by_id(system_dict['id'], system_dict):
+                        # Row not loaded yet; fall back to a full reload
+                        self.refresh_data()
+                        return
         except Exception as e:
             self.show_message('critical', "Databasfel", f"Kunde inte ladda system: {str(e)}")
     
@@ -808,216 +992,77 @@ class MySystemsWindow(QWidget):
     
     def get_smart_display_data(self, system_data):
         """Smart logic to choose between Nyckelkort and Standard & System-nycklar data for display"""
-        # Check if Nyckelkort data exists
-        nyckelkort_has_data = (
-            system_data.get('key_code', '').strip() or
-            system_data.get('series_id', '').strip() or
-            system_data.get('key_profile', '').strip() or
-            system_data.get('key_location', '').strip() or
-            system_data.get('fabrikat', '').strip() or
-            system_data.get('koncept', '').strip()
-        )
-        
-        # Check if Standard & System-nycklar data exists
-        standard_has_data = (
-            system_data.get('key_code2', '').strip() or
-            system_data.get('system_number', '').strip() or
-            system_data.get('profile2', '').strip() or
-            system_data.get('delning', '').strip() or
-            system_data.get('key_location2', '').strip() or
-            system_data.get('fabrikat2', '').strip() or
-            system_data.get('koncept2', '').strip()
-        )
-        
-        # Smart key_location logic: prioritize nyckelplats, fallback to nyckelplats 2
-        smart_key_location = system_data.get('key_location', '').strip()
-        if not smart_key_location:
-            smart_key_location = system_data.get('key_location2', '').strip()
-        
-        # Return the appropriate data set for display
-        if nyckelkort_has_data:
-            return {
-                'key_code': system_data.get('key_code', ''),
-                'series_id': system_data.get('series_id', ''),
-                'key_profile': system_data.get('key_profile', ''),
-                'key_location': smart_key_location,  # Use smart key_location
-                'fabrikat': system_data.get('fabrikat', ''),
-                'koncept': system_data.get('koncept', ''),
-                'data_source': 'nyckelkort'
-            }
-        elif standard_has_data:
-            return {
-                'key_code': system_data.get('key_code2', ''),  # Map key_code2 -> key_code
-                'series_id': system_data.get('system_number', ''),  # Map system_number -> series_id
-                'key_profile': system_data.get('profile2', ''),  # Map profile2 -> key_profile
-                'key_location': smart_key_location,  # Use smart key_location
-                'fabrikat': system_data.get('fabrikat2', ''),  # Map fabrikat2 -> fabrikat
-                'koncept': system_data.get('koncept2', ''),  # Map koncept2 -> koncept
-                'data_source': 'standard'
-            }
-        else:
-            # No data in either, return empty
-            return {
-                'key_code': '',
-                'series_id': '',
-                'key_profile': '',
-                'key_location': smart_key_location,  # Use smart key_location
-                'fabrikat': '',
-                'koncept': '',
-                'data_source': 'none'
-            }
+        return get_smart_display_data(system_data)
     
     def populate_table(self, systems):
         """Populate table with systems data"""
-        self.systems_table.setRowCount(len(systems))
-        
-        for row, system in enumerate(systems):
-            # Map the query results to the correct indices including new fields
-            system_dict = {
-                'id': system[0],
-                'customer_id': system[1], 
-                'company': system[2],
-                'project': system[3],
-                'key_code': system[4],
-                'key_profile': system[5],
-                'series_id': system[6],
-                'fabrikat': system[7],
-                'koncept': system[8],
-                'last_sequence_number': system[9],
-                'is_paid': (system[10] if isinstance(system[10], (int, bool)) else 0),
-                'billing_plan': system[11],
-                'paid_at': system[12],
-                'invoice_count': system[13] if system[13] is not None else 0,
-                'last_invoice_date': system[14],
-                'key_responsible_1': system[15],
-                'created_date': system[16],
-                # Standard & System-nycklar fields
-                'key_code2': system[17] or '',
-                'system_number': system[18] or '',
-                'profile2': system[19] or '',
-                'delning': system[20] or '',
-                'key_location2': system[21] or '',
-                'fabrikat2': system[22] or '',
-                'koncept2': system[23] or '',
-                'flex1': system[24] or '',
-                'flex2': system[25] or '',
-                'flex3': system[26] or '',
-                'key_location': system[27] or '',  # From customers table
-                'customer_number': system[28] or '',
-                'org_number': system[29] or '',
-                'street_address': system[30] or '',  # address -> street_address for consistency
-                'postal_code': system[31] or '',
-                'postal_address': system[32] or '',
-                'phone': system[33] or '',
-                'mobile_phone': system[34] or '',
-                'email': system[35] or '',
-                'website': system[36] or '',
-                'key_responsible_2': system[37] or '',
-                'key_responsible_3': system[38] or '',
-                'notes': system[39] or '',
-                'price_one_time': system[40] or 0.0
-            }
-            
-            # Apply smart data logic to get display values
-            smart_data = self.get_smart_display_data(system_dict)
-            
-            self.systems_table.setItem(row, 0, QTableWidgetItem(str(system_dict['id'])))
-            self.systems_table.setItem(row, 1, QTableWidgetItem(system_dict['company'] or ''))
-            self.systems_table.setItem(row, 2, QTableWidgetItem(system_dict['project'] or ''))
-            # Use smart data for key fields
-            self.systems_table.setItem(row, 3, QTableWidgetItem(smart_data.get('key_code', '') or ''))
-            self.systems_table.setItem(row, 4, QTableWidgetItem(smart_data.get('key_profile', '') or ''))
-            self.systems_table.setItem(row, 5, QTableWidgetItem(smart_data.get('series_id', '') or ''))
-            self.systems_table.setItem(row, 6, QTableWidgetItem(str(system_dict['last_sequence_number'] or 0)))
-            self.systems_table.setItem(row, 7, QTableWidgetItem(system_dict['key_responsible_1'] or ''))
-            # Auto-revert status if period elapsed
-            try:
-                bp = (system_dict.get('billing_plan') or '').lower()
-                if system_dict.get('is_paid') and bp in ['månadskostnad', 'halvårskostnad', 'helårskostnad'] and system_dict.get('paid_at'):
-                    from datetime import datetime, timedelta
-                    try:
-                        paid_dt = datetime.fromisoformat(system_dict['paid_at']) if isinstance(system_dict['paid_at'], str) else system_dict['paid_at']
-                    except Exception:
-                        paid_dt = None
-                    if paid_dt:
-                        delta_days = (datetime.now() - paid_dt).days
-                        threshold = 30 if 'månad' in bp else (182 if 'halvår' in bp else 365)
-                        if delta_days >= threshold:
-                            # Revert to Obetald in DB and memory
-                            self.db_manager.execute_update(
-                                "UPDATE key_systems SET is_paid = 0 WHERE id = ?",
-                                (system_dict['id'],)
-                            )
-                            system_dict['is_paid'] = 0
-            except Exception:
-                pass
-            # Paid status cell
-            paid_item = QTableWidgetItem("Betald" if system_dict.get('is_paid') else "Obetald")
-            if system_dict.get('is_paid'):
-                paid_item.setBackground(QColor(198, 239, 206))
-                paid_item.setForeground(QColor(0, 97, 0))
-            else:
-                paid_item.setBackground(QColor(255, 199, 206))
-                paid_item.setForeground(QColor(156, 0, 6))
-            self.systems_table.setItem(row, 8, paid_item)
-            # Next due date
-            next_due_text = ""
-            try:
-                bp = (system_dict.get('billing_plan') or '').lower()
-                paid_at = system_dict.get('paid_at')
-                if paid_at and bp in ['månadskostnad', 'halvårskostnad', 'helårskostnad']:
-                    from datetime import datetime, timedelta
-                    try:
-                        paid_dt = datetime.fromisoformat(paid_at) if isinstance(paid_at, str) else paid_at
-                    except Exception:
-                        paid_dt = None
-                    if paid_dt:
-                        add_days = 30 if 'månad' in bp else (182 if 'halvår' in bp else 365)
-                        due_dt = paid_dt + timedelta(days=add_days)
-                        next_due_text = due_dt.strftime('%Y-%m-%d')
-            except Exception:
-                pass
-            self.systems_table.setItem(row, 9, QTableWidgetItem(next_due_text))
-            # Add hover tooltip over company cell to hint right-click options
-            try:
-                company_item = self.systems_table.item(row, 1)
-                if company_item:
-                    company_item.setToolTip("Högerklicka för flera val")
-            except Exception:
-                pass
-            # Build tooltip for Faktura cell
-            try:
-                tooltip_lines = []
-                plan_val = system_dict.get('billing_plan') or ''
-                paid_at_txt = ''
-                if system_dict.get('paid_at'):
-                    if isinstance(system_dict.get('paid_at'), str):
-                        paid_at_txt = system_dict.get('paid_at')[:16].replace('T', ' ')
-                    else:
-                        from datetime import datetime
-                        paid_at_txt = str(system_dict.get('paid_at'))
-                tooltip_lines.append(f"Plan: {plan_val}")
-                tooltip_lines.append(f"Betald: {paid_at_txt or '-'}")
-                tooltip_lines.append(f"Nästa förfallodatum: {next_due_text or '-'}")
-                tooltip_lines.append(f"Antal fakturor: {system_dict.get('invoice_count', 0)}")
-                paid_item.setToolTip("\n".join(tooltip_lines))
-            except Exception:
-                pass
-            self.systems_table.setItem(row, 10, QTableWidgetItem(system_dict['created_date'] or ''))
-            
-            # Store full system data in first column
-            item = self.systems_table.item(row, 0)
-            item.setData(Qt.UserRole, system_dict)
+        system_dicts = [self._to_system_dict(system) for system in systems]
+        with self._frozen_table():
+            self.systems_model.set_systems(system_dicts)
+            self._fetch_all_if_needed()
+
+    @contextmanager
+    def _frozen_table(self):
+        """Build once, present once: no repaints or selection handlers while the model changes"""
+        selection_model = self.systems_table.selectionModel()
+        self.systems_table.setUpdatesEnabled(False)
+        selection_model.blockSignals(True)
+        try:
+            yield
+        finally:
+            selection_model.blockSignals(False)
+            self.systems_table.setUpdatesEnabled(True)
+            # Selection handlers were silenced; sync the buttons once
+            self.on_selection_changed()
+            self.update_edit_button_state()
+
+    def _to_system_dict(self, system):
+        """Map a systems query row (sqlite3.Row) to the system dict used by the model and dialogs"""
+        system_dict = dict(system)
+        if 'address' in system_dict:
+            system_dict['street_address'] = system_dict.pop('address')  # address -> street_address for consistency
+        is_paid = system_dict.get('is_paid')
+        system_dict['is_paid'] = is_paid if isinstance(is_paid, (int, bool)) else 0
+        system_dict['invoice_count'] = system_dict.get('invoice_count') or 0
+        for key in _SYSTEM_TEXT_FIELDS:
+            if key in system_dict:
+                system_dict[key] = system_dict[key] or ''
+        if 'price_one_time' in system_dict:
+            system_dict['price_one_time'] = system_dict['price_one_time'] or 0.0
+        return system_dict
 
-    def on_systems_item_double_clicked(self, item):
+    def get_system_detail(self, system_id):
+        """Load every column of one system, for dialogs that need more than the table shows"""
+        try:
+            rows = self.db_manager.execute_query(_SYSTEMS_QUERY + " WHERE ks.id = ?", (system_id,))
+            if rows:
+                return self._to_system_dict(rows[0])
+        except Exception as e:
+            print(f"System detail error: {e}")
+        return None
+
+    def _system_at(self, view_row):
+        """Return the system dict shown at a table (proxy) row"""
+        if view_row < 0:
+            return None
+        source_index = self.systems_proxy.mapToSource(self.systems_proxy.index(view_row, 0))
+        return self.systems_model.system_at(source_index.row())
+
+    def _current_source_row(self):
+        """Return the source model row of the current table row, or -1"""
+        index = self.systems_table.currentIndex()
+        if not index.isValid():
+            return -1
+        return self.systems_proxy.mapToSource(index).row()
+
+    def on_systems_item_double_clicked(self, index):
         """On double-click: open Faktura-historik when clicking the 'Faktura' column."""
         try:
-            if item.column() == 8:  # Faktura column
-                row = item.row()
-                id_item = self.systems_table.item(row, 0)
-                if not id_item:
+            if index.column() == 8:  # Faktura column
+                system = self._system_at(index.row())
+                if not system:
                     return
-                system_id = int(id_item.text())
+                system_id = int(system['id'])
                 self.show_invoice_history(system_id)
         except Exception:
             pass
@@ -1025,87 +1070,40 @@ class MySystemsWindow(QWidget):
     def set_selected_invoice_status(self, paid: bool):
         """Set Faktura status (Betald/Obetald) for the currently selected row and update UI."""
         try:
-            row = self.systems_table.currentRow()
+            row = self._current_source_row()
             if row < 0:
                 return
-            id_item = self.systems_table.item(row, 0)
-            if not id_item:
-                return
-            system_id = int(id_item.text())
+            data = self.systems_model.system_at(row)
+            system_id = int(data['id'])
             # Update DB
             if paid:
-                from datetime import datetime
                 now_iso = datetime.now().isoformat()
-                self.db_manager.execute_update(
-                    "UPDATE key_systems SET is_paid = 1, paid_at = COALESCE(paid_at, ?), invoice_count = invoice_count + 1, last_invoice_date = ? WHERE id = ?",
-                    (now_iso, now_iso, system_id)
-                )
+                params = (now_iso, now_iso, system_id)
+                # Read back the stored paid_at/invoice_count in the same round trip where possible
+                if SUPPORTS_RETURNING:
+                    updated = self.db_manager.execute_returning(_MARK_PAID + " RETURNING paid_at, invoice_count", params)
+                    updated = updated[0] if updated else None
+                else:
+                    self.db_manager.execute_update(_MARK_PAID, params)
+                    updated = self.db_manager.fetch_one(
+                        "SELECT paid_at, invoice_count FROM key_systems WHERE id = ?", (system_id,)
+                    )
             else:
                 self.db_manager.execute_update(
                     "UPDATE key_systems SET is_paid = 0 WHERE id = ?",
                     (system_id,)
                 )
-            # Update UI status cell
-            status_item = self.systems_table.item(row, 8)
-            if not status_item:
-                status_item = QTableWidgetItem()
-                self.systems_table.setItem(row, 8, status_item)
-            if paid:
-                status_item.setText("Betald")
-                status_item.setBackground(QColor(198, 239, 206))
-                status_item.setForeground(QColor(0, 97, 0))
-            else:
-                status_item.setText("Obetald")
-                status_item.setBackground(QColor(255, 199, 206))
-                status_item.setForeground(QColor(156, 0, 6))
-            # Update next due date cell (recompute based on billing_plan and paid_at)
+            # Update cached row; the model recomputes status and next due date
+            # billing_plan comes with the list query; None and '' both mean no recurring plan
             try:
-                # Use cached dict stored in first column
-                first_item = self.systems_table.item(row, 0)
-                data = first_item.data(Qt.UserRole) if first_item else {}
-                # Ensure we have billing plan; if missing, fetch from DB
-                bp = (data.get('billing_plan') or '').lower()
-                if not bp:
-                    try:
-                        res = self.db_manager.execute_query("SELECT billing_plan FROM key_systems WHERE id = ?", (system_id,))
-                        if res and res[0]['billing_plan']:
-                            bp = str(res[0]['billing_plan']).lower()
-                            data['billing_plan'] = res[0]['billing_plan']
-                    except Exception:
-                        bp = ''
-                # Update cached is_paid and paid_at
                 if paid:
-                    from datetime import datetime, timedelta
-                    now_dt = datetime.now()
                     data['is_paid'] = 1
-                    data['paid_at'] = now_iso if 'now_iso' in locals() else now_dt.isoformat()
-                    # Increment invoice_count in cache to match DB
-                    try:
-                        data['invoice_count'] = int(data.get('invoice_count') or 0) + 1
-                    except Exception:
-                        data['invoice_count'] = 1
-                    # Compute next due
-                    add_days = 30 if 'månad' in bp else (182 if 'halvår' in bp else 365)
-                    next_due_text = ''
-                    if add_days:
-                        due_dt = now_dt + timedelta(days=add_days)
-                        next_due_text = due_dt.strftime('%Y-%m-%d')
-                    self.systems_table.setItem(row, 9, QTableWidgetItem(next_due_text))
-                    # Update tooltip
-                    tooltip_lines = [
-                        f"Plan: {data.get('billing_plan') or ''}",
-                        f"Betald: {now_dt.strftime('%Y-%m-%d %H:%M')}",
-                        f"Nästa förfallodatum: {next_due_text or '-'}",
-                        f"Antal fakturor: {data.get('invoice_count', 0)}",
-                    ]
-                    status_item.setToolTip("\n".join(tooltip_lines))
+                    if updated:
+                        data['paid_at'] = updated['paid_at']
+                        data['invoice_count'] = updated['invoice_count'] or 0
                 else:
                     data['is_paid'] = 0
-                    self.systems_table.setItem(row, 9, QTableWidgetItem(''))
-                    status_item.setToolTip("Plan: \nBetald: -\nNästa förfallodatum: -\nAntal fakturor: -")
-                # Save back cached data
-                if first_item:
-                    first_item.setData(Qt.UserRole, data)
+                self.systems_model.update_system(row, data)
             except Exception:
                 pass
             
@@ -1114,37 +1112,32 @@ class MySystemsWindow(QWidget):
                 if hasattr(self, '_invoice_history') and self._invoice_history:
                     info = self._invoice_history
                     if info.get('system_id') == system_id and info.get('dialog') and info.get('table') and info.get('count'):
-                        rows = self.db_manager.execute_query(
-                            "SELECT pdf_encrypted, created_at FROM invoices WHERE system_id = ? ORDER BY created_at DESC",
-                            (system_id,)
-                        )
-                        tw = info['table']
-                        tw.setRowCount(len(rows))
-                        for r, rec in enumerate(rows):
-                            created = rec[1] or ""
-                            created_item = QTableWidgetItem(str(created))
-                            created_item.setData(Qt.UserRole, rec[0])
-                            tw.setItem(r, 0, created_item)
-                        info['count'].setText(f"Antal fakturor: {len(rows)}")
+                        self._fill_invoice_history(info['table'], info['count'], system_id)
             except Exception:
                 pass
         except Exception:
             pass
 
+    def _fill_invoice_history(self, tw, count_label, system_id):
+        """Fill the invoice history table with one row per invoice (id in UserRole)"""
+        rows = self.db_manager.execute_query(_INVOICE_HISTORY_QUERY, (system_id,))
+        tw.setRowCount(len(rows))
+        for r, rec in enumerate(rows):
+            item = QTableWidgetItem(str(rec['created_at'] or ""))
+            item.setData(Qt.UserRole, rec['id'])
+            item.setToolTip("Högerklicka för fler val")
+            tw.setItem(r, 0, item)
+        count_label.setText(f"Antal fakturor: {len(rows)}")
+
     def show_invoice_history(self, system_id: int):
         """Fakturahistorik med högerklicksmeny (visa, maila, sätt betald/obetald)."""
         try:
-            rows = self.db_manager.execute_query(
-                "SELECT pdf_encrypted, created_at FROM invoices WHERE system_id = ? ORDER BY created_at DESC",
-                (system_id,)
-            )
-            from PySide6.QtWidgets import QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem, QLabel
             dlg = QDialog(self)
             dlg.setWindowTitle("Fakturahistorik")
             dlg.resize(520, 320)
             v = QVBoxLayout(dlg)
             # Antal
-            count_label = QLabel(f"Antal fakturor: {len(rows)}")
+            count_label = QLabel()
             v.addWidget(count_label)
             # Info om högerklick (beautified)
             info_label = QLabel("Högerklicka för fler val.")
@@ -1157,64 +1150,42 @@ class MySystemsWindow(QWidget):
             tw.setHorizontalHeaderLabels(["Skapad"])
             tw.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
             # No in-table editing or accidental activation
-            try:
-                from PySide6.QtWidgets import QAbstractItemView
-                tw.setEditTriggers(QAbstractItemView.NoEditTriggers)
-                tw.setSelectionBehavior(QAbstractItemView.SelectRows)
-                tw.setSelectionMode(QAbstractItemView.SingleSelection)
-            except Exception:
-                pass
-            tw.setRowCount(len(rows))
-            for r, rec in enumerate(rows):
-                created = rec[1] or ""
-                item = QTableWidgetItem(str(created))
-                item.setData(Qt.UserRole, rec[0])
-                tw.setItem(r, 0, item)
+            tw.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            tw.setSelectionBehavior(QAbstractItemView.SelectRows)
+            tw.setSelectionMode(QAbstractItemView.SingleSelection)
+            self._fill_invoice_history(tw, count_label, system_id)
             v.addWidget(tw)
 
-            # Högerklicksmeny
+            # Högerklicksmeny (byggs en gång per dialog)
+            menu = self._create_context_menu(tw)
+            act_view = menu.addAction("Visa faktura")
+            act_email = menu.addAction("Maila faktura")
+            act_create = menu.addAction("Skapa faktura")
+            act_delete = menu.addAction("Ta bort faktura")
+            menu.addSeparator()
+            act_paid = menu.addAction("Sätt betald")
+            act_unpaid = menu.addAction("Sätt obetald")
+
             def on_history_context_menu(point):
                 try:
                     index = tw.indexAt(point)
                     if not index.isValid():
                         return
                     row_idx = index.row()
-                    menu = QMenu(tw)
-                    menu.setObjectName("newDropdownMenu")  # Use new styling
-                    # Frameless/translucent for rounded corners
-                    try:
-                        menu.setWindowFlags(menu.windowFlags() | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
-                        menu.setAttribute(Qt.WA_TranslucentBackground, True)
-                    except Exception:
-                        pass
-                    # Use global menu styling instead of inline styles
-                    act_view = menu.addAction("Visa faktura")
-                    act_email = menu.addAction("Maila faktura")
-                    act_create = menu.addAction("Skapa faktura")
-                    act_delete = menu.addAction("Ta bort faktura")
-                    menu.addSeparator()
-                    act_paid = menu.addAction("Sätt betald")
-                    act_unpaid = menu.addAction("Sätt obetald")
                     chosen = menu.exec(tw.mapToGlobal(point))
                     if chosen == act_view:
-                        enc_b64 = tw.item(row_idx, 0).data(Qt.UserRole)
-                        if not enc_b64:
-                            return
-                        import base64, tempfile
-                        b64 = self.db_manager.decrypt_data(enc_b64)
-                        pdf_bytes = base64.b64decode(b64.encode('utf-8'))
-                        tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-                        tmp.write(pdf_bytes); tmp.flush(); tmp.close()
-                        OrderPDFGenerator().open_pdf_in_browser(tmp.name)
+                        invoice_id = tw.item(row_idx, 0).data(Qt.UserRole)
+                        pdf_path = self._invoice_pdf_path(invoice_id)
+                        if pdf_path:
+                            self._pdf_gen.open_pdf_in_browser(pdf_path)
                     elif chosen == act_email:
                         self.email_invoice_stub()
                     elif chosen == act_create:
                         self.create_invoice_stub()
                     elif chosen == act_delete:
                         try:
-                            from .copyable_message_box import CopyableMessageBox
-                            enc_b64 = tw.item(row_idx, 0).data(Qt.UserRole)
-                            if not enc_b64:
+                            invoice_id = tw.item(row_idx, 0).data(Qt.UserRole)
+                            if invoice_id is None:
                                 return
                             reply = CopyableMessageBox.question(
                                 self,
@@ -1223,24 +1194,14 @@ class MySystemsWindow(QWidget):
                                 CopyableMessageBox.Yes | CopyableMessageBox.No
                             )
                             if reply == CopyableMessageBox.Yes:
-                                # Delete by encrypted content value
                                 self.db_manager.execute_update(
-                                    "DELETE FROM invoices WHERE pdf_encrypted = ?",
-                                    (enc_b64,)
+                                    "DELETE FROM invoices WHERE id = ?",
+                                    (invoice_id,)
                                 )
+                                # The newest invoice may have been the one removed
+                                self._pdf_cache.pop(system_id, None)
                                 # Refresh list
-                                rows2 = self.db_manager.execute_query(
-                                    "SELECT pdf_encrypted, created_at FROM invoices WHERE system_id = ? ORDER BY created_at DESC",
-                                    (system_id,)
-                                )
-                                tw.setRowCount(len(rows2))
-                                for r, rec in enumerate(rows2):
-                                    created = rec[1] or ""
-                                    item = QTableWidgetItem(str(created))
-                                    item.setData(Qt.UserRole, rec[0])
-                                    item.setToolTip("Högerklicka för fler val")
-                                    tw.setItem(r, 0, item)
-                                count_label.setText(f"Antal fakturor: {len(rows2)}")
+                                self._fill_invoice_history(tw, count_label, system_id)
                         except Exception:
                             pass
                     elif chosen == act_paid:
@@ -1251,14 +1212,6 @@ class MySystemsWindow(QWidget):
                     pass
             tw.setContextMenuPolicy(Qt.CustomContextMenu)
             tw.customContextMenuRequested.connect(on_history_context_menu)
-            # Tooltips on rows
-            try:
-                for r in range(tw.rowCount()):
-                    it = tw.item(r, 0)
-                    if it:
-                        it.setToolTip("Högerklicka för fler val")
-            except Exception:
-                pass
 
             # Spara referenser för live‑uppdatering
             self._invoice_history = {
@@ -1278,92 +1231,64 @@ class MySystemsWindow(QWidget):
         except Exception as e:
             CopyableMessageBox.warning(self, "Fakturahistorik", f"Kunde inte visa historik: {str(e)}")
     
-    def filter_systems(self):
-        """Filter systems based on search text"""
-        search_text = self.search_edit.text().lower()
-        status_filter = None
-        try:
-            status_text = self.invoice_status_combo.currentText() if hasattr(self, 'invoice_status_combo') else "Alla"
-            if status_text == "Betald":
-                status_filter = 'betald'
-            elif status_text == "Obetald":
-                status_filter = 'obetald'
-        except Exception:
-            status_filter = None
-        
-        for row in range(self.systems_table.rowCount()):
-            show_row = False
-            
-            if not search_text:
-                show_row = True
-            else:
-                # Search only in specific columns: Företag (1), Projekt (2), Nyckelkod (3), Profil (4), Nyckelansvarig (7)
-                # Exclude: ID (0), Serie-ID (5), Senaste löpnr (6), Skapad (8)
-                searchable_columns = [1, 2, 3, 4, 7]
-                for col in searchable_columns:
-                    item = self.systems_table.item(row, col)
-                    if item and search_text in item.text().lower():
-                        show_row = True
-                        break
-            # Apply Faktura status filter
-            if show_row and status_filter:
-                status_item = self.systems_table.item(row, 8)  # Faktura column
-                if not status_item or status_item.text().lower() != status_filter:
-                    show_row = False
-            self.systems_table.setRowHidden(row, not show_row)
+    def _do_filter(self):
+        """Push the current search text and Faktura status to the proxy"""
+        self.systems_proxy.set_needle(self.search_edit.text())
+        self.systems_proxy.set_status(self.invoice_status_combo.currentText())
+        self._fetch_all_if_needed()
+
+    def _fetch_all_if_needed(self):
+        """Filtering and sorting must see every row, not only the batches fetched so far"""
+        if self.systems_proxy.is_filtering() or self.systems_proxy.sortColumn() >= 0:
+            self.systems_model.fetch_all()
+
+    def _on_sort_indicator_changed(self, section, order):
+        if section >= 0:
+            self.systems_model.fetch_all()
 
     def bulk_set_invoice_status(self, paid: bool):
         """Set Faktura status for all selected rows."""
         try:
-            selected_indexes = self.systems_table.selectedIndexes()
-            rows = sorted({idx.row() for idx in selected_indexes})
-            if not rows:
+            rows = sorted({self.systems_proxy.mapToSource(idx).row()
+                           for idx in self.systems_table.selectionModel().selectedRows()})
+            systems = [(row, self.systems_model.system_at(row)) for row in rows]
+            systems = [(row, system) for row, system in systems if system]
+            if not systems:
                 return
-            for row in rows:
-                id_item = self.systems_table.item(row, 0)
-                if not id_item:
-                    continue
-                system_id = int(id_item.text())
-                # Update DB with side-effects if setting paid
+            ids = [int(system['id']) for _, system in systems]
+            now_iso = datetime.now().isoformat()
+            # One UPDATE ... WHERE id IN (...) per batch, all in a single transaction
+            statements = []
+            for start in range(0, len(ids), _IN_BATCH):
+                batch = ids[start:start + _IN_BATCH]
+                placeholders = ",".join("?" * len(batch))
                 if paid:
-                    from datetime import datetime
-                    now_iso = datetime.now().isoformat()
-                    self.db_manager.execute_update(
-                        "UPDATE key_systems SET is_paid = 1, paid_at = COALESCE(paid_at, ?), invoice_count = invoice_count + 1, last_invoice_date = ? WHERE id = ?",
-                        (now_iso, now_iso, system_id)
-                    )
+                    statements.append((
+                        "UPDATE key_systems SET is_paid = 1, paid_at = COALESCE(paid_at, ?), invoice_count = invoice_count + 1, "
+                        f"last_invoice_date = ? WHERE id IN ({placeholders})",
+                        (now_iso, now_iso, *batch)
+                    ))
                 else:
-                    self.db_manager.execute_update(
-                        "UPDATE key_systems SET is_paid = 0 WHERE id = ?",
-                        (system_id,)
-                    )
-                # Update UI cell
-                status_item = self.systems_table.item(row, 8)
-                if not status_item:
-                    status_item = QTableWidgetItem()
-                    self.systems_table.setItem(row, 8, status_item)
+                    statements.append((f"UPDATE key_systems SET is_paid = 0 WHERE id IN ({placeholders})", tuple(batch)))
+            self.db_manager.execute_updates(statements)
+            # Mirror the UPDATE in the cached rows; one dataChanged and one repaint for the whole selection
+            for _, system in systems:
+                system['is_paid'] = 1 if paid else 0
                 if paid:
-                    status_item.setText("Betald")
-                    status_item.setBackground(QColor(198, 239, 206))
-                    status_item.setForeground(QColor(0, 97, 0))
-                else:
-                    status_item.setText("Obetald")
-                    status_item.setBackground(QColor(255, 199, 206))
-                    status_item.setForeground(QColor(156, 0, 6))
+                    system['paid_at'] = system.get('paid_at') or now_iso
+                    system['invoice_count'] = int(system.get('invoice_count') or 0) + 1
+            with self._frozen_table():
+                self.systems_model.update_systems(systems)
         except Exception:
             pass
     
     def create_key_order(self):
         """Create new key manufacturing order"""
-        current_row = self.systems_table.currentRow()
-        if current_row < 0:
+        system_data = self._get_selected_system_detail()
+        if not system_data:
             self.show_message('warning', "Ingen rad vald", "Välj ett system från tabellen för att tillverka nycklar.")
             return
         
-        # Get system data
-        item = self.systems_table.item(current_row, 0)
-        system_data = item.data(Qt.UserRole)
-        
         # Show create key dialog
         dialog = CreateKeyDialog(self, system_data, self.translation_manager)
         
@@ -1384,9 +1309,9 @@ class MySystemsWindow(QWidget):
             quantity = order_data['quantity']
             sequence_end = sequence_start + quantity - 1
             
-            # Insert order
-            order_id = self.db_manager.execute_update(
-                """INSERT INTO orders (
+            # Insert order and update last sequence number in key system in one transaction
+            order_id, _ = self.db_manager.execute_updates([
+                ("""INSERT INTO orders (
                     customer_id, key_system_id, key_code, key_profile,
                     quantity, sequence_start, sequence_end, key_responsible, created_by
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
@@ -1400,17 +1325,18 @@ class MySystemsWindow(QWidget):
                     sequence_end,
                     order_data['key_responsible'],
                     current_user['user_id']
-                )
-            )
+                )),
+                ("UPDATE key_systems SET last_sequence_number = ? WHERE id = ?",
+                 (sequence_end, system_data['id'])),
+            ])
             
-            # Update last sequence number in key system
-            self.db_manager.execute_update(
-                "UPDATE key_systems SET last_sequence_number = ? WHERE id = ?",
-                (sequence_end, system_data['id'])
-            )
+            # Emit signal to notify other windows about the new order as soon as it is committed
+            self.app_manager.orders_generation += 1
+            self.app_manager.prefetched_orders = None
+            self.order_created.emit()
             
-            # Generate Order PDF and Receipt sequentially
-            self.generate_pdfs_sequentially(system_data, order_data, order_id)
+            # Show the updated sequence number by reloading only this customer's rows
+            self.refresh_customer_rows(system_data['customer_id'])
             
             CopyableMessageBox.information(
                 self,
@@ -1420,11 +1346,8 @@ class MySystemsWindow(QWidget):
                 f"Löpnummer: {sequence_start}-{sequence_end}"
             )
             
-            # Emit signal to notify other windows about the new order
-            self.order_created.emit()
-            
-            # Refresh data to show updated sequence number
-            self.refresh_data()
+            # Generate Order PDF and Receipt sequentially (in the background), once the box is closed
+            self.generate_pdfs_sequentially(system_data, order_data, order_id)
             
         except Exception as e:
             CopyableMessageBox.critical(
@@ -1434,89 +1357,116 @@ class MySystemsWindow(QWidget):
             )
     
     def generate_pdfs_sequentially(self, system_data, order_data, order_id):
-        """Generate PDFs sequentially: first TILLVERKNINGSORDER, then Nyckelkvittens"""
+        """Generate PDFs sequentially: first TILLVERKNINGSORDER, then Nyckelkvittens (built on the thread pool)"""
+        # Database, settings and logo lookups happen here on the UI thread; the worker gets plain data
         try:
-            # First generate TILLVERKNINGSORDER NYCKEL
-            order_pdf_path = self.generate_order_pdf_only(system_data, order_data, order_id)
-            
-            # Open TILLVERKNINGSORDER NYCKEL in browser
-            if order_pdf_path:
-                from ..core.pdf_generator import OrderPDFGenerator
-                pdf_generator = OrderPDFGenerator()
-                pdf_generator.open_pdf_in_browser(order_pdf_path)
-                
-                # Show dialog asking if user wants to continue to Nyckelkvittens
-                if order_data.get('create_receipt', True):
-                    reply = CopyableMessageBox.question(
-                        self,
-                        "Nästa steg",
-                        "TILLVERKNINGSORDER NYCKEL har öppnats.\n\n"
-                        "Vill du nu öppna Nyckelkvittens?",
-                        CopyableMessageBox.Yes | CopyableMessageBox.No
-                    )
-                    
-                    if reply == CopyableMessageBox.Yes:
-                        try:
-                            self.generate_and_store_receipt(system_data, order_data, order_id)
-                        except Exception as e:
-                            print(f"Receipt generation error: {e}")
-                            CopyableMessageBox.warning(
-                                self,
-                                "Nyckelkvittens fel",
-                                f"Kunde inte generera Nyckelkvittens: {str(e)}"
-                            )
+            system_data = dict(system_data)
+            customer = self._load_pdf_data(system_data)
         except Exception as e:
+            print(f"Order PDF data error: {e}")
+            customer = None
+        current_user = self.app_manager.get_current_user()
+        logo_path = self._get_logo_path()
+        ready = self.order_pdf_ready
+        
+        def run():
+            # ReportLab and file work only
+            order_pdf_path = self.generate_order_pdf_only(system_data, order_data, customer, current_user, logo_path)
+            try:
+                ready.emit((system_data, order_data, order_id, customer, order_pdf_path))
+            except RuntimeError:
+                # Window already destroyed
+                pass
+        
+        QThreadPool.globalInstance().start(run)
+    
+    def _on_order_pdf_ready(self, result):
+        """Open the finished TILLVERKNINGSORDER and offer to continue to Nyckelkvittens"""
+        system_data, order_data, order_id, customer, order_pdf_path = result
+        if not order_pdf_path:
             CopyableMessageBox.warning(
                 self,
                 "PDF-export fel", 
-                f"Kunde inte generera PDF-export: {str(e)}\n\nOrdern har ändå skapats framgångsrikt."
+                "Kunde inte generera PDF-export.\n\nOrdern har ändå skapats framgångsrikt."
             )
+            return
+        
+        # Open TILLVERKNINGSORDER NYCKEL in browser
+        self._pdf_gen.open_pdf_in_browser(order_pdf_path)
+        
+        # Show dialog asking if user wants to continue to Nyckelkvittens
+        if order_data.get('create_receipt', True):
+            reply = CopyableMessageBox.question(
+                self,
+                "Nästa steg",
+                "TILLVERKNINGSORDER NYCKEL har öppnats.\n\n"
+                "Vill du nu öppna Nyckelkvittens?",
+                CopyableMessageBox.Yes | CopyableMessageBox.No
+            )
+            
+            if reply == CopyableMessageBox.Yes:
+                current_user = self.app_manager.get_current_user()
+                logo_path = self._get_logo_path()
+                ready = self.receipt_ready
+                
+                def run():
+                    # Generates and stores the receipt; it is opened from _on_receipt_ready
+                    try:
+                        result = (self.generate_and_store_receipt(
+                            system_data, order_data, order_id, customer, current_user, logo_path), None)
+                    except Exception as e:
+                        result = (None, e)
+                    try:
+                        ready.emit(result)
+                    except RuntimeError:
+                        # Window already destroyed
+                        pass
+                
+                QThreadPool.globalInstance().start(run)
+    
+    def _on_receipt_ready(self, result):
+        """Open the stored Nyckelkvittens, or report why it could not be created"""
+        receipt_pdf_path, error = result
+        if error is not None:
+            CopyableMessageBox.warning(self, "Nyckelkvittens", f"Kunde inte skapa nyckelkvittens: {str(error)}")
+            return
+        self._pdf_gen.open_pdf_in_browser(receipt_pdf_path)
+
+    def _get_logo_path(self):
+        """Logo path from the GLOBAL logo manager, resolved and stat'ed once per logo ('' if none)"""
+        if not self._logo_checked:
+            logo_path = LogoManager.get_logo_path()
+            # '' rather than None: the PDF generators look up a None path themselves, which builds
+            # an AppManager and must not happen on the thread pool
+            self._logo_path = logo_path if os.path.exists(logo_path) else ''
+            self._logo_checked = True
+        return self._logo_path
+
+    def _invalidate_logo_cache(self, *_):
+        self._logo_checked = False
+
+    def _load_pdf_data(self, system_data):
+        """Refresh system_data for the PDFs and return the customer's fields (None if missing), in one query"""
+        rows = self.db_manager.execute_query(_SYSTEM_PDF_QUERY, (system_data['id'],))
+        if not rows:
+            return None
+        row = rows[0]
+        # Update system_data with complete information from database
+        system_data.update({key: row[key] or '' for key in _PDF_SYSTEM_FIELDS})
+        system_data['last_sequence_number'] = row['last_sequence_number'] or 0
+        if row['c_id'] is None:
+            return None
+        return {key: row[key] or '' for key in _PDF_CUSTOMER_FIELDS}
 
-    def generate_order_pdf_only(self, system_data, order_data, order_id):
-        """Generate PDF export for the order (without opening it)"""
+    def generate_order_pdf_only(self, system_data, order_data, customer, current_user, logo_path):
+        """Generate PDF export for the order (without opening it); customer comes from _load_pdf_data"""
         try:
-            # Get complete system data including all fields for smart data selection
-            system_query = """SELECT key_code, key_profile, series_id, fabrikat, koncept, last_sequence_number, notes,
-                                    key_code2, system_number, profile2, delning, key_location2, fabrikat2, koncept2,
-                                    flex1, flex2, flex3
-                             FROM key_systems WHERE id = ?"""
-            system_result = self.db_manager.execute_query(system_query, (system_data['id'],))
-            
-            if system_result:
-                # Update system_data with complete information from database
-                row = system_result[0]
-                system_data.update({
-                    'key_code': row[0] or '',
-                    'key_profile': row[1] or '',
-                    'series_id': row[2] or '',
-                    'fabrikat': row[3] or '',
-                    'koncept': row[4] or '',
-                    'last_sequence_number': row[5] or 0,
-                    'notes': row[6] or '',
-                    # Standard & System-nycklar fields
-                    'key_code2': row[7] or '',
-                    'system_number': row[8] or '',
-                    'profile2': row[9] or '',
-                    'delning': row[10] or '',
-                    'key_location2': row[11] or '',
-                    'fabrikat2': row[12] or '',
-                    'koncept2': row[13] or '',
-                    'flex1': row[14] or '',
-                    'flex2': row[15] or '',
-                    'flex3': row[16] or '',
-                })
-            
-            # Get customer data for the PDF
-            cust_row = self.db_manager.execute_query(
-                "SELECT company, project, key_responsible_1, key_location FROM customers WHERE id = ?",
-                (system_data.get('customer_id'),)
-            )
-            if cust_row:
+            if customer:
                 customer_data = {
-                    'company': cust_row[0][0] or '',
-                    'project': cust_row[0][1] or '',
-                    'key_responsible_1': cust_row[0][2] or '',
-                    'key_location': cust_row[0][3] or ''
+                    'company': customer['company'],
+                    'project': customer['project'],
+                    'key_responsible_1': customer['key_responsible_1'],
+                    'key_location': customer['key_location']
                 }
             else:
                 customer_data = {
@@ -1526,19 +1476,8 @@ class MySystemsWindow(QWidget):
                     'key_location': ''
                 }
             
-            # Get logo path using GLOBAL logo manager
-            from ..core.logo_manager import LogoManager
-            logo_path = LogoManager.get_logo_path()
-            if not os.path.exists(logo_path):
-                logo_path = None
-            
-            # Get current user information
-            current_user = self.app_manager.get_current_user()
-            
             # Generate PDF (without opening it)
-            from ..core.pdf_generator import OrderPDFGenerator
-            pdf_generator = OrderPDFGenerator()
-            pdf_path = pdf_generator.generate_order_pdf(
+            pdf_path = self._pdf_gen.generate_order_pdf(
                 system_data, 
                 order_data, 
                 customer_data, 
@@ -1552,167 +1491,126 @@ class MySystemsWindow(QWidget):
             print(f"Order PDF generation error: {e}")
             return None
 
-    def generate_and_store_receipt(self, system_data, order_data, order_id):
-        """Generate Nyckelkvittens PDF, encrypt and store in DB, and open it"""
-        try:
-            # Enrich system data with all fields for smart data selection
-            system_query = (
-                "SELECT key_code, key_profile, series_id, fabrikat, koncept, last_sequence_number, notes, "
-                "key_code2, system_number, profile2, delning, key_location2, fabrikat2, koncept2, "
-                "flex1, flex2, flex3 "
-                "FROM key_systems WHERE id = ?"
-            )
-            system_result = self.db_manager.execute_query(system_query, (system_data['id'],))
-            if system_result:
-                row = system_result[0]
-                system_data.update({
-                    'key_code': row[0] or '',
-                    'key_profile': row[1] or '',
-                    'series_id': row[2] or '',
-                    'fabrikat': row[3] or '',
-                    'koncept': row[4] or '',
-                    'last_sequence_number': row[5] or 0,
-                    'notes': row[6] or '',
-                    # Standard & System-nycklar fields
-                    'key_code2': row[7] or '',
-                    'system_number': row[8] or '',
-                    'profile2': row[9] or '',
-                    'delning': row[10] or '',
-                    'key_location2': row[11] or '',
-                    'fabrikat2': row[12] or '',
-                    'koncept2': row[13] or '',
-                    'flex1': row[14] or '',
-                    'flex2': row[15] or '',
-                    'flex3': row[16] or '',
-                })
-
-            # Customer data for recipient info
-            customer_query = (
-                "SELECT company, project, mobile_phone, address, postal_code, postal_address, "
-                "key_responsible_1, org_number FROM customers WHERE id = ?"
-            )
-            customer_result = self.db_manager.execute_query(customer_query, (system_data['customer_id'],))
-            customer_data = {
-                'company': '', 'project': '', 'mobile_phone': '', 'address': '',
-                'postal_code': '', 'postal_address': '', 'key_responsible_1': '', 'org_number': ''
-            }
-            if customer_result:
-                cr = customer_result[0]
-                customer_data.update({
-                    'company': cr[0] or '',
-                    'project': cr[1] or '',
-                    'mobile_phone': cr[2] or '',
-                    'address': cr[3] or '',
-                    'postal_code': cr[4] or '',
-                    'postal_address': cr[5] or '',
-                    'key_responsible_1': cr[6] or '',
-                    'org_number': cr[7] or ''
-                })
-
-            # Current user and logo using GLOBAL standard
-            current_user = self.app_manager.get_current_user()
-            import base64, tempfile
-            from ..core.logo_manager import LogoManager
-            logo_path = LogoManager.get_logo_path()
-            if not os.path.exists(logo_path):
-                logo_path = None
-
-            # Generate receipt PDF
-            from ..core.pdf_generator import OrderPDFGenerator
-            gen = OrderPDFGenerator()
-            receipt_pdf_path = gen.generate_key_receipt_pdf(system_data, order_data, customer_data, current_user, logo_path)
+    def generate_and_store_receipt(self, system_data, order_data, order_id, customer, current_user, logo_path):
+        """Generate Nyckelkvittens PDF, encrypt and store it in DB; returns the PDF path (no widgets touched)"""
+        # Customer data for recipient info; customer comes from _load_pdf_data
+        customer_data = {
+            'company': '', 'project': '', 'mobile_phone': '', 'address': '',
+            'postal_code': '', 'postal_address': '', 'key_responsible_1': '', 'org_number': ''
+        }
+        if customer:
+            customer_data.update({key: customer[key] for key in customer_data})
 
-            # Read and encrypt
-            with open(receipt_pdf_path, 'rb') as f:
-                pdf_bytes = f.read()
-            b64 = base64.b64encode(pdf_bytes).decode('utf-8')
-            encrypted = self.db_manager.encrypt_data(b64)
+        # Generate receipt PDF
+        receipt_pdf_path = self._pdf_gen.generate_key_receipt_pdf(
+            system_data, order_data, customer_data, current_user, logo_path)
 
-            # Insert or update into key_receipts
-            try:
-                self.db_manager.execute_update(
-                    "INSERT INTO key_receipts (order_id, pdf_encrypted) VALUES (?, ?)",
-                    (order_id, encrypted)
-                )
-            except Exception:
-                self.db_manager.execute_update(
-                    "UPDATE key_receipts SET pdf_encrypted = ? WHERE order_id = ?",
-                    (encrypted, order_id)
-                )
+        # Read and encrypt
+        with open(receipt_pdf_path, 'rb') as f:
+            pdf_bytes = f.read()
+        encrypted = self.db_manager.encrypt_pdf(pdf_bytes)
 
-            # Open the generated PDF in browser
-            gen.open_pdf_in_browser(receipt_pdf_path)
-        except Exception as e:
-            print(f"Receipt generation/storage error: {e}")
+        # Insert or update into key_receipts (order_id is UNIQUE)
+        self.db_manager.execute_update(
+            "INSERT INTO key_receipts (order_id, pdf_encrypted) VALUES (?, ?) "
+            "ON CONFLICT(order_id) DO UPDATE SET pdf_encrypted = excluded.pdf_encrypted",
+            (order_id, encrypted)
+        )
+        return receipt_pdf_path
 
     def clear_data(self):
         """Clear sensitive data"""
-        self.systems_table.setRowCount(0)
+        # Drop any load still in flight so it cannot refill the table after logout
+        self._refresh_generation += 1
+        self._refresh_pending = False
+        self.systems_model.set_systems([])
         self.search_edit.clear()
+        # Decrypted invoices must not outlive the session
+        self._pdf_cache.clear()
+        clear_invoice_cache_dir()
+
+    def _fetch_customer(self, customer_id):
+        """Load one customer row as a dict (use the cached self._customer_cache)"""
+        row = self.db_manager.fetch_one("SELECT * FROM customers WHERE id = ?", (customer_id,))
+        return dict(row) if row else {}
 
     def _get_selected_system(self):
-        row = self.systems_table.currentRow()
-        if row < 0:
+        return self.systems_model.system_at(self._current_source_row())
+
+    def _get_selected_system_detail(self):
+        system = self._get_selected_system()
+        if not system:
             return None
-        item = self.systems_table.item(row, 0)
-        return item.data(Qt.UserRole) if item else None
+        return self.get_system_detail(system['id'])
 
     def create_invoice_stub(self):
         try:
-            system = self._get_selected_system()
+            system = self._get_selected_system_detail()
             if not system:
                 return
             # Load customer for system
-            customer_row = self.db_manager.execute_query(
-                "SELECT company, project FROM customers WHERE id = ?",
-                (system['customer_id'],)
-            )
-            customer_data = {'company': '', 'project': ''}
-            if customer_row:
-                customer_data['company'] = customer_row[0][0] or ''
-                customer_data['project'] = customer_row[0][1] or ''
+            customer = self._customer_cache(system['customer_id'])
+            customer_data = {
+                'company': customer.get('company') or '',
+                'project': customer.get('project') or ''
+            }
             current_user = self.app_manager.get_current_user()
             logo_path = None
-            gen = OrderPDFGenerator()
+            gen = self._pdf_gen
             pdf_path = gen.generate_invoice_stub_pdf(system, customer_data, current_user, logo_path)
             # Encrypt and store
-            import base64
             with open(pdf_path, 'rb') as f:
                 data = f.read()
-            b64 = base64.b64encode(data).decode('utf-8')
-            enc = self.db_manager.encrypt_data(b64)
+            enc = self.db_manager.encrypt_pdf(data)
             self.db_manager.execute_update(
                 "INSERT INTO invoices (system_id, pdf_encrypted) VALUES (?, ?)",
                 (system['id'], enc)
             )
+            self._remember_invoice_pdf(system['id'], pdf_path)
             gen.open_pdf_in_browser(pdf_path)
             CopyableMessageBox.information(self, "Faktura", "Faktura skapad och sparad.")
         except Exception as e:
             CopyableMessageBox.warning(self, "Faktura", f"Kunde inte skapa: {str(e)}")
 
+    def _remember_invoice_pdf(self, system_id, pdf_path):
+        self._pdf_cache[system_id] = pdf_path
+        self._pdf_cache.move_to_end(system_id)
+        while len(self._pdf_cache) > _PDF_CACHE_SIZE:
+            self._pdf_cache.popitem(last=False)
+
+    def _invoice_pdf_path(self, invoice_id):
+        """Plaintext file for a stored invoice; decrypted only the first time it is opened"""
+        pdf_path = os.path.join(get_invoice_cache_dir(), f"invoice_{invoice_id}.pdf")
+        if not os.path.exists(pdf_path):
+            rec = self.db_manager.fetch_one("SELECT pdf_encrypted FROM invoices WHERE id = ?", (invoice_id,))
+            if not rec or not rec[0]:
+                return None
+            with open(pdf_path, 'wb') as f:
+                f.write(self.db_manager.decrypt_pdf(rec[0]))
+        return pdf_path
+
     def _load_invoice_encrypted(self, system_id):
-        rows = self.db_manager.execute_query(
-            "SELECT pdf_encrypted FROM invoices WHERE system_id = ? ORDER BY created_at DESC LIMIT 1",
-            (system_id,)
-        )
-        return rows[0][0] if rows else None
+        row = self.db_manager.fetch_one(_LATEST_INVOICE_QUERY, (system_id,))
+        return row[0] if row else None
 
     def view_invoice_stub(self):
         try:
             system = self._get_selected_system()
             if not system:
                 return
-            enc = self._load_invoice_encrypted(system['id'])
-            if not enc:
+            # A just-created invoice is still on disk; skip the fetch and decrypt
+            cached_path = self._pdf_cache.get(system['id'])
+            if cached_path and os.path.exists(cached_path):
+                self._pdf_cache.move_to_end(system['id'])
+                self._pdf_gen.open_pdf_in_browser(cached_path)
+                return
+            rec = self.db_manager.fetch_one(_LATEST_INVOICE_ID_QUERY, (system['id'],))
+            pdf_path = self._invoice_pdf_path(rec[0]) if rec else None
+            if not pdf_path:
                 CopyableMessageBox.information(self, "Faktura", "Ingen sparad faktura hittades. Skapa först.")
                 return
-            import base64, tempfile
-            b64 = self.db_manager.decrypt_data(enc)
-            pdf_bytes = base64.b64decode(b64.encode('utf-8'))
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-            tmp.write(pdf_bytes)
-            tmp.flush(); tmp.close()
-            OrderPDFGenerator().open_pdf_in_browser(tmp.name)
+            self._remember_invoice_pdf(system['id'], pdf_path)
+            self._pdf_gen.open_pdf_in_browser(pdf_path)
         except Exception as e:
             CopyableMessageBox.warning(self, "Faktura", f"Kunde inte visa: {str(e)}")
 
@@ -1726,9 +1624,7 @@ class MySystemsWindow(QWidget):
                 CopyableMessageBox.information(self, "Faktura", "Ingen sparad faktura hittades. Skapa först.")
                 return
             # Decode to bytes
-            import base64
-            b64 = self.db_manager.decrypt_data(enc)
-            pdf_bytes = base64.b64decode(b64.encode('utf-8'))
+            pdf_bytes = self.db_manager.decrypt_pdf(enc)
             # Prepare email
             auth = AuthManager(self.db_manager)
             smtp = auth.get_smtp_config()
@@ -1736,12 +1632,7 @@ class MySystemsWindow(QWidget):
             # Determine recipient from system's customer email
             recipient = None
             try:
-                cust_row = self.db_manager.execute_query(
-                    "SELECT email FROM customers WHERE id = ?",
-                    (system.get('customer_id'),)
-                )
-                if cust_row and cust_row[0] and cust_row[0][0]:
-                    recipient = cust_row[0][0]
+                recipient = self._customer_cache(system.get('customer_id')).get('email') or None
             except Exception:
                 recipient = None
             
@@ -1778,22 +1669,45 @@ class MySystemsWindow(QWidget):
             _enc.encode_base64(part)
             part.add_header('Content-Disposition', 'attachment', filename='faktura.pdf')
             msg.attach(part)
-            with smtplib.SMTP(smtp['server'], smtp['port']) as server:
-                if smtp.get('use_tls', True):
-                    server.starttls()
-                server.login(smtp['email'], smtp['password'])
-                server.sendmail(smtp['email'], [recipient], msg.as_string())
-            CopyableMessageBox.information(self, "E‑post", f"Fakturan skickades till: {recipient}")
+            done = self.invoice_mail_done
+            
+            def run():
+                # SMTP handshake, TLS and upload happen off the UI thread
+                error = None
+                try:
+                    with smtplib.SMTP(smtp['server'], smtp['port']) as server:
+                        server.ehlo()
+                        if smtp.get('use_tls', True):
+                            server.starttls()
+                            server.ehlo()
+                        server.login(smtp['email'], smtp['password'])
+                        # send_message serializes straight to bytes (no as_string() copy of the PDF)
+                        server.send_message(msg, from_addr=smtp['email'], to_addrs=[recipient])
+                except Exception as e:
+                    error = e
+                try:
+                    done.emit((recipient, error))
+                except RuntimeError:
+                    # Window already destroyed
+                    pass
+            
+            QThreadPool.globalInstance().start(run)
         except Exception as e:
             CopyableMessageBox.warning(self, "E‑post", f"Kunde inte skicka: {str(e)}")
 
+    def _on_invoice_mail_done(self, result):
+        """Report the background invoice mail result on the UI thread"""
+        recipient, error = result
+        if error is not None:
+            CopyableMessageBox.warning(self, "E‑post", f"Kunde inte skicka: {str(error)}")
+        else:
+            CopyableMessageBox.information(self, "E‑post", f"Fakturan skickades till: {recipient}")
+
     def on_selection_changed(self):
         """Handle table selection changes"""
-        selected_items = self.systems_table.selectedItems()
-        
         # Enable/disable buttons based on selection
         # Add any buttons that should be enabled/disabled here
-        has_sel = self.systems_table.currentRow() >= 0
+        has_sel = self._current_source_row() >= 0
         if hasattr(self, 'invoice_btn') and self.invoice_btn.isVisible():
             self.invoice_btn.setEnabled(has_sel)
         if hasattr(self, 'invoice_history_btn'):
@@ -1801,14 +1715,15 @@ class MySystemsWindow(QWidget):
     
     def update_edit_button_state(self):
         """Update edit button state based on selection"""
-        current_row = self.systems_table.currentRow()
-        self.edit_system_btn.setEnabled(current_row >= 0)
-        self.return_key_fob_btn.setEnabled(current_row >= 0)
+        has_sel = self._current_source_row() >= 0
+        self.edit_system_btn.setEnabled(has_sel)
+        self.return_key_fob_btn.setEnabled(has_sel)
     
     def edit_selected_system(self):
         """Edit selected system data"""
-        current_row = self.systems_table.currentRow()
-        if current_row < 0:
+        # Get system data
+        system_data = self._get_selected_system_detail()
+        if not system_data:
             CopyableMessageBox.warning(
                 self,
                 "Ingen rad vald",
@@ -1816,16 +1731,12 @@ class MySystemsWindow(QWidget):
             )
             return
         
-        # Get system data
-        item = self.systems_table.item(current_row, 0)
-        system_data = item.data(Qt.UserRole)
-        
         # Create edit dialog
         dialog = ModernEditSystemDialog(system_data, self.db_manager, self.translation_manager, self)
-        dialog.system_updated.connect(self.refresh_data)
         if dialog.exec() == QDialog.Accepted:
-            # Refresh table to show updated data
-            self.refresh_data()
+            self._customer_cache.cache_clear()
+            # Update the edited customer's rows in place instead of reloading the table
+            self.refresh_customer_rows(system_data['customer_id'])
             CopyableMessageBox.information(
                 self,
                 "System uppdaterat",
@@ -1834,8 +1745,9 @@ class MySystemsWindow(QWidget):
     
     def return_key_fob(self):
         """Handle key fob return and data deletion"""
-        current_row = self.systems_table.currentRow()
-        if current_row < 0:
+        # Get system data
+        system_data = self._get_selected_system_detail()
+        if not system_data:
             CopyableMessageBox.warning(
                 self,
                 "Ingen rad vald",
@@ -1843,10 +1755,6 @@ class MySystemsWindow(QWidget):
             )
             return
         
-        # Get system data
-        item = self.systems_table.item(current_row, 0)
-        system_data = item.data(Qt.UserRole)
-        
         # Create confirmation dialog
         dialog = KeyFobReturnDialog(system_data, self.db_manager, self)
         if dialog.exec() == QDialog.Accepted:
@@ -3,21 +3,140 @@ Orders window for viewing and managing key manufacturing orders
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                              QTableWidget, QTableWidgetItem, QPushButton, 
+                              QTableView, QPushButton, 
                               QHeaderView, QMessageBox, QFileDialog, QDateEdit,
                               QFormLayout, QGroupBox, QComboBox, QAbstractItemView,
                               QSizePolicy, QMenu, QAbstractScrollArea)
-from PySide6.QtCore import Qt, Signal, QDate, QTimer, QEvent
+from PySide6.QtCore import Qt, Signal, QDate, QTimer, QEvent, QAbstractTableModel, QModelIndex, QThreadPool
 from PySide6.QtGui import QFont
 # Print and PDF imports removed - will be rebuilt
 import os
+import time
 from datetime import datetime
 
 from .styles import AnimatedButton
 from .copyable_message_box import CopyableMessageBox
 from ..core.pdf_generator import OrderPDFGenerator
 
-class OrdersTable(QTableWidget):
+# How long a prefetched orders result may be used instead of a fresh query
+ORDERS_PREFETCH_TTL = 10.0
+
+# Tables holding an encrypted PDF per order (order_id is UNIQUE in both)
+RECEIPTS_TABLE = "key_receipts"
+MANUFACTURING_TABLE = "manufacturing_orders"
+_ORDER_PDF_QUERIES = {
+    table: f"SELECT pdf_encrypted FROM {table} WHERE order_id = ?"
+    for table in (RECEIPTS_TABLE, MANUFACTURING_TABLE)
+}
+
+
+def build_orders_query(date_from, date_to, company="Alla", responsible="Alla"):
+    """Build the orders list query and its parameters for the given filters"""
+    query = """
+        SELECT 
+            o.id,
+            date(o.order_date) as order_date,
+            c.company,
+            o.key_code,
+            o.key_profile,
+            o.quantity,
+            o.sequence_start,
+            o.sequence_end,
+            datetime(o.order_date) as full_order_date,
+            ks.key_code as ks_key_code,
+            ks.key_profile as ks_key_profile,
+            ks.key_code2,
+            ks.profile2,
+            ks.delning,
+            ks.fabrikat2,
+            ks.koncept2,
+            o.key_responsible
+        FROM orders o
+        JOIN customers c ON o.customer_id = c.id
+        JOIN key_systems ks ON o.key_system_id = ks.id
+        WHERE o.order_date >= ? AND o.order_date < date(?, '+1 day')
+    """
+    
+    params = [date_from, date_to]
+    
+    # Add company filter if not "Alla"
+    if company != "Alla":
+        query += " AND c.company = ?"
+        params.append(company)
+    
+    # Add responsible filter if not "Alla"
+    if responsible != "Alla":
+        query += " AND c.key_responsible_1 = ?"
+        params.append(responsible)
+    
+    query += " ORDER BY o.order_date DESC"
+    return query, tuple(params)
+
+
+def smart_display_from_row(order):
+    """Pick (key_code, key_profile) for an orders list row: Nyckelkort if filled in, else Standard & System-nycklar"""
+    # ks.key_code (9), ks.key_profile (10)
+    if (order[9] and order[9].strip()) or (order[10] and order[10].strip()):
+        return order[9] or '', order[10] or ''
+    # ks.key_code2 (11), ks.profile2 (12), ks.delning (13)
+    if (order[11] and order[11].strip()) or (order[12] and order[12].strip()) or (order[13] and order[13].strip()):
+        return order[11] or '', order[12] or ''
+    return '', ''
+
+
+class OrdersModel(QAbstractTableModel):
+    """Table model for the orders list, backed by plain Python rows"""
+
+    HEADERS = [
+        "ID", "Datum", "Företag", "Nyckelkod", "Profil",
+        "Antal", "Löp.nr", "Nyckelansvarig 1"
+    ]
+    ROW_TOOLTIP = "Högerklicka för flera val"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._orders = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ToolTipRole:
+            return self.ROW_TOOLTIP
+        if role == Qt.TextAlignmentRole and index.column() == 0:
+            return int(Qt.AlignCenter)
+        if role == Qt.UserRole:
+            return self._orders[index.row()]
+        return None
+
+    def set_orders(self, rows, orders):
+        """Replace all rows with prepared display tuples and the query rows they came from"""
+        self.beginResetModel()
+        self._rows = rows
+        self._orders = orders
+        self.endResetModel()
+
+    def order_id_at(self, row):
+        """Return the order id shown on a row, or None"""
+        if 0 <= row < len(self._orders):
+            return self._orders[row][0]
+        return None
+
+
+class OrdersTable(QTableView):
     """Custom table to ensure right-click context menu works reliably."""
     def __init__(self, parent_window):
         super().__init__(parent_window)
@@ -53,20 +172,38 @@ class OrdersWindow(QWidget):
     """Window for viewing and managing orders"""
     
     navigate_home = Signal()
+    # (order_id, pdf_path, error) from a manufacturing order built on the thread pool
+    manufacturing_pdf_ready = Signal(object)
     
     def __init__(self, app_manager, db_manager, translation_manager):
         super().__init__()
         self.app_manager = app_manager
         self.db_manager = db_manager
         self.translation_manager = translation_manager
+        # Rows currently shown; a refresh that returns the same rows leaves the table alone
+        self._shown_orders = None
+        # Row count the columns were last sized for
+        self._last_row_count = None
+        # One generator for the PDFs opened and exported from this window
+        self._pdf_gen = OrderPDFGenerator()
+        
+        self.manufacturing_pdf_ready.connect(self._on_manufacturing_pdf_ready)
         
         self.setup_ui()
         self.refresh_data()
         
-        # Setup timer for automatic updates
-        self.update_timer = QTimer()
+        # Timer for automatic updates; only runs while the page is visible
+        self.update_timer = QTimer(self)
+        self.update_timer.setInterval(3000)  # Update every 3 seconds
         self.update_timer.timeout.connect(self.refresh_data)
-        self.update_timer.start(3000)  # Update every 3 seconds
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_timer.start()
+    
+    def hideEvent(self, event):
+        self.update_timer.stop()
+        super().hideEvent(event)
     
     def setup_ui(self):
         """Setup orders UI"""
@@ -203,13 +340,8 @@ class OrdersWindow(QWidget):
     
     def setup_table(self):
         """Setup orders table"""
-        headers = [
-            "ID", "Datum", "Företag", "Nyckelkod", "Profil", 
-            "Antal", "Löp.nr", "Nyckelansvarig 1"
-        ]
-        
-        self.orders_table.setColumnCount(len(headers))
-        self.orders_table.setHorizontalHeaderLabels(headers)
+        self.orders_model = OrdersModel(self)
+        self.orders_table.setModel(self.orders_model)
         
         # Set column widths
         header = self.orders_table.horizontalHeader()
@@ -227,6 +359,27 @@ class OrdersWindow(QWidget):
             header.setMinimumSectionSize(120)
         except Exception:
             pass
+        # Rows keep the style's default height; never measure them per row
+        self.orders_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # Enforce no horizontal scroll
+        header.setStretchLastSection(True)
+        self.orders_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        # Use DefaultContextMenu; our OrdersTable subclass handles contextMenuEvent
+        try:
+            self.orders_table.setContextMenuPolicy(Qt.DefaultContextMenu)
+            self.orders_table.viewport().setContextMenuPolicy(Qt.DefaultContextMenu)
+        except Exception:
+            pass
+
+        # Set selection behavior - select entire rows, single selection for clarity
+        self.orders_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.orders_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.orders_table.setAlternatingRowColors(True)
+        # Table styling handled by global CSS
+
+        # Disable editing - prevent double-click editing
+        self.orders_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
     def eventFilter(self, obj, event):
         try:
@@ -249,40 +402,6 @@ class OrdersWindow(QWidget):
         except Exception:
             pass
         return super().eventFilter(obj, event)
-        # Explicit widths for compact columns
-        try:
-            self.orders_table.setColumnWidth(0, 50)   # ID
-            self.orders_table.setColumnWidth(4, 70)   # Profil
-            self.orders_table.setColumnWidth(5, 60)   # Antal
-        except Exception:
-            pass
-        
-        # Enable sorting
-        self.orders_table.setSortingEnabled(True)
-
-        # Use DefaultContextMenu; our OrdersTable subclass handles contextMenuEvent
-        try:
-            self.orders_table.setContextMenuPolicy(Qt.DefaultContextMenu)
-            self.orders_table.viewport().setContextMenuPolicy(Qt.DefaultContextMenu)
-        except Exception:
-            pass
-
-        # Set selection behavior - select entire rows, single selection for clarity
-        self.orders_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.orders_table.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.orders_table.setAlternatingRowColors(True)
-        # Table styling handled by global CSS
-        # Force full-row selection when any cell is pressed
-        try:
-            self.orders_table.itemPressed.connect(lambda it: self.orders_table.selectRow(it.row()))
-        except Exception:
-            pass
-        # Do not use double-click to open items; use context menu instead
-
-        # Disable editing - prevent double-click editing
-        self.orders_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-
-        # Ensure we keep CustomContextMenu to use our styled popup (no ActionsContextMenu)
 
     def on_orders_context_menu(self, point):
         try:
@@ -295,7 +414,7 @@ class OrdersWindow(QWidget):
             index = self.orders_table.indexAt(vp_point)
             row = index.row() if index.isValid() else self.orders_table.rowAt(vp_point.y())
             if row is None or row < 0:
-                row = self.orders_table.currentRow()
+                row = self.orders_table.currentIndex().row()
             if row is None or row < 0:
                 return
             # Ensure the row is selected for user feedback
@@ -315,62 +434,41 @@ class OrdersWindow(QWidget):
             act_open_receipt = menu.addAction("Öppna nyckelkvittens")
             act_open_mo = menu.addAction("Öppna tillverkningsorder")
             chosen = menu.exec(self.orders_table.viewport().mapToGlobal(vp_point))
-            order_id = int(self.orders_table.item(row, 0).text())
+            order_id = self.orders_model.order_id_at(row)
+            if order_id is None:
+                return
             if chosen == act_open_receipt:
                 # Only open if a receipt exists
-                data_rows = self.db_manager.execute_query(
-                    "SELECT pdf_encrypted FROM key_receipts WHERE order_id = ?",
-                    (order_id,)
-                )
-                if not data_rows:
-                    return
-                enc = data_rows[0][0]
-                b64 = self.db_manager.decrypt_data(enc)
-                import base64, tempfile
-                pdf_bytes = base64.b64decode(b64.encode('utf-8'))
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-                tmp.write(pdf_bytes); tmp.flush(); tmp.close()
-                OrderPDFGenerator().open_pdf_in_browser(tmp.name)
+                self._open_pdf_by_order(order_id, RECEIPTS_TABLE)
             elif chosen == act_open_mo:
                 # Open if exists, else generate
-                data_rows = self.db_manager.execute_query(
-                    "SELECT pdf_encrypted FROM manufacturing_orders WHERE order_id = ?",
-                    (order_id,)
-                )
-                if data_rows:
-                    enc = data_rows[0][0]
-                    b64 = self.db_manager.decrypt_data(enc)
-                    import base64, tempfile
-                    pdf_bytes = base64.b64decode(b64.encode('utf-8'))
-                    tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-                    tmp.write(pdf_bytes); tmp.flush(); tmp.close()
-                    OrderPDFGenerator().open_pdf_in_browser(tmp.name)
-                else:
+                if not self._open_pdf_by_order(order_id, MANUFACTURING_TABLE):
                     self.generate_and_store_manufacturing(order_id)
         except Exception:
             pass
 
+    def _open_pdf_by_order(self, order_id, table):
+        """Decrypt the PDF stored for an order in table and open it; returns False if none is stored"""
+        row = self.db_manager.fetch_one(_ORDER_PDF_QUERIES[table], (order_id,))
+        if not row:
+            return False
+        # Imported here; my_systems_window imports this module
+        from .my_systems_window import get_invoice_cache_dir
+        # Decrypted copies live in the cache dir, which is cleared at logout and exit
+        pdf_path = os.path.join(get_invoice_cache_dir(), f"{table}_{order_id}.pdf")
+        with open(pdf_path, 'wb') as f:
+            f.write(self.db_manager.decrypt_pdf(row[0]))
+        self._pdf_gen.open_pdf_in_browser(pdf_path)
+        return True
+
     def open_receipt_for_row(self, row: int):
         try:
             if row is None or row < 0:
                 return
-            order_id_item = self.orders_table.item(row, 0)
-            if not order_id_item:
-                return
-            order_id = int(order_id_item.text())
-            data_rows = self.db_manager.execute_query(
-                "SELECT pdf_encrypted FROM key_receipts WHERE order_id = ?",
-                (order_id,)
-            )
-            if not data_rows:
+            order_id = self.orders_model.order_id_at(row)
+            if order_id is None:
                 return
-            enc = data_rows[0][0]
-            b64 = self.db_manager.decrypt_data(enc)
-            import base64, tempfile
-            pdf_bytes = base64.b64decode(b64.encode('utf-8'))
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-            tmp.write(pdf_bytes); tmp.flush(); tmp.close()
-            OrderPDFGenerator().open_pdf_in_browser(tmp.name)
+            self._open_pdf_by_order(order_id, RECEIPTS_TABLE)
         except Exception:
             pass
 
@@ -378,23 +476,10 @@ class OrdersWindow(QWidget):
         try:
             if row is None or row < 0:
                 return
-            order_id_item = self.orders_table.item(row, 0)
-            if not order_id_item:
+            order_id = self.orders_model.order_id_at(row)
+            if order_id is None:
                 return
-            order_id = int(order_id_item.text())
-            data_rows = self.db_manager.execute_query(
-                "SELECT pdf_encrypted FROM manufacturing_orders WHERE order_id = ?",
-                (order_id,)
-            )
-            if data_rows:
-                enc = data_rows[0][0]
-                b64 = self.db_manager.decrypt_data(enc)
-                import base64, tempfile
-                pdf_bytes = base64.b64decode(b64.encode('utf-8'))
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-                tmp.write(pdf_bytes); tmp.flush(); tmp.close()
-                OrderPDFGenerator().open_pdf_in_browser(tmp.name)
-            else:
+            if not self._open_pdf_by_order(order_id, MANUFACTURING_TABLE):
                 self.generate_and_store_manufacturing(order_id)
         except Exception:
             pass
@@ -413,14 +498,16 @@ class OrdersWindow(QWidget):
         """Populate responsible filter dropdown with all key responsibles from database"""
         try:
             # Get all unique key responsibles from customers table
+            # UNION already deduplicates; filter empty values once on the combined set
             query = """
-                SELECT DISTINCT responsible FROM (
-                    SELECT key_responsible_1 as responsible FROM customers WHERE key_responsible_1 IS NOT NULL AND key_responsible_1 != ''
+                SELECT responsible FROM (
+                    SELECT key_responsible_1 as responsible FROM customers
                     UNION
-                    SELECT key_responsible_2 as responsible FROM customers WHERE key_responsible_2 IS NOT NULL AND key_responsible_2 != ''
+                    SELECT key_responsible_2 FROM customers
                     UNION
-                    SELECT key_responsible_3 as responsible FROM customers WHERE key_responsible_3 IS NOT NULL AND key_responsible_3 != ''
-                ) ORDER BY responsible
+                    SELECT key_responsible_3 FROM customers
+                ) WHERE responsible IS NOT NULL AND responsible != ''
+                ORDER BY responsible
             """
             responsibles = self.db_manager.execute_query(query)
             
@@ -439,49 +526,20 @@ class OrdersWindow(QWidget):
             date_from = self.date_from.date().toString("yyyy-MM-dd")
             date_to = self.date_to.date().toString("yyyy-MM-dd")
             
-            query = """
-                SELECT 
-                    o.id,
-                    date(o.order_date) as order_date,
-                    c.company,
-                    o.key_code,
-                    o.key_profile,
-                    o.quantity,
-                    o.sequence_start,
-                    o.sequence_end,
-                    datetime(o.order_date) as full_order_date,
-                    ks.key_code as ks_key_code,
-                    ks.key_profile as ks_key_profile,
-                    ks.key_code2,
-                    ks.profile2,
-                    ks.delning,
-                    ks.fabrikat2,
-                    ks.koncept2
-                FROM orders o
-                JOIN customers c ON o.customer_id = c.id
-                JOIN key_systems ks ON o.key_system_id = ks.id
-                WHERE date(o.order_date) BETWEEN ? AND ?
-            """
-            
-            params = [date_from, date_to]
-            
-            # Add company filter if not "Alla"
-            selected_company = self.company_combo.currentText()
-            if selected_company != "Alla":
-                query += " AND c.company = ?"
-                params.append(selected_company)
-            
-            # Add responsible filter if not "Alla"
-            selected_responsible = self.responsible_combo.currentText()
-            if selected_responsible != "Alla":
-                query += " AND c.key_responsible_1 = ?"
-                params.append(selected_responsible)
-            
-            query += " ORDER BY o.order_date DESC"
+            query, params = build_orders_query(
+                date_from, date_to,
+                self.company_combo.currentText(),
+                self.responsible_combo.currentText()
+            )
             
-            orders = self.db_manager.execute_query(query, params)
+            orders = self._take_prefetched_orders(query, params)
+            if orders is None:
+                orders = self.db_manager.execute_query(query, params)
             
+            if orders == self._shown_orders:
+                return
             self.populate_table(orders)
+            self._shown_orders = orders
             
         except Exception as e:
             CopyableMessageBox.critical(
@@ -490,319 +548,179 @@ class OrdersWindow(QWidget):
                 f"Kunde inte ladda ordrar: {str(e)}"
             )
     
-    def get_smart_display_data(self, system_data):
-        """Smart logic to choose between Nyckelkort and Standard & System-nycklar data for display"""
-        # Check if Nyckelkort data exists
-        nyckelkort_has_data = (
-            system_data.get('key_code', '').strip() or
-            system_data.get('key_profile', '').strip() or
-            system_data.get('key_location', '').strip()
-        )
-        
-        # Check if Standard & System-nycklar data exists
-        standard_has_data = (
-            system_data.get('key_code2', '').strip() or
-            system_data.get('profile2', '').strip() or
-            system_data.get('delning', '').strip() or
-            system_data.get('key_location2', '').strip()
-        )
-        
-        # Return the appropriate data set for display
-        if nyckelkort_has_data:
-            return {
-                'key_code': system_data.get('key_code', ''),
-                'key_profile': system_data.get('key_profile', ''),
-                'key_location': system_data.get('key_location', ''),
-                'data_source': 'nyckelkort'
-            }
-        elif standard_has_data:
-            return {
-                'key_code': system_data.get('key_code2', ''),  # Map key_code2 -> key_code
-                'key_profile': system_data.get('profile2', ''),  # Map profile2 -> key_profile
-                'key_location': system_data.get('key_location2', ''),  # Map key_location2 -> key_location
-                'data_source': 'standard'
-            }
-        else:
-            # No data in either, return empty
-            return {
-                'key_code': '',
-                'key_profile': '',
-                'key_location': '',
-                'data_source': 'none'
-            }
+    def _take_prefetched_orders(self, query, params):
+        """Use (once) orders prefetched for the same query if they are still fresh"""
+        prefetched = getattr(self.app_manager, 'prefetched_orders', None)
+        if not prefetched:
+            return None
+        self.app_manager.prefetched_orders = None
+        key, fetched_at, rows, generation = prefetched
+        if (key != (query, params) or generation != self.app_manager.orders_generation
+                or time.monotonic() - fetched_at > ORDERS_PREFETCH_TTL):
+            return None
+        return rows
     
     def populate_table(self, orders):
         """Populate table with orders data"""
-        self.orders_table.setRowCount(len(orders))
-        
-        for row, order in enumerate(orders):
+        rows = []
+        for order in orders:
             # Apply smart data logic for display
-            system_data = {
-                'key_code': order[9] if len(order) > 9 else '',  # ks.key_code
-                'key_profile': order[10] if len(order) > 10 else '',  # ks.key_profile
-                'key_code2': order[11] if len(order) > 11 else '',
-                'profile2': order[12] if len(order) > 12 else '',
-                'delning': order[13] if len(order) > 13 else '',
-                'fabrikat2': order[14] if len(order) > 14 else '',
-                'koncept2': order[15] if len(order) > 15 else '',
-            }
-            smart_data = self.get_smart_display_data(system_data)
-            
-            # Access by index to avoid key errors
-            id_item = QTableWidgetItem(str(order[0]))
-            id_item.setTextAlignment(Qt.AlignCenter)
-            try:
-                id_item.setFlags(id_item.flags() & ~Qt.ItemIsEditable)
-            except Exception:
-                pass
-            self.orders_table.setItem(row, 0, id_item)  # id
-            
-            # Use smart data for key fields, original data for others
-            display_data = [
-                order[1] or '',  # date
-                order[2] or '',  # company
-                smart_data.get('key_code', '') or '',  # smart key_code
-                smart_data.get('key_profile', '') or '',  # smart key_profile
-                str(order[5] or 0)  # quantity
-            ]
-            
-            for col, val in enumerate(display_data, 1):
-                item = QTableWidgetItem(val)
-                try:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                except Exception:
-                    pass
-                self.orders_table.setItem(row, col, item)
+            key_code, key_profile = smart_display_from_row(order)
             
             # Create sequence range from start and end
             sequence_range = f"{order[6]}-{order[7]}" if order[6] and order[7] else ''
-            seq_item = QTableWidgetItem(sequence_range)
-            try:
-                seq_item.setFlags(seq_item.flags() & ~Qt.ItemIsEditable)
-            except Exception:
-                pass
-            self.orders_table.setItem(row, 6, seq_item)
             
-            # Get responsible from order data (key_responsible column)
-            try:
-                # Get key_responsible from orders table
-                responsible_query = "SELECT key_responsible FROM orders WHERE id = ?"
-                responsible_result = self.db_manager.execute_query(responsible_query, (order[0],))
-                responsible = responsible_result[0][0] if responsible_result and responsible_result[0] else 'Nyckelansvarig 1'
-                resp_item = QTableWidgetItem(responsible or 'Nyckelansvarig 1')
-                try:
-                    resp_item.setFlags(resp_item.flags() & ~Qt.ItemIsEditable)
-                except Exception:
-                    pass
-                self.orders_table.setItem(row, 7, resp_item)
-            except:
-                empty_item = QTableWidgetItem('')
-                try:
-                    empty_item.setFlags(empty_item.flags() & ~Qt.ItemIsEditable)
-                except Exception:
-                    pass
-                self.orders_table.setItem(row, 7, empty_item)
-
-            # Store order data as dictionary for export
-            order_dict = {
-                'id': order[0],
-                'order_date': order[1],
-                'company': order[2],
-                'key_code': order[3],
-                'key_profile': order[4],
-                'quantity': order[5],
-                'sequence_start': order[6],
-                'sequence_end': order[7]
-            }
+            # Responsible comes with the list query (o.key_responsible)
+            responsible = order[16] or 'Nyckelansvarig 1'
             
-            item = self.orders_table.item(row, 0)
-            item.setData(Qt.UserRole, order_dict)
-            # No extra columns stored
-            # Add hover tooltip to the entire row
-            try:
-                for c in range(self.orders_table.columnCount()):
-                    cell = self.orders_table.item(row, c)
-                    if cell:
-                        cell.setToolTip("Högerklicka för flera val")
-            except Exception:
-                pass
-
-        # After populating, resize and enforce no horizontal scroll
+            # Use smart data for key fields, original data for others
+            rows.append((
+                str(order[0]),
+                order[1] or '',  # date
+                order[2] or '',  # company
+                key_code,  # smart key_code
+                key_profile,  # smart key_profile
+                str(order[5] or 0),  # quantity
+                sequence_range,
+                responsible,
+            ))
+        
+        # Swap the rows in and size the columns with one repaint at the end
+        self.orders_table.setUpdatesEnabled(False)
         try:
-            self.orders_table.resizeColumnsToContents()
-            self.orders_table.setColumnWidth(0, 50)
-            self.orders_table.setColumnWidth(4, 70)
-            self.orders_table.setColumnWidth(5, 60)
-            self.orders_table.horizontalHeader().setStretchLastSection(True)
-            self.orders_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            # Reinforce row selection behavior
-            self.orders_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-            self.orders_table.setSelectionMode(QAbstractItemView.SingleSelection)
+            # The model keeps the query rows themselves (UserRole, order ids); no per-row copies
+            self.orders_model.set_orders(rows, orders)
+            # Re-measure columns only when the number of rows changed
+            if len(rows) != self._last_row_count:
+                self._last_row_count = len(rows)
+                self.orders_table.resizeColumnsToContents()
+                self.orders_table.setColumnWidth(0, 50)
+                self.orders_table.setColumnWidth(4, 70)
+                self.orders_table.setColumnWidth(5, 60)
         except Exception:
             pass
+        finally:
+            self.orders_table.setUpdatesEnabled(True)
 
-    def on_table_double_clicked(self, item):
+    def on_table_double_clicked(self, index):
         """Open receipt or manufacturing order PDF on double-click"""
-        try:
-            row = item.row()
-            order_id_item = self.orders_table.item(row, 0)
-            if not order_id_item:
-                return
-            order_id = int(order_id_item.text())
-            col = item.column()
-            if col == 8:  # Nyckelkvittens column
-                receipt_item = self.orders_table.item(row, 8)
-                has_receipt = receipt_item and (receipt_item.data(Qt.UserRole) is True or receipt_item.text() == "Ja")
-                if not has_receipt:
-                    return
-                # Fetch and decrypt PDF
-                data_rows = self.db_manager.execute_query(
-                    "SELECT pdf_encrypted FROM key_receipts WHERE order_id = ?",
-                    (order_id,)
-                )
-                if not data_rows:
-                    return
-                enc = data_rows[0][0]
-                b64 = self.db_manager.decrypt_data(enc)
-                import base64, tempfile
-                pdf_bytes = base64.b64decode(b64.encode('utf-8'))
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-                tmp.write(pdf_bytes)
-                tmp.flush()
-                tmp.close()
-                from ..core.pdf_generator import OrderPDFGenerator
-                gen = OrderPDFGenerator()
-                gen.open_pdf_in_browser(tmp.name)
-            elif col == 9:  # Tillverkningsorder column
-                mo_item = self.orders_table.item(row, 9)
-                has_mo = mo_item and (mo_item.data(Qt.UserRole) is True or mo_item.text() == "Öppna")
-                if has_mo:
-                    # Open existing manufacturing order
-                    data_rows = self.db_manager.execute_query(
-                        "SELECT pdf_encrypted FROM manufacturing_orders WHERE order_id = ?",
-                        (order_id,)
-                    )
-                    if not data_rows:
-                        return
-                    enc = data_rows[0][0]
-                    b64 = self.db_manager.decrypt_data(enc)
-                    import base64, tempfile
-                    pdf_bytes = base64.b64decode(b64.encode('utf-8'))
-                    tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-                    tmp.write(pdf_bytes)
-                    tmp.flush()
-                    tmp.close()
-                    from ..core.pdf_generator import OrderPDFGenerator
-                    gen = OrderPDFGenerator()
-                    gen.open_pdf_in_browser(tmp.name)
-                else:
-                    # Generate, store, and open manufacturing order PDF
-                    self.generate_and_store_manufacturing(order_id)
-        except Exception as e:
-            CopyableMessageBox.warning(self, "Öppna", f"Kunde inte öppna: {str(e)}")
+        col = index.column()
+        if col == 8:  # Nyckelkvittens column
+            self.open_receipt_for_row(index.row())
+        elif col == 9:  # Tillverkningsorder column
+            self.open_or_create_manufacturing_for_row(index.row())
 
     def generate_and_store_manufacturing(self, order_id: int):
-        """Generate manufacturing order PDF, encrypt & store, then open."""
-        try:
-            # Fetch full data for order including all fields for smart data selection
-            row = self.db_manager.execute_query(
-                """
-                SELECT o.id, o.quantity, o.sequence_start, o.sequence_end, o.key_responsible,
-                       ks.id as system_id, ks.key_code, ks.key_profile, ks.series_id, ks.fabrikat, ks.koncept,
-                       ks.key_code2, ks.system_number, ks.profile2, ks.delning, ks.key_location2, 
-                       ks.fabrikat2, ks.koncept2, ks.flex1, ks.flex2, ks.flex3, ks.notes,
-                       c.company, c.project
-                FROM orders o
-                JOIN key_systems ks ON o.key_system_id = ks.id
-                JOIN customers c ON o.customer_id = c.id
-                WHERE o.id = ?
-                """,
-                (order_id,)
-            )
-            if not row:
-                return
-            row = row[0]
-            system_data = {
-                'id': row['system_id'] if 'system_id' in row.keys() else row[5],
-                'key_code': row['key_code'] if 'key_code' in row.keys() else row[6],
-                'key_profile': row['key_profile'] if 'key_profile' in row.keys() else row[7],
-                'series_id': row['series_id'] if 'series_id' in row.keys() else row[8],
-                'fabrikat': row['fabrikat'] if 'fabrikat' in row.keys() else row[9],
-                'koncept': row['koncept'] if 'koncept' in row.keys() else row[10],
-                # Standard & System-nycklar fields
-                'key_code2': row['key_code2'] if 'key_code2' in row.keys() else row[11],
-                'system_number': row['system_number'] if 'system_number' in row.keys() else row[12],
-                'profile2': row['profile2'] if 'profile2' in row.keys() else row[13],
-                'delning': row['delning'] if 'delning' in row.keys() else row[14],
-                'key_location2': row['key_location2'] if 'key_location2' in row.keys() else row[15],
-                'fabrikat2': row['fabrikat2'] if 'fabrikat2' in row.keys() else row[16],
-                'koncept2': row['koncept2'] if 'koncept2' in row.keys() else row[17],
-                'flex1': row['flex1'] if 'flex1' in row.keys() else row[18],
-                'flex2': row['flex2'] if 'flex2' in row.keys() else row[19],
-                'flex3': row['flex3'] if 'flex3' in row.keys() else row[20],
-                'notes': row['notes'] if 'notes' in row.keys() else row[21],
-            }
-            order_data = {
-                'quantity': row['quantity'] if 'quantity' in row.keys() else row[1],
-                'sequence_start': row['sequence_start'] if 'sequence_start' in row.keys() else row[2],
-                'sequence_end': row['sequence_end'] if 'sequence_end' in row.keys() else row[3],
-                'key_responsible': row['key_responsible'] if 'key_responsible' in row.keys() else row[4],
-            }
-            customer_data = {
-                'company': row['company'] if 'company' in row.keys() else row[22],
-                'project': row['project'] if 'project' in row.keys() else row[23],
-            }
-            current_user = self.app_manager.get_current_user()
-            logo_path = self.get_logo_path()
-            gen = OrderPDFGenerator()
-            pdf_path = gen.generate_order_pdf(system_data, order_data, customer_data, current_user, logo_path)
-            # Read and encrypt
-            import base64
-            with open(pdf_path, 'rb') as f:
-                pdf_bytes = f.read()
-            b64 = base64.b64encode(pdf_bytes).decode('utf-8')
-            enc = self.db_manager.encrypt_data(b64)
+        """Generate manufacturing order PDF, encrypt & store, then open (built on the thread pool)."""
+        current_user = self.app_manager.get_current_user()
+        logo_path = self.get_logo_path()
+        ready = self.manufacturing_pdf_ready
+        
+        def run():
             try:
-                self.db_manager.execute_update(
-                    "INSERT INTO manufacturing_orders (order_id, pdf_encrypted) VALUES (?, ?)",
-                    (order_id, enc)
-                )
-            except Exception:
-                self.db_manager.execute_update(
-                    "UPDATE manufacturing_orders SET pdf_encrypted = ? WHERE order_id = ?",
-                    (enc, order_id)
-                )
-            gen.open_pdf_in_browser(pdf_path)
+                pdf_path = self._build_and_store_manufacturing(order_id, current_user, logo_path)
+                result = (order_id, pdf_path, None)
+            except Exception as e:
+                result = (order_id, None, str(e))
+            try:
+                ready.emit(result)
+            except RuntimeError:
+                # Window already destroyed
+                pass
+        
+        QThreadPool.globalInstance().start(run)
+    
+    def _on_manufacturing_pdf_ready(self, result):
+        """Open a freshly stored manufacturing order and show it in the table"""
+        order_id, pdf_path, error = result
+        if error:
+            CopyableMessageBox.warning(self, "Export", f"Kunde inte skapa tillverkningsorder: {error}")
+            return
+        if pdf_path:
+            self._pdf_gen.open_pdf_in_browser(pdf_path)
             # Update cell to 'Öppna'
             self.refresh_data()
-        except Exception as e:
-            CopyableMessageBox.warning(self, "Export", f"Kunde inte skapa tillverkningsorder: {str(e)}")
+    
+    def _build_and_store_manufacturing(self, order_id, current_user, logo_path):
+        """Build and store the manufacturing order PDF; no widgets touched, safe off the UI thread"""
+        # Fetch full data for order including all fields for smart data selection
+        row = self.db_manager.fetch_one(
+            """
+            SELECT o.id, o.quantity, o.sequence_start, o.sequence_end, o.key_responsible,
+                   ks.id as system_id, ks.key_code, ks.key_profile, ks.series_id, ks.fabrikat, ks.koncept,
+                   ks.key_code2, ks.system_number, ks.profile2, ks.delning, ks.key_location2, 
+                   ks.fabrikat2, ks.koncept2, ks.flex1, ks.flex2, ks.flex3, ks.notes,
+                   c.company, c.project
+            FROM orders o
+            JOIN key_systems ks ON o.key_system_id = ks.id
+            JOIN customers c ON o.customer_id = c.id
+            WHERE o.id = ?
+            """,
+            (order_id,)
+        )
+        if not row:
+            return None
+        system_data = {
+            'id': row['system_id'],
+            'key_code': row['key_code'],
+            'key_profile': row['key_profile'],
+            'series_id': row['series_id'],
+            'fabrikat': row['fabrikat'],
+            'koncept': row['koncept'],
+            # Standard & System-nycklar fields
+            'key_code2': row['key_code2'],
+            'system_number': row['system_number'],
+            'profile2': row['profile2'],
+            'delning': row['delning'],
+            'key_location2': row['key_location2'],
+            'fabrikat2': row['fabrikat2'],
+            'koncept2': row['koncept2'],
+            'flex1': row['flex1'],
+            'flex2': row['flex2'],
+            'flex3': row['flex3'],
+            'notes': row['notes'],
+        }
+        order_data = {
+            'quantity': row['quantity'],
+            'sequence_start': row['sequence_start'],
+            'sequence_end': row['sequence_end'],
+            'key_responsible': row['key_responsible'],
+        }
+        customer_data = {
+            'company': row['company'],
+            'project': row['project'],
+        }
+        gen = OrderPDFGenerator()
+        pdf_path = gen.generate_order_pdf(system_data, order_data, customer_data, current_user, logo_path)
+        # Read and encrypt
+        with open(pdf_path, 'rb') as f:
+            pdf_bytes = f.read()
+        enc = self.db_manager.encrypt_pdf(pdf_bytes)
+        # order_id is UNIQUE; one statement whether the PDF is new or replaced
+        self.db_manager.execute_update(
+            "INSERT INTO manufacturing_orders (order_id, pdf_encrypted) VALUES (?, ?) "
+            "ON CONFLICT(order_id) DO UPDATE SET pdf_encrypted = excluded.pdf_encrypted",
+            (order_id, enc)
+        )
+        return pdf_path
     
     def clear_data(self):
         """Clear sensitive data"""
-        self.orders_table.setRowCount(0)
+        self.orders_model.set_orders([], [])
+        self._shown_orders = None
+        self._last_row_count = None
+        from .my_systems_window import clear_invoice_cache_dir
+        clear_invoice_cache_dir()
     
     def export_to_pdf(self):
         """Export selected or all filtered orders data to PDF"""
         try:
             # Gather selected order IDs (if any)
             selected_ids = set()
-            for item in self.orders_table.selectedItems():
-                if item.column() == 0:  # ID column
-                    try:
-                        selected_ids.add(int(item.text()))
-                    except Exception:
-                        pass
-            # If selection includes cells other than ID, map rows to IDs
-            if not selected_ids and self.orders_table.selectedItems():
-                rows = {it.row() for it in self.orders_table.selectedItems()}
-                for r in rows:
-                    id_item = self.orders_table.item(r, 0)
-                    if id_item:
-                        try:
-                            selected_ids.add(int(id_item.text()))
-                        except Exception:
-                            pass
+            for index in self.orders_table.selectionModel().selectedRows():
+                order_id = self.orders_model.order_id_at(index.row())
+                if order_id is not None:
+                    selected_ids.add(order_id)
 
             # Build DB query based on filters (and selection if present)
             date_from = self.date_from.date().toString("yyyy-MM-dd")
@@ -813,7 +731,7 @@ class OrdersWindow(QWidget):
                 "o.quantity, o.sequence_start, o.sequence_end, o.key_responsible "
                 "FROM orders o JOIN customers c ON o.customer_id = c.id "
                 "JOIN key_systems ks ON o.key_system_id = ks.id "
-                "WHERE date(o.order_date) BETWEEN ? AND ?"
+                "WHERE o.order_date >= ? AND o.order_date < date(?, '+1 day')"
             )
             params = [date_from, date_to]
 
@@ -867,15 +785,14 @@ class OrdersWindow(QWidget):
                 export_msg = f"Exporterar alla {len(orders_data)} synliga ordrar."
             
             # Generate PDF with orders list
-            pdf_generator = OrderPDFGenerator()
-            pdf_path = pdf_generator.generate_orders_list_pdf(
+            pdf_path = self._pdf_gen.generate_orders_list_pdf(
                 orders_data, 
                 self.get_filter_info(),
                 self.get_logo_path()
             )
             
             # Open PDF in browser
-            if pdf_generator.open_pdf_in_browser(pdf_path):
+            if self._pdf_gen.open_pdf_in_browser(pdf_path):
                 QMessageBox.information(
                     self, 
                     "Export lyckades", 
@@ -905,10 +822,10 @@ class OrdersWindow(QWidget):
         }
     
     def get_logo_path(self):
-        """Get logo path for PDF using GLOBAL standard"""
+        """Get logo path for PDF using GLOBAL standard ('' = no logo, so generators skip the lookup)"""
         from ..core.logo_manager import LogoManager
         logo_path = LogoManager.get_logo_path()
-        return logo_path if os.path.exists(logo_path) else None
+        return logo_path if os.path.exists(logo_path) else ''
 
     def update_ui_text(self):
         """Update UI text for current language"""
@@ -144,6 +144,9 @@ class KeyBuddyGroupBox(QGroupBox):
         super().__init__(title, parent)
         self.setProperty("kb_group", "standard")
 
+# Genererade stylesheets per temanamn, delas mellan alla ThemeManager-instanser
+_stylesheet_cache: Dict[str, str] = {}
+
 class ThemeManager:
     """Förbättrad temahanterare med utökade stilar"""
     
@@ -571,11 +574,19 @@ class ThemeManager:
         }
     
     def get_stylesheet(self, theme_name: str = None) -> str:
-        """Generera komplett stylesheet för tema"""
+        """Generera komplett stylesheet för tema (cachat per temanamn)"""
         if theme_name:
             self.current_theme = theme_name
         
-        theme = self.themes.get(self.current_theme, self.themes["light"])
+        stylesheet = _stylesheet_cache.get(self.current_theme)
+        if stylesheet is None:
+            stylesheet = self._build_stylesheet(self.current_theme)
+            _stylesheet_cache[self.current_theme] = stylesheet
+        return stylesheet
+    
+    def _build_stylesheet(self, theme_name: str) -> str:
+        """Bygg stylesheet-strängen för ett tema"""
+        theme = self.themes.get(theme_name, self.themes["light"])
         
         return f"""
         /* === GLOBALA INSTÄLLNINGAR === */